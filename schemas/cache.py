@@ -0,0 +1,176 @@
+"""
+Persistent content-hash cache for skill and MCP tool validation results.
+
+Stored as JSON in .cache/validation-cache.json. Each entry is keyed by kind ("skill", "mcp"
+or "mcp-deep") and the SHA-256 of the file's bytes, and holds the JSON-serializable result
+of validating that content (parse_skill_md output and iter_errors messages). A per-path
+(mtime_ns, size, sha256) record lets a warm run skip hashing: an unchanged file costs one
+stat.
+
+The whole cache is dropped when its fingerprint changes. The fingerprint covers both
+schema files, the parser/validator modules (including compiled_validator.py), the shared
+extraction behind skill and spec entries (extract.py and its scanner, mmap_scan.py), and
+the installed jsonschema version.
+Entries are evicted least-recently-used first once MAX_ENTRIES is exceeded.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterator
+
+from parallel import parallel_imap
+from profiling import count, phase
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+CACHE_DIR = REPO_ROOT / ".cache"
+CACHE_PATH = CACHE_DIR / "validation-cache.json"
+MAX_ENTRIES = 50_000
+
+# Inputs whose change invalidates every cached result
+FINGERPRINT_FILES = [
+    SCHEMAS_DIR / "skill.schema.json",
+    SCHEMAS_DIR / "mcp-tool.schema.json",
+    SCHEMAS_DIR / "skill_parser.py",
+    SCHEMAS_DIR / "locations.py",
+    SCHEMAS_DIR / "engine.py",
+    SCHEMAS_DIR / "compiled_validator.py",
+    SCHEMAS_DIR / "deep_schema.py",
+    SCHEMAS_DIR / "extract.py",
+    SCHEMAS_DIR / "mmap_scan.py",  # extract()'s ref/link scanner, behind skill and spec entries
+    SCHEMAS_DIR / "spec_index.py",
+    REPO_ROOT / "specs" / "TEMPLATE.md",
+    SCHEMAS_DIR / "validate_mcps.py",
+    SCHEMAS_DIR / "cache.py",
+]
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def fingerprint() -> str:
+    """Hash of everything that determines a validation result besides the file itself."""
+    h = hashlib.sha256()
+    for p in FINGERPRINT_FILES:
+        h.update(p.name.encode())
+        h.update(p.read_bytes() if p.exists() else b"")
+    # Imported here: importlib.metadata is slow to import and only needed for a cache
+    from importlib import metadata
+
+    try:
+        h.update(metadata.version("jsonschema").encode())
+    except metadata.PackageNotFoundError:
+        pass
+    return h.hexdigest()
+
+
+class ValidationCache:
+    """On-disk LRU cache of validation results keyed by content hash."""
+
+    def __init__(self, path: Path = CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.fingerprint = fingerprint()
+        # "<kind>:<sha256>" -> result; insertion order is LRU order (oldest first)
+        self.entries: dict[str, dict] = {}
+        # path -> [mtime_ns, size, sha256]
+        self.files: dict[str, list] = {}
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("fingerprint") != self.fingerprint:
+            return
+        self.entries = data.get("entries", {})
+        self.files = data.get("files", {})
+
+    def _digest(self, path: Path) -> str | None:
+        """Return the content hash for path, reusing the recorded one if stat is unchanged."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = str(path)
+        rec = self.files.get(key)
+        if rec and rec[0] == st.st_mtime_ns and rec[1] == st.st_size:
+            return rec[2]
+        try:
+            digest = file_sha256(path)
+        except OSError:
+            return None
+        self.files[key] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def get(self, kind: str, path: Path) -> dict | None:
+        digest = self._digest(path)
+        if digest is None:
+            return None
+        key = f"{kind}:{digest}"
+        value = self.entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries[key] = value  # move to most-recently-used
+        self.hits += 1
+        return value
+
+    def put(self, kind: str, path: Path, value: dict) -> None:
+        rec = self.files.get(str(path))
+        if rec is None:
+            return
+        key = f"{kind}:{rec[2]}"
+        self.entries.pop(key, None)
+        self.entries[key] = value
+
+    def save(self) -> None:
+        """Evict down to max_entries (LRU first) and write the cache atomically (skipped if it cannot be written)."""
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            for key in list(self.entries)[:excess]:
+                del self.entries[key]
+        live = {key.split(":", 1)[1] for key in self.entries}
+        self.files = {p: rec for p, rec in self.files.items() if rec[2] in live}
+        data = {"fingerprint": self.fingerprint, "entries": self.entries, "files": self.files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # read-only checkout or full disk: the cache is only a speed-up
+
+
+def cached_imap(
+    cache: ValidationCache | None,
+    kind: str,
+    func: Callable[[Path], dict],
+    paths: list[Path],
+    jobs: int = 1,
+) -> Iterator[dict]:
+    """Yield func(p) for each p in paths, in order, serving unchanged files from cache.
+
+    Only cache misses are computed (across `jobs` processes); their results are stored back
+    as they arrive.
+    """
+    if cache is None:
+        yield from parallel_imap(func, paths, jobs)
+        return
+    with phase("cache-lookup"):
+        values: list[dict | None] = [cache.get(kind, p) for p in paths]
+    misses = values.count(None)
+    count(f"{kind}-cache-miss", misses)
+    count(f"{kind}-cache-hit", len(values) - misses)
+    computed = parallel_imap(func, [p for p, v in zip(paths, values) if v is None], jobs)
+    for p, value in zip(paths, values):
+        if value is None:
+            value = next(computed)
+            cache.put(kind, p, value)
+        yield value
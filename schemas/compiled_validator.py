@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Precompiled validators for skill.schema.json and mcp-tool.schema.json.
+
+compile_validator(schema) walks a Draft 7 schema once and generates a specialized Python
+function for it (generate() returns the source): nested isinstance checks, dict lookups
+and comparisons with every constant and message precomputed, and error paths built only
+when an error occurs. Validating a document then skips jsonschema's per-keyword dispatch,
+error objects and iterator chains. iter_errors() yields errors with the same message,
+json_path and absolute_path as Draft7Validator.iter_errors, in the same order.
+
+Only the keywords our schemas use are compiled (type, required, properties,
+additionalProperties: bool, items: schema, const: string, min/maxLength, min/maxItems,
+minimum/maximum, pattern); annotations such as description are ignored, as jsonschema
+does. A schema using anything else (e.g. $ref, anyOf, patternProperties) gets a plain
+Draft7Validator instead, as does every schema when VALIDATOR_NO_COMPILE is set.
+jsonschema is imported only for that fallback (and by --verify / --bench), so compiling
+a supported schema does not pay for the jsonschema import.
+
+Usage: python schemas/compiled_validator.py --verify [--mutations N]
+       python schemas/compiled_validator.py --bench [--repeat N]
+       python schemas/compiled_validator.py --source skill|mcp
+
+--verify is the differential check against jsonschema: every skills/*/SKILL.md (parsed)
+and mcps/**/*.json, plus up to N (default 200) mutations of each (missing keys, wrong
+types, empty values, extra keys, bad array items), must give identical
+(json_path, message) lists from both validators, as must minLength/maxLength/minItems/
+maxItems at bounds 0, 1 and 2 (their messages follow jsonschema >= 4.21, the minimum in
+requirements.txt). Exit 1 on any mismatch.
+--bench times both validators over the same documents; --source prints generated code.
+"""
+
+import json
+import numbers
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, TypeAlias
+
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+SKILL_SCHEMA_PATH = SCHEMAS_DIR / "skill.schema.json"
+MCP_TOOL_SCHEMA_PATH = SCHEMAS_DIR / "mcp-tool.schema.json"
+DISABLE_ENV = "VALIDATOR_NO_COMPILE"
+
+# Keywords Draft7Validator validates (its VALIDATORS); any other key is an annotation.
+# Spelled out so compiling needs no jsonschema import; --verify checks it is current.
+DRAFT7_KEYWORDS = frozenset({
+    "$ref", "additionalItems", "additionalProperties", "allOf", "anyOf", "const", "contains",
+    "dependencies", "enum", "exclusiveMaximum", "exclusiveMinimum", "format", "if", "items",
+    "maxItems", "maxLength", "maxProperties", "maximum", "minItems", "minLength",
+    "minProperties", "minimum", "multipleOf", "not", "oneOf", "pattern", "patternProperties",
+    "properties", "propertyNames", "required", "type", "uniqueItems",
+})
+
+# Same rule as jsonschema.exceptions for rendering property names in json_path
+JSON_PATH_PROPERTY_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
+
+# Generated expression that is true when the instance in `v` has the JSON type
+TYPE_TESTS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    # Draft 6+: bools are not integers, floats with no fractional part are
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool) or isinstance({v}, float) and {v}.is_integer())",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+}
+
+
+class Unsupported(Exception):
+    """The schema uses a keyword (or keyword form) this module does not compile."""
+
+
+def _extras_message(instance: dict, known: frozenset) -> str:
+    extras = sorted((k for k in instance if k not in known), key=str)
+    verb = "was" if len(extras) == 1 else "were"
+    return f"Additional properties are not allowed ({', '.join(repr(k) for k in extras)} {verb} unexpected)"
+
+
+def _indent(lines: list[str]) -> list[str]:
+    return ["    " + line for line in lines]
+
+
+class _Codegen:
+    """Emits the body of validate(v0, out) for a schema; constants go into self.names.
+
+    Each keyword emitter returns source lines for one keyword applied to the instance held
+    in variable `v`, whose absolute path is the tuple expression `path`. Errors are appended
+    to `out` as (path tuple, message); paths are only materialized when an error occurs.
+    """
+
+    def __init__(self):
+        self.names: dict[str, object] = {"_Number": numbers.Number, "_extras_message": _extras_message}
+        self.vars = 0
+
+    def const(self, value) -> str:
+        name = f"_k{len(self.names)}"
+        self.names[name] = value
+        return name
+
+    def var(self, prefix: str = "v") -> str:
+        self.vars += 1
+        return f"{prefix}{self.vars}"
+
+    @staticmethod
+    def path_expr(parts: list[str]) -> str:
+        return "(" + ", ".join(parts) + ("," if len(parts) == 1 else "") + ")"
+
+    def error(self, parts: list[str], message_expr: str) -> str:
+        return f"out.append(({self.path_expr(parts)}, {message_expr}))"
+
+    def schema(self, schema, v: str, parts: list[str]) -> list[str]:
+        """Lines validating v against schema; keywords run in schema order, like Draft7Validator."""
+        if schema is True:
+            return []
+        if schema is False:
+            return [self.error(parts, f'"False schema does not allow " + repr({v})')]
+        if not isinstance(schema, dict) or "$ref" in schema:
+            raise Unsupported("$ref or non-object schema")
+        lines: list[str] = []
+        for keyword, value in schema.items():
+            if keyword not in DRAFT7_KEYWORDS:
+                continue  # annotation (description, title, $id, ...): jsonschema ignores it too
+            emit = getattr(self, f"kw_{keyword}", None)
+            if emit is None:
+                raise Unsupported(keyword)
+            lines.extend(emit(value, schema, v, parts))
+        return lines
+
+    def kw_type(self, types, schema, v, parts):
+        types = [types] if isinstance(types, str) else list(types)
+        if any(t not in TYPE_TESTS for t in types):
+            raise Unsupported(f"type {types!r}")
+        test = " or ".join(TYPE_TESTS[t].format(v=v) for t in types)
+        suffix = self.const(" is not of type " + ", ".join(repr(t) for t in types))
+        return [f"if not ({test}):", "    " + self.error(parts, f"repr({v}) + {suffix}")]
+
+    def kw_required(self, required, schema, v, parts):
+        body = []
+        for name in required:
+            body.append(f"if {self.const(name)} not in {v}:")
+            body.append("    " + self.error(parts, self.const(f"{name!r} is a required property")))
+        return [f"if isinstance({v}, dict):", *_indent(body)] if body else []
+
+    def kw_properties(self, properties, schema, v, parts):
+        body = []
+        for name, subschema in properties.items():
+            w = self.var()
+            sub = self.schema(subschema, w, parts + [repr(name)])
+            if sub:
+                key = self.const(name)
+                body += [f"if {key} in {v}:", f"    {w} = {v}[{key}]", *_indent(sub)]
+        return [f"if isinstance({v}, dict):", *_indent(body)] if body else []
+
+    def kw_additionalProperties(self, allowed, schema, v, parts):
+        if "patternProperties" in schema or not isinstance(allowed, bool):
+            raise Unsupported("additionalProperties with a schema or patternProperties")
+        if allowed:
+            return []
+        known = self.const(frozenset(schema.get("properties", {})))
+        return [
+            f"if isinstance({v}, dict) and not {known}.issuperset({v}):",
+            "    " + self.error(parts, f"_extras_message({v}, {known})"),
+        ]
+
+    def kw_items(self, items, schema, v, parts):
+        if isinstance(items, list):
+            raise Unsupported("tuple-form items")
+        index, w = self.var("n"), self.var()
+        sub = self.schema(items, w, parts + [index])
+        if not sub:
+            return []
+        return [f"if isinstance({v}, list):", f"    for {index}, {w} in enumerate({v}):", *_indent(_indent(sub))]
+
+    def kw_const(self, const, schema, v, parts):
+        if not isinstance(const, str):
+            raise Unsupported("non-string const")
+        return [f"if {v} != {self.const(const)}:", "    " + self.error(parts, self.const(f"{const!r} was expected"))]
+
+    def _bound(self, v, parts, kind: str, test: str, message: str):
+        return [
+            f"if {TYPE_TESTS[kind].format(v=v)} and {test}:",
+            "    " + self.error(parts, f"repr({v}) + {self.const(message)}"),
+        ]
+
+    def kw_minLength(self, n, schema, v, parts):
+        return self._bound(v, parts, "string", f"len({v}) < {n!r}", " should be non-empty" if n == 1 else " is too short")
+
+    def kw_maxLength(self, n, schema, v, parts):
+        return self._bound(v, parts, "string", f"len({v}) > {n!r}", " is expected to be empty" if n == 0 else " is too long")
+
+    def kw_minItems(self, n, schema, v, parts):
+        return self._bound(v, parts, "array", f"len({v}) < {n!r}", " should be non-empty" if n == 1 else " is too short")
+
+    def kw_maxItems(self, n, schema, v, parts):
+        return self._bound(v, parts, "array", f"len({v}) > {n!r}", " is expected to be empty" if n == 0 else " is too long")
+
+    def kw_minimum(self, n, schema, v, parts):
+        return self._bound(v, parts, "number", f"{v} < {self.const(n)}", f" is less than the minimum of {n!r}")
+
+    def kw_maximum(self, n, schema, v, parts):
+        return self._bound(v, parts, "number", f"{v} > {self.const(n)}", f" is greater than the maximum of {n!r}")
+
+    def kw_pattern(self, pattern, schema, v, parts):
+        regex = self.const(re.compile(pattern))
+        return self._bound(v, parts, "string", f"not {regex}.search({v})", f" does not match {pattern!r}")
+
+
+def generate(schema) -> tuple[str, dict[str, object]]:
+    """Python source of validate(v0, out) for schema, and the constants it refers to."""
+    gen = _Codegen()
+    body = gen.schema(schema, "v0", []) or ["pass"]
+    return "\n".join(["def validate(v0, out):", *_indent(body)]) + "\n", gen.names
+
+
+def format_json_path(parts) -> str:
+    """Render an absolute path the way jsonschema's ValidationError.json_path does."""
+    path = "$"
+    for elem in parts:
+        if isinstance(elem, int):
+            path += f"[{elem}]"
+        elif JSON_PATH_PROPERTY_PATTERN.match(elem):
+            path += "." + elem
+        else:
+            path += "['" + elem.replace("\\", "\\\\").replace("'", r"\'") + "']"
+    return path
+
+
+class CompiledError:
+    """The parts of jsonschema.ValidationError that callers use: message, absolute_path, json_path."""
+
+    __slots__ = ("absolute_path", "message")
+
+    def __init__(self, absolute_path: tuple, message: str):
+        self.absolute_path = absolute_path
+        self.message = message
+
+    @property
+    def json_path(self) -> str:
+        return format_json_path(self.absolute_path)
+
+
+class CompiledValidator:
+    """Drop-in for Draft7Validator.iter_errors / is_valid backed by a generated function."""
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.source, names = generate(schema)
+        exec(compile(self.source, f"<compiled {schema.get('title', 'schema')}>", "exec"), names)
+        self._validate = names["validate"]
+
+    def iter_errors(self, instance) -> Iterator[CompiledError]:
+        out: list[tuple[tuple, str]] = []
+        self._validate(instance, out)
+        for path, message in out:
+            yield CompiledError(path, message)
+
+    def is_valid(self, instance) -> bool:
+        out: list = []
+        self._validate(instance, out)
+        return not out
+
+
+Validator: TypeAlias = "CompiledValidator | Draft7Validator"
+
+
+def compile_validator(schema: dict) -> Validator:
+    """Compiled validator for schema, or Draft7Validator if it uses uncompiled keywords.
+
+    The schema itself is not checked here; callers run Draft7Validator.check_schema first.
+    """
+    if not os.environ.get(DISABLE_ENV):
+        try:
+            return CompiledValidator(schema)
+        except Unsupported:
+            pass
+    from jsonschema import Draft7Validator
+
+    return Draft7Validator(schema)
+
+
+WRONG_VALUES = [None, True, 0, -1, 1.5, "", "x", "mcp_bad ref", [], [0], ["mcp_bad ref"], {}, {"k": 1}]
+
+
+def mutations(instance, limit: int) -> Iterator[object]:
+    """Deterministic broken variants of instance: per path, drop it, swap its value, add extras."""
+    produced = 0
+
+    def variants(node):
+        if isinstance(node, dict):
+            yield {**node, "unexpectedKey": 1}
+            yield {**node, "zExtra": 1, "aExtra": 2}
+            for key in node:
+                yield {k: v for k, v in node.items() if k != key}
+                for wrong in WRONG_VALUES:
+                    yield {**node, key: wrong}
+                for sub in variants(node[key]):
+                    yield {**node, key: sub}
+        elif isinstance(node, list):
+            yield node + ["mcp_bad ref", 0, -3, 2.0, True]
+            yield []
+            for i, item in enumerate(node):
+                for sub in variants(item):
+                    yield node[:i] + [sub] + node[i + 1 :]
+
+    for variant in variants(instance):
+        if produced >= limit:
+            return
+        produced += 1
+        yield variant
+
+
+def _documents() -> Iterator[tuple[str, Path, object]]:
+    """(schema name, file, instance) for every skill (parsed body) and MCP tool JSON."""
+    if str(SCHEMAS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCHEMAS_DIR))
+    from skill_parser import scan_file
+
+    for path in sorted((REPO_ROOT / "skills").glob("*/SKILL.md")):
+        yield "skill", path, scan_file(path).parsed()
+    for path in sorted((REPO_ROOT / "mcps").glob("**/*.json")):
+        try:
+            yield "mcp", path, json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+
+
+def _bound_cases() -> Iterator[tuple[dict, object]]:
+    """(schema, instance) for each length/size bound at 0, 1 and 2 around its edges, whose
+    messages depend on the bound (e.g. "should be non-empty" vs "is too short")."""
+    for keywords, make in (("minLength", "maxLength"), "a".__mul__), (("minItems", "maxItems"), [0].__mul__):
+        for keyword in keywords:
+            for n in (0, 1, 2):
+                for size in range(4):
+                    yield {keyword: n}, make(size)
+
+
+def _schemas() -> dict[str, dict]:
+    return {
+        "skill": json.loads(SKILL_SCHEMA_PATH.read_text(encoding="utf-8")),
+        "mcp": json.loads(MCP_TOOL_SCHEMA_PATH.read_text(encoding="utf-8")),
+    }
+
+
+def _errors(validator, instance) -> list[tuple[str, str, list]]:
+    return [(e.json_path, e.message, list(e.absolute_path)) for e in validator.iter_errors(instance)]
+
+
+def verify(limit: int) -> int:
+    from jsonschema import Draft7Validator
+
+    if DRAFT7_KEYWORDS != set(Draft7Validator.VALIDATORS):
+        print(f"DRAFT7_KEYWORDS is out of date; Draft7Validator has {sorted(Draft7Validator.VALIDATORS)}", file=sys.stderr)
+        return 1
+    schemas = _schemas()
+    compiled = {name: CompiledValidator(s) for name, s in schemas.items()}
+    reference = {name: Draft7Validator(s) for name, s in schemas.items()}
+    checked = mismatches = 0
+    for name, path, doc in _documents():
+        for instance in [doc, *WRONG_VALUES, *mutations(doc, limit)]:
+            checked += 1
+            want, got = _errors(reference[name], instance), _errors(compiled[name], instance)
+            if want != got:
+                mismatches += 1
+                if mismatches <= 10:
+                    rel = path.relative_to(REPO_ROOT)
+                    print(f"Mismatch in {rel} ({name}):\n  jsonschema: {want}\n  compiled:   {got}", file=sys.stderr)
+    for schema, instance in _bound_cases():
+        checked += 1
+        want, got = _errors(Draft7Validator(schema), instance), _errors(CompiledValidator(schema), instance)
+        if want != got:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"Mismatch for {schema} on {instance!r}:\n  jsonschema: {want}\n  compiled:   {got}", file=sys.stderr)
+    if mismatches:
+        print(f"Differential check failed: {mismatches} of {checked} document(s) differ", file=sys.stderr)
+        return 1
+    print(f"OK: compiled validators match jsonschema on {checked} document(s)")
+    return 0
+
+
+def bench(repeat: int) -> int:
+    from jsonschema import Draft7Validator
+
+    schemas = _schemas()
+    docs = list(_documents())
+    for label, make in (("jsonschema", Draft7Validator), ("compiled", CompiledValidator)):
+        validators = {name: make(s) for name, s in schemas.items()}
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for name, _, doc in docs:
+                for _ in validators[name].iter_errors(doc):
+                    pass
+            best = min(best, time.perf_counter() - start)
+        per_doc = best / len(docs) * 1e6 if docs else 0.0
+        print(f"{label:<11} {best * 1000:9.2f} ms for {len(docs)} document(s)  ({per_doc:.1f} us/doc)")
+    return 0
+
+
+def main() -> None:
+    args = sys.argv[1:]
+
+    def option(flag: str, default: int) -> int:
+        if flag not in args:
+            return default
+        i = args.index(flag)
+        try:
+            return int(args[i + 1])
+        except (IndexError, ValueError):
+            raise SystemExit(f"{flag} expects an integer")
+
+    if "--verify" in args:
+        sys.exit(verify(option("--mutations", 200)))
+    if "--bench" in args:
+        sys.exit(bench(option("--repeat", 5)))
+    if "--source" in args:
+        i = args.index("--source")
+        name = args[i + 1] if i + 1 < len(args) else ""
+        if name not in ("skill", "mcp"):
+            raise SystemExit("--source expects skill or mcp")
+        print(generate(_schemas()[name])[0], end="")
+        sys.exit(0)
+    print(__doc__.strip(), file=sys.stderr)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
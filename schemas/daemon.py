@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Optional validation daemon: keeps validators and indexes warm for instant pre-commit checks.
+
+Usage: python schemas/daemon.py start [--watch] [--interval SECONDS]
+       python schemas/daemon.py status
+       python schemas/daemon.py stop
+
+start serves requests on a Unix socket (.cache/validator.sock) in the foreground. It keeps
+the compiled Draft7Validators, the MCP registry, an in-memory ValidationCache and the link
+checker's LinkTargetIndex for the life of the process, so a check costs one socket round
+trip instead of an interpreter start, the jsonschema import, schema compilation and a walk
+of the repo. Before each link check the index is re-synced with the watched files (and
+top-level *.md/*.json) that changed since the last one; other link targets are as of start.
+
+validate_changed.py and scripts/check_links.py call request() first and fall back to
+running in-process when no daemon answers (no socket, connection refused, Windows, or
+VALIDATOR_NO_DAEMON=1 in the environment). Output and exit codes are the same either way.
+
+--watch also polls skills/, mcps/, docs/ and specs/ every --interval seconds (default 1)
+and revalidates only the files that changed, printing failures to the daemon's stderr.
+
+The daemon stops itself, and clients fall back, when any schema or validator source file
+changes, so it never answers with stale code.
+
+This module only imports the standard library at the top, so clients stay fast.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+SOCKET_PATH = REPO_ROOT / ".cache" / "validator.sock"
+WATCH_DIRS = ["skills", "mcps", "docs", "specs"]
+WATCH_SUFFIXES = (".md", ".json")
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 120.0
+DISABLE_ENV = "VALIDATOR_NO_DAEMON"
+
+
+def socket_path() -> Path:
+    """SOCKET_PATH, or a per-repo path in the temp dir if it exceeds the AF_UNIX length limit."""
+    if len(os.fsencode(SOCKET_PATH)) < 100:
+        return SOCKET_PATH
+    digest = hashlib.sha256(os.fsencode(REPO_ROOT)).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"skills-validator-{digest}.sock"
+
+
+def code_fingerprint() -> list:
+    """(name, mtime_ns, size) of every file whose change makes a running daemon stale."""
+    files = sorted(SCHEMAS_DIR.glob("*.py")) + sorted(SCHEMAS_DIR.glob("*.json"))
+    files.append(SCRIPTS_DIR / "check_links.py")
+    files.append(REPO_ROOT / "specs" / "TEMPLATE.md")  # spec_index reads the rules from it once
+    out = []
+    for p in files:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        out.append([p.name, st.st_mtime_ns, st.st_size])
+    return out
+
+
+def _exchange(message: dict, timeout: float = REQUEST_TIMEOUT) -> dict | None:
+    """Send one JSON request and return the JSON reply, or None if no daemon answered."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(CONNECT_TIMEOUT)
+            s.connect(str(path))
+            s.settimeout(timeout)
+            s.sendall(json.dumps(message).encode() + b"\n")
+            chunks = []
+            while chunk := s.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    try:
+        reply = json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+    return reply if isinstance(reply, dict) else None
+
+
+def request(command: str, args: list[str]) -> int | None:
+    """Run command on the daemon, print its output, and return its exit code.
+
+    Returns None (nothing printed) when no up-to-date daemon is available, or when profiling
+    is requested (timings must come from the caller's process); the caller then runs the
+    check itself.
+    """
+    if os.environ.get(DISABLE_ENV) or any(a.startswith("--profile") for a in args):
+        return None
+    reply = _exchange({"command": command, "args": args, "cwd": os.getcwd()})
+    if reply is None or "exit" not in reply:
+        return None
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    return reply["exit"]
+
+
+def _snapshot() -> dict[str, tuple[int, int]]:
+    """repo-relative path -> (mtime_ns, size) for every watched file (and top-level README.md etc.)."""
+    snap = {}
+    with os.scandir(REPO_ROOT) as entries:
+        for entry in entries:
+            if entry.name.endswith(WATCH_SUFFIXES) and entry.is_file():
+                st = entry.stat()
+                snap[entry.name] = (st.st_mtime_ns, st.st_size)
+    for name in WATCH_DIRS:
+        for dirpath, _, filenames in os.walk(REPO_ROOT / name):
+            for fname in filenames:
+                if fname.endswith(WATCH_SUFFIXES):
+                    p = os.path.join(dirpath, fname)
+                    try:
+                        st = os.stat(p)
+                    except OSError:
+                        continue
+                    snap[os.path.relpath(p, REPO_ROOT)] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+def _changed(before: dict, after: dict) -> list[str]:
+    return sorted(p for p in before.keys() | after.keys() if before.get(p) != after.get(p))
+
+
+def serve(watch: bool = False, interval: float = 1.0) -> None:
+    """Run the daemon in the foreground until stopped."""
+    import contextlib
+    import io
+    import socketserver
+    import threading
+
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    import check_links
+    import validate_changed
+    from cache import ValidationCache
+    from engine import mcp_tool_validator, skill_validator
+    from link_index import LinkTargetIndex
+    from registry import get_registry
+
+    handlers = {
+        "validate_changed": lambda args: validate_changed.run(args, cache=cache),
+        "check_links": lambda args: check_links.run(args, index=link_index()),
+    }
+    cache = ValidationCache()
+    registry = get_registry()
+    links = LinkTargetIndex()
+    links_snap = _snapshot()
+    lock = threading.Lock()
+    stopped = threading.Event()
+    started_with = code_fingerprint()
+
+    # Warm everything a request needs before accepting connections
+    skill_validator()
+    mcp_tool_validator()
+    registry.refresh()
+
+    def link_index() -> LinkTargetIndex:
+        """The daemon's LinkTargetIndex, re-synced with the watched files changed since last use."""
+        nonlocal links_snap
+        new = _snapshot()
+        links.update(_changed(links_snap, new))
+        links_snap = new
+        return links
+
+    def handle(message: dict) -> dict:
+        command = message.get("command")
+        if command == "ping":
+            return {"pid": os.getpid(), "watch": watch}
+        if command == "stop":
+            stopped.set()
+            return {"stopped": True}
+        if command not in handlers:
+            return {"error": f"unknown command: {command}"}
+        if code_fingerprint() != started_with:
+            # Validator code changed on disk: let the client run it, and exit
+            stopped.set()
+            return {"stale": True}
+        out, err = io.StringIO(), io.StringIO()
+        prev_cwd = os.getcwd()
+        with lock, contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                os.chdir(message.get("cwd") or REPO_ROOT)
+                registry.refresh()
+                code = handlers[command]([str(a) for a in message.get("args", [])])
+            finally:
+                os.chdir(prev_cwd)
+        return {"exit": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                message = json.loads(self.rfile.readline())
+            except ValueError:
+                return
+            try:
+                reply = handle(message) if isinstance(message, dict) else {"error": "bad request"}
+            except Exception as e:  # report and keep serving; the client falls back
+                reply = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode())
+            if stopped.is_set():
+                threading.Thread(target=server.shutdown, daemon=True).start()
+
+    def watch_loop() -> None:
+        snap = _snapshot()
+        while not stopped.wait(interval):
+            new = _snapshot()
+            changed = _changed(snap, new)
+            snap = new
+            if not changed:
+                continue
+            skills = [p for p in changed if p.startswith("skills/") and p.endswith("/SKILL.md")]
+            mcps = [p for p in changed if p.startswith("mcps/") and p.endswith(".json")]
+            specs = [p for p in changed if p.startswith("specs/") and p.endswith("/spec.md")]
+            docs = [p for p in changed if p.endswith(".md") and (REPO_ROOT / p).exists()]
+            with lock, contextlib.redirect_stdout(sys.stderr):
+                print(f"[watch] {len(changed)} file(s) changed", file=sys.stderr)
+                registry.refresh()
+                if skills or mcps or specs:
+                    validate_changed.run(skills + mcps + specs, cache=cache)
+                if docs:
+                    check_links.run(docs, index=link_index())
+                cache.save()
+
+    path = socket_path()
+    if path.exists():
+        if _exchange({"command": "ping"}, timeout=CONNECT_TIMEOUT) is not None:
+            print(f"Daemon already running on {path}", file=sys.stderr)
+            sys.exit(1)
+        path.unlink()  # left over from a daemon that did not shut down cleanly
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    old_umask = os.umask(0o177)  # socket readable/writable by this user only
+    try:
+        server = socketserver.UnixStreamServer(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    if watch:
+        threading.Thread(target=watch_loop, daemon=True).start()
+    print(f"Validation daemon listening on {path} (pid {os.getpid()}{', watching' if watch else ''})")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stopped.set()
+        server.server_close()
+        with contextlib.suppress(OSError):
+            path.unlink()
+        cache.save()
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if not args or args[0] not in ("start", "status", "stop"):
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix sockets are not available on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    if args[0] == "start":
+        interval = 1.0
+        if "--interval" in args:
+            i = args.index("--interval")
+            try:
+                interval = float(args[i + 1])
+            except (IndexError, ValueError):
+                print("--interval requires a number of seconds", file=sys.stderr)
+                sys.exit(1)
+        # Allow importing sibling modules when run as script
+        if str(SCHEMAS_DIR) not in sys.path:
+            sys.path.insert(0, str(SCHEMAS_DIR))
+        serve(watch="--watch" in args, interval=interval)
+        return
+
+    reply = _exchange({"command": "ping" if args[0] == "status" else "stop"}, timeout=CONNECT_TIMEOUT)
+    if reply is None:
+        print("No validation daemon running")
+        sys.exit(1 if args[0] == "status" else 0)
+    if args[0] == "status":
+        print(f"Validation daemon running (pid {reply.get('pid')}{', watching' if reply.get('watch') else ''})")
+    else:
+        print("Validation daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Deep checks of MCP tool inputSchema / outputSchema bodies (--deep).
+
+mcp-tool.schema.json only requires inputSchema to be an object with type "object",
+properties and required. In deep mode, tool_issues() also validates inputSchema and
+outputSchema against the Draft 7 meta-schema (including the "regex" format of pattern
+keywords). It also checks that every name in a "required" list is declared in the
+sibling "properties".
+
+Schemas are checked one node at a time. Each node is meta-validated with its subschemas
+replaced by true, then each subschema is checked recursively. A node's results (for its
+whole subtree) are memoized by the SHA-256 of its canonical JSON. A property shape shared
+by many tools, such as owner or repo, is therefore validated once per process, however
+many tools use it.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator
+
+from compiled_validator import format_json_path
+from profiling import count
+
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
+
+# Draft 7 keywords whose value is a schema, a list of schemas, or a map of name -> schema
+SCHEMA_KEYWORDS = {"additionalItems", "additionalProperties", "contains", "propertyNames", "if", "then", "else", "not", "items"}
+SCHEMA_LIST_KEYWORDS = {"allOf", "anyOf", "oneOf", "items"}
+SCHEMA_MAP_KEYWORDS = {"properties", "patternProperties", "definitions", "dependencies"}
+
+# canonical hash -> [(path relative to the node, message), ...] for the node's whole subtree
+_memo: dict[str, list[tuple[tuple, str]]] = {}
+
+
+@lru_cache(maxsize=None)
+def meta_validator() -> "Draft7Validator":
+    from jsonschema import Draft7Validator
+
+    return Draft7Validator(Draft7Validator.META_SCHEMA, format_checker=Draft7Validator.FORMAT_CHECKER)
+
+
+def canonical_hash(schema) -> str:
+    return hashlib.sha256(json.dumps(schema, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _subschemas(node: dict) -> Iterator[tuple[tuple, dict]]:
+    """(path relative to node, subschema) for each object-valued subschema of node."""
+    for key, value in node.items():
+        if key in SCHEMA_KEYWORDS and isinstance(value, dict):
+            yield (key,), value
+        elif key in SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            for i, sub in enumerate(value):
+                if isinstance(sub, dict):
+                    yield (key, i), sub
+        elif key in SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            for name, sub in value.items():
+                if isinstance(sub, dict):
+                    yield (key, name), sub
+
+
+def _shallow(node: dict, subschemas: list[tuple[tuple, dict]]) -> dict:
+    """Copy of node with every subschema replaced by true (always meta-valid)."""
+    out = dict(node)
+    for path, _ in subschemas:
+        if len(path) == 1:
+            out[path[0]] = True
+        else:
+            key, inner = path
+            if out[key] is node[key]:
+                out[key] = list(node[key]) if isinstance(node[key], list) else dict(node[key])
+            out[key][inner] = True
+    return out
+
+
+def schema_issues(node) -> list[tuple[tuple, str]]:
+    """Problems in the schema node and its subschemas, as (path relative to node, message)."""
+    if not isinstance(node, dict):
+        return [((), e.message) for e in meta_validator().iter_errors(node)]
+    key = canonical_hash(node)
+    cached = _memo.get(key)
+    if cached is not None:
+        count("deep-memo-hit")
+        return cached
+    count("deep-memo-miss")
+    subschemas = list(_subschemas(node))
+    issues = [(tuple(e.absolute_path), e.message) for e in meta_validator().iter_errors(_shallow(node, subschemas))]
+    required, properties = node.get("required"), node.get("properties")
+    if isinstance(required, list) and isinstance(properties, dict):
+        for i, name in enumerate(required):
+            if isinstance(name, str) and name not in properties:
+                issues.append((("required", i), f"{name!r} is required but not defined in properties"))
+    for path, sub in subschemas:
+        issues.extend((path + sub_path, message) for sub_path, message in schema_issues(sub))
+    _memo[key] = issues
+    return issues
+
+
+def deep_tool_issues(tool) -> list[list]:
+    """[message, json_path] pairs (same shape as validate_mcps.tool_issues) for tool's input/output schemas."""
+    if not isinstance(tool, dict):
+        return []
+    issues = []
+    for field in ("inputSchema", "outputSchema"):
+        if field in tool:
+            for path, message in schema_issues(tool[field]):
+                json_path = format_json_path((field, *path))
+                issues.append([f"{json_path} {message}", json_path])
+    return issues
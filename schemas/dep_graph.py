@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Skill/doc/spec -> MCP tool dependency graph, persisted as .cache/dep-graph.json.
+
+Records, for every skills/*/SKILL.md (body), docs/**/*.md and specs/**/*.md, the distinct
+mcp_<server>_<tool> refs it contains, and keeps the reverse index ref -> referencing files.
+Files are rescanned only when their mtime or size changed (same rule as registry.py), so a
+warm load costs one stat per file. Refs are matched to mcps/<server>/tools/*.json through
+the registry; refs with no tool are kept as unresolved.
+
+Usage: python schemas/dep_graph.py --impacted FILE [FILE ...]
+       python schemas/dep_graph.py --dependents REF [REF ...]
+       python schemas/dep_graph.py --unused
+       python schemas/dep_graph.py --top [N]
+       python schemas/dep_graph.py --graph [json|dot]
+
+--impacted takes changed mcps/ tool JSON paths and prints the files that reference any
+tool they define (now or at HEAD), one per line, for revalidation or review.
+--unused lists tools no file references; --top lists the N (default 10) most-referenced
+tools; --graph prints the whole graph as JSON or Graphviz dot.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+GRAPH_PATH = REPO_ROOT / ".cache" / "dep-graph.json"
+FORMAT_VERSION = 1
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from extract import extract
+from registry import RACY_WINDOW_NS, get_registry
+
+
+def source_files() -> list[tuple[str, bool]]:
+    """Return (repo-relative path, strip_frontmatter) for every file whose refs are graphed."""
+    files = [(p, True) for p in sorted((REPO_ROOT / "skills").glob("*/SKILL.md"))]
+    for name in ("docs", "specs"):
+        files.extend((p, False) for p in sorted((REPO_ROOT / name).rglob("*.md")))
+    return [(p.relative_to(REPO_ROOT).as_posix(), strip_fm) for p, strip_fm in files]
+
+
+def scan_refs(path: Path, strip_fm: bool) -> list[str]:
+    """Distinct MCP refs in path, in order of first occurrence."""
+    return list(extract(path, frontmatter=strip_fm).refs)
+
+
+class DependencyGraph:
+    """Bipartite file -> refs graph with a reverse index. Use load_graph() for a fresh instance."""
+
+    def __init__(self, path: Path = GRAPH_PATH):
+        self.path = path
+        self.saved_ns = 0
+        # rel path -> {"mtime_ns", "size", "refs": [ref, ...]}
+        self.files: dict[str, dict] = {}
+        self._dirty = False
+        self._reverse: dict[str, list[str]] | None = None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == FORMAT_VERSION:
+            self.saved_ns = data.get("saved_ns", 0)
+            self.files = data.get("files", {})
+
+    def refresh(self) -> None:
+        """Rescan new and changed files, drop deleted ones, and save if anything changed."""
+        seen = set()
+        for rel, strip_fm in source_files():
+            seen.add(rel)
+            try:
+                st = os.stat(REPO_ROOT / rel)
+            except OSError:
+                continue
+            prev = self.files.get(rel)
+            if (
+                prev is not None
+                and prev["mtime_ns"] == st.st_mtime_ns
+                and prev["size"] == st.st_size
+                and st.st_mtime_ns < self.saved_ns - RACY_WINDOW_NS
+            ):
+                continue
+            try:
+                refs = scan_refs(REPO_ROOT / rel, strip_fm)
+            except (OSError, UnicodeDecodeError):
+                refs = []
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "refs": refs}
+            if entry != prev:
+                self.files[rel] = entry
+                self._dirty = True
+        for rel in [r for r in self.files if r not in seen]:
+            del self.files[rel]
+            self._dirty = True
+        if self._dirty:
+            self._reverse = None
+            self.save()
+
+    def save(self) -> None:
+        self.saved_ns = time.time_ns()
+        data = {"version": FORMAT_VERSION, "saved_ns": self.saved_ns, "files": self.files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # read-only checkout: the in-memory graph is still correct
+        self._dirty = False
+
+    def reverse(self) -> dict[str, list[str]]:
+        """ref -> sorted files referencing it."""
+        if self._reverse is None:
+            rev: dict[str, list[str]] = {}
+            for rel in sorted(self.files):
+                for ref in self.files[rel]["refs"]:
+                    rev.setdefault(ref, []).append(rel)
+            self._reverse = rev
+        return self._reverse
+
+    def refs_of(self, rel: str) -> list[str]:
+        entry = self.files.get(rel)
+        return entry["refs"] if entry else []
+
+    def dependents(self, refs) -> list[str]:
+        """Sorted files that reference any of refs."""
+        rev = self.reverse()
+        return sorted({rel for ref in refs for rel in rev.get(ref, ())})
+
+    def unused_tools(self) -> list[dict]:
+        """Registry tool records that no graphed file references."""
+        rev = self.reverse()
+        return [r for r in get_registry().tools() if r["ref"] not in rev]
+
+    def most_referenced(self, n: int = 10) -> list[tuple[str, int]]:
+        """(ref, number of referencing files) for the n most-referenced existing tools."""
+        valid = get_registry().refs()
+        counts = [(ref, len(files)) for ref, files in self.reverse().items() if ref in valid]
+        return sorted(counts, key=lambda rc: (-rc[1], rc[0]))[:n]
+
+    def export(self) -> dict:
+        """Whole graph: files -> refs, and tools (plus unresolved refs) -> path and files."""
+        registry = get_registry()
+        rev = self.reverse()
+        tools = {}
+        for record in registry.tools():
+            tools.setdefault(record["ref"], {"path": record["path"], "files": rev.get(record["ref"], [])})
+        unresolved = {ref: files for ref, files in sorted(rev.items()) if ref not in tools}
+        return {
+            "files": {rel: self.files[rel]["refs"] for rel in sorted(self.files)},
+            "tools": tools,
+            "unresolved": unresolved,
+        }
+
+
+def load_graph() -> DependencyGraph:
+    """Load the persisted graph and bring it up to date with the tree."""
+    graph = DependencyGraph()
+    graph.refresh()
+    return graph
+
+
+def to_dot(data: dict) -> str:
+    lines = ["digraph mcp_refs {", "  rankdir=LR;", "  node [shape=box];"]
+    for ref, tool in data["tools"].items():
+        lines.append(f'  "{ref}" [shape=ellipse, tooltip="{tool["path"]}"];')
+    for ref in data["unresolved"]:
+        lines.append(f'  "{ref}" [shape=ellipse, style=dashed];')
+    for rel, refs in data["files"].items():
+        for ref in refs:
+            lines.append(f'  "{rel}" -> "{ref}";')
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+    graph = load_graph()
+    flag, rest = args[0], args[1:]
+
+    if flag == "--impacted":
+        # Imported here: engine (jsonschema) is only needed to resolve old/new tool names
+        from engine import affected_tool_refs
+
+        paths = [Path(a) if Path(a).is_absolute() else REPO_ROOT / a for a in rest]
+        for rel in graph.dependents(affected_tool_refs(paths)):
+            print(rel)
+    elif flag == "--dependents":
+        for rel in graph.dependents(rest):
+            print(rel)
+    elif flag == "--unused":
+        for record in graph.unused_tools():
+            print(f"{record['ref']}  ({record['path']})")
+    elif flag == "--top":
+        n = int(rest[0]) if rest else 10
+        for ref, count in graph.most_referenced(n):
+            print(f"{count:>5}  {ref}")
+    elif flag == "--graph":
+        fmt = rest[0] if rest else "json"
+        if fmt not in ("json", "dot"):
+            print(f"Unknown graph format: {fmt} (use json or dot)", file=sys.stderr)
+            sys.exit(1)
+        data = graph.export()
+        print(json.dumps(data, indent=2) if fmt == "json" else to_dot(data))
+    else:
+        print(f"Unknown option: {flag}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Shared machine-readable diagnostics for every validator and checker.
+
+A Diagnostic is one finding: file, 1-based line/column (when known), rule id, JSON path
+(for schema errors), message, and suggestions. Entry points accept --format jsonl|sarif
+(parse_format) and write each finding through an emitter as soon as it is produced:
+
+- jsonl: one JSON object per line, flushed per finding.
+- sarif: a SARIF 2.1.0 log whose results array is written incrementally; close() ends it.
+
+Neither emitter keeps findings in memory. Without --format, entry points print their usual
+text. In structured mode stdout carries only the jsonl/SARIF stream.
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import TextIO
+
+FORMATS = ("jsonl", "sarif")
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+INFORMATION_URI = "https://github.com/fancy-bread/sdlc-workflow-skills"
+
+# rule id -> short description (SARIF reportingDescriptor)
+RULES = {
+    "skill-schema": "Skill body does not match schemas/skill.schema.json",
+    "mcp-schema": "MCP tool JSON does not match schemas/mcp-tool.schema.json",
+    "mcp-ref": "MCP ref does not resolve to a tool in mcps/",
+    "mcp-server-rename": "Invalid MCP refs whose tools exist under another server",
+    "broken-link": "Relative or absolute link target does not exist",
+    "broken-anchor": "Link fragment names no heading in the target file",
+    "invalid-url": "External URL is malformed",
+    "broken-external-link": "External URL does not return a 2xx status",
+    "spec-structure": "Spec does not follow specs/TEMPLATE.md",
+    "spec-pairing": "Skill and spec do not match (missing spec or name; MCP tools only the spec names are warnings)",
+    "install-layout": "skills/ layout or SKILL.md frontmatter breaks Agent Skills install",
+    "file-error": "File is missing or cannot be read",
+}
+
+
+@dataclass
+class Diagnostic:
+    """One finding. file is repo-relative where possible; line/col are 1-based."""
+
+    file: str
+    rule: str
+    message: str
+    line: int | None = None
+    col: int | None = None
+    json_path: str | None = None
+    suggestions: list[str] = field(default_factory=list)
+    level: str = "error"
+
+    def to_dict(self) -> dict:
+        return {
+            "file": self.file,
+            "line": self.line,
+            "col": self.col,
+            "rule": self.rule,
+            "level": self.level,
+            "json_path": self.json_path,
+            "message": self.message,
+            "suggestions": self.suggestions,
+        }
+
+    def to_sarif(self) -> dict:
+        text = self.message
+        if self.suggestions:
+            text += f" (did you mean: {', '.join(self.suggestions)}?)"
+        location: dict = {"artifactLocation": {"uri": self.file}}
+        if self.line is not None:
+            location["region"] = {"startLine": self.line}
+            if self.col is not None:
+                location["region"]["startColumn"] = self.col
+        result = {
+            "ruleId": self.rule,
+            "level": self.level,
+            "message": {"text": text},
+            "locations": [{"physicalLocation": location}],
+        }
+        props = {}
+        if self.json_path:
+            props["jsonPath"] = self.json_path
+        if self.suggestions:
+            props["suggestions"] = self.suggestions
+        if props:
+            result["properties"] = props
+        return result
+
+
+class JsonLinesEmitter:
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.count = 0
+
+    def emit(self, diag: Diagnostic) -> None:
+        self.stream.write(json.dumps(diag.to_dict()) + "\n")
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class SarifEmitter:
+    """Streams one SARIF run: header first, then each result, then the closing brackets."""
+
+    def __init__(self, stream: TextIO, tool: str):
+        self.stream = stream
+        self.count = 0
+        rules = [{"id": rid, "shortDescription": {"text": text}} for rid, text in RULES.items()]
+        driver = {"name": tool, "informationUri": INFORMATION_URI, "rules": rules}
+        head = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0", "runs": [{"tool": {"driver": driver}, "results": []}]})
+        # Split before the empty results array so results can be written one at a time
+        self._tail = head[head.rindex("[]") + 1 :]
+        stream.write(head[: head.rindex("[]") + 1])
+        stream.flush()
+
+    def emit(self, diag: Diagnostic) -> None:
+        self.stream.write(("," if self.count else "") + "\n" + json.dumps(diag.to_sarif()))
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.write(("\n" if self.count else "") + self._tail + "\n")
+        self.stream.flush()
+
+
+def parse_format(argv: list[str]) -> tuple[str | None, list[str]]:
+    """Pop --format jsonl|sarif (or --format=...) from argv. Returns (format or None, remaining args)."""
+    fmt = None
+    rest: list[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--format":
+            if i + 1 >= len(argv):
+                raise SystemExit("--format requires a value (jsonl or sarif)")
+            fmt = argv[i + 1]
+            i += 1
+        elif arg.startswith("--format="):
+            fmt = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+        i += 1
+    if fmt is not None and fmt not in FORMATS:
+        raise SystemExit(f"--format must be one of: {', '.join(FORMATS)}")
+    return fmt, rest
+
+
+def open_emitter(fmt: str, tool: str, stream: TextIO | None = None) -> JsonLinesEmitter | SarifEmitter:
+    stream = sys.stdout if stream is None else stream
+    return SarifEmitter(stream, tool) if fmt == "sarif" else JsonLinesEmitter(stream)
@@ -0,0 +1,492 @@
+"""
+In-process validation engine for skills, mcps, MCP refs and specs.
+
+validate.py, validate_all.py and validate_changed.py are thin wrappers around this module.
+Each schema is loaded and checked, and its validator compiled (compiled_validator.py), once per process; every
+skills/*/SKILL.md and mcps/**/*.json is then parsed and validated in the same interpreter
+instead of one subprocess per file.
+
+Each phase accepts jobs=N to split files across worker processes (see parallel.py) and
+an optional ValidationCache so unchanged files are not re-parsed (see cache.py).
+Results are returned as FileResult (one per file, errors without the path prefix) so
+callers decide how to print them.
+"""
+
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator
+
+from jsonschema import Draft7Validator
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+SKILL_SCHEMA_PATH = SCHEMAS_DIR / "skill.schema.json"
+MCP_TOOL_SCHEMA_PATH = SCHEMAS_DIR / "mcp-tool.schema.json"
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from cache import ValidationCache, cached_imap
+from compiled_validator import Validator, compile_validator
+from dep_graph import load_graph
+from diagnostics import Diagnostic
+from extract import extract
+from locations import format_location
+from profiling import phase
+from skill_parser import SkillDocument
+from spec_index import build_index, skill_path, spec_entry, spec_files, spec_path
+from validate_mcp_refs import find_invalid_refs, find_refs, format_invalid, iter_invalid_refs, ref_diagnostics, ref_files
+from validate_mcps import MCPS_ROOT, get_valid_refs, is_valid_ref, tool_files, tool_issues, tool_record
+
+
+@dataclass
+class Issue:
+    """One validation error. line/col are 1-based positions in the file, when known.
+
+    message is the display text (for schema errors it starts with json_path).
+    """
+
+    message: str
+    line: int | None = None
+    col: int | None = None
+    json_path: str | None = None
+    rule: str | None = None  # diagnostics rule id, when not implied by the file kind
+
+
+@dataclass
+class FileResult:
+    """Outcome of validating one file. path is relative to the repo root when possible."""
+
+    path: Path
+    kind: str  # "skill", "mcp" or "spec"
+    errors: list[Issue] = field(default_factory=list)
+    parsed: dict | None = None  # parse_skill_md output (skills only)
+    warnings: list[Issue] = field(default_factory=list)  # reported, but do not fail the file
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class Report:
+    """Outcome of a full run: per-file skill, mcp and spec results plus rendered invalid-ref lines."""
+
+    skills: list[FileResult] = field(default_factory=list)
+    mcps: list[FileResult] = field(default_factory=list)
+    refs: list[str] = field(default_factory=list)
+    specs: list[FileResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.refs and all(r.ok for r in self.skills + self.mcps + self.specs)
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema_path: Path) -> Validator:
+    """Load and check schema_path and build its compiled validator (cached for the life of the process)."""
+    with phase("validator-build", schema_path):
+        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        Draft7Validator.check_schema(schema)
+        return compile_validator(schema)
+
+
+def skill_validator() -> Validator:
+    return get_validator(SKILL_SCHEMA_PATH)
+
+
+def mcp_tool_validator() -> Validator:
+    return get_validator(MCP_TOOL_SCHEMA_PATH)
+
+
+def display_path(path: Path) -> Path:
+    """Return path relative to the repo root if it lies inside it, else path unchanged."""
+    try:
+        return path.resolve().relative_to(REPO_ROOT)
+    except ValueError:
+        return path
+
+
+def skill_files() -> list[Path]:
+    with phase("discover"):
+        return sorted(SKILLS_DIR.glob("*/SKILL.md"))
+
+
+# skill.schema.json property -> the ## section it is parsed from
+SECTION_FOR_PROPERTY = {
+    "overview": "Overview",
+    "definitions": "Definitions",
+    "prerequisites": "Prerequisites",
+    "steps": "Steps",
+    "tools": "Tools",
+    "guidance": "Guidance",
+}
+
+
+def _error_position(error, doc: SkillDocument) -> tuple[int, int] | tuple[None, None]:
+    """(line, col) a schema error points at: its section heading or MCP ref, if any."""
+    path = list(error.absolute_path)
+    if not path:
+        return None, None
+    if path[0] == "mcpRefs" and len(path) > 1:
+        return doc.mcp_refs[list(doc.mcp_refs)[path[1]]]
+    section = SECTION_FOR_PROPERTY.get(path[0])
+    return doc.section_positions.get(section, (None, None))
+
+
+def skill_entry(path: Path) -> dict:
+    """Parse (one streaming pass, frontmatter skipped) and validate one SKILL.md.
+
+    Returns {"parsed": ..., "errors": [[message, line, col, json_path], ...]}; JSON-serializable
+    so it can be cached. line/col are null when the error has no position (e.g. missing
+    section); json_path is null for read errors.
+    """
+    try:
+        with phase("skill-parse", path):
+            doc = extract(path, document=True).document
+            parsed = doc.parsed()
+    except (OSError, UnicodeDecodeError) as ex:
+        return {"parsed": None, "errors": [[str(ex), None, None, None]]}
+    errors = []
+    with phase("skill-schema", path):
+        for e in skill_validator().iter_errors(parsed):
+            line, col = _error_position(e, doc)
+            errors.append([f"{e.json_path}: {e.message}", line, col, e.json_path])
+    return {"parsed": parsed, "errors": errors}
+
+
+def mcp_tool_entry(path: Path, deep: bool = False) -> dict:
+    """Validate one mcps/<server>/tools/*.json against mcp-tool.schema.json (and, with deep,
+    its inputSchema/outputSchema against the meta-schema; see deep_schema.py).
+
+    Returns {"errors": [[message, json_path], ...]}.
+    """
+    return {"errors": tool_issues(path, mcp_tool_validator(), deep)}
+
+
+def mcp_tool_deep_entry(path: Path) -> dict:
+    return mcp_tool_entry(path, deep=True)
+
+
+def _skill_result(path: Path, entry: dict) -> FileResult:
+    issues = [Issue(message, line, col, json_path) for message, line, col, json_path in entry["errors"]]
+    return FileResult(display_path(path), "skill", issues, entry["parsed"])
+
+
+def _mcp_result(path: Path, entry: dict) -> FileResult:
+    issues = [Issue(message, json_path=json_path) for message, json_path in entry["errors"]]
+    return FileResult(display_path(path), "mcp", issues)
+
+
+def validate_skill(path: Path) -> FileResult:
+    return _skill_result(path, skill_entry(path))
+
+
+def validate_mcp_tool(path: Path) -> FileResult:
+    return _mcp_result(path, mcp_tool_entry(path))
+
+
+def iter_skills(
+    paths: list[Path] | None = None, jobs: int = 1, cache: ValidationCache | None = None
+) -> Iterator[FileResult]:
+    """Yield one FileResult per skill, in order, as each is validated (or served from cache)."""
+    paths = skill_files() if paths is None else paths
+    for p, e in zip(paths, cached_imap(cache, "skill", skill_entry, paths, jobs)):
+        yield _skill_result(p, e)
+
+
+def iter_mcp_tools(
+    paths: list[Path] | None = None, jobs: int = 1, cache: ValidationCache | None = None, deep: bool = False
+) -> Iterator[FileResult]:
+    """Yield one FileResult per tool JSON, in order, as each is validated (or served from cache)."""
+    paths = tool_files() if paths is None else paths
+    if deep:
+        entries = cached_imap(cache, "mcp-deep", mcp_tool_deep_entry, paths, jobs)
+    else:
+        entries = cached_imap(cache, "mcp", mcp_tool_entry, paths, jobs)
+    for p, e in zip(paths, entries):
+        yield _mcp_result(p, e)
+
+
+def validate_skills(
+    paths: list[Path] | None = None, jobs: int = 1, cache: ValidationCache | None = None
+) -> list[FileResult]:
+    return list(iter_skills(paths, jobs, cache))
+
+
+def validate_mcp_tools(
+    paths: list[Path] | None = None, jobs: int = 1, cache: ValidationCache | None = None, deep: bool = False
+) -> list[FileResult]:
+    return list(iter_mcp_tools(paths, jobs, cache, deep))
+
+
+def skill_refs(results: list[FileResult]) -> dict[str, list[str]]:
+    """Skill name -> mcpRefs for each skill result ([] if it did not parse; that is its own error)."""
+    return {r.path.parent.name: (r.parsed or {}).get("mcpRefs", []) for r in results}
+
+
+def validate_specs(
+    refs: dict[str, list[str]] | None = None,
+    names: list[str] | None = None,
+    jobs: int = 1,
+    cache: ValidationCache | None = None,
+) -> list[FileResult]:
+    """Validate specs against specs/TEMPLATE.md and join them with their skills (see spec_index.py).
+
+    names limits the run to those skill/spec names (default: every skill and spec). refs
+    maps skill name -> mcpRefs (see skill_refs); skills missing from it are scanned here.
+    Without names, refs (if given) must come from a run over every skill: its keys are
+    taken as the skill list. Each spec's structure result is cached like skills; the join
+    is rebuilt every time.
+    """
+    if names is None:
+        skills = set(refs) if refs is not None else {p.parent.name for p in skill_files()}
+        specs = {p.parent.name: p for p in spec_files()}
+        names = sorted(skills | set(specs))
+    else:
+        skills = {n for n in names if skill_path(n).is_file()}
+        specs = {n: spec_path(n) for n in names if spec_path(n).is_file()}
+    entries = dict(zip(specs, cached_imap(cache, "spec", spec_entry, list(specs.values()), jobs)))
+    refs = dict(refs or {})
+    for name in names:
+        if name in skills and name not in refs:
+            try:
+                refs[name] = list(extract(skill_path(name)).refs)
+            except (OSError, UnicodeDecodeError):
+                refs[name] = []
+    with phase("spec-join"):
+        rows = build_index(entries, {n: refs[n] for n in names if n in skills}, get_valid_refs(), names)
+    results = []
+    for row in rows:
+        readable = row["name"] in entries and entries[row["name"]]["spec"] is not None
+        issues = [Issue(m, line, col, rule="spec-structure" if readable else None) for m, line, col in row["errors"]]
+        issues += [Issue(m, line, col, rule="spec-pairing") for m, line, col in row["pairing"]]
+        warnings = [Issue(m, line, col, rule="spec-pairing") for m, line, col in row["warnings"]]
+        results.append(FileResult(Path(f"specs/{row['name']}/spec.md"), "spec", issues, warnings=warnings))
+    return results
+
+
+def result_diagnostics(result: FileResult) -> Iterator[Diagnostic]:
+    """Diagnostics for one FileResult (message without the json_path prefix); warnings come last."""
+    rule = "skill-schema" if result.kind == "skill" else "mcp-schema"
+    for issue, level in [(e, "error") for e in result.errors] + [(w, "warning") for w in result.warnings]:
+        message = issue.message
+        if issue.json_path and message.startswith(issue.json_path):
+            message = message[len(issue.json_path) :].lstrip(": ")
+        yield Diagnostic(
+            file=result.path.as_posix(),
+            rule=issue.rule or (rule if issue.json_path else "file-error"),
+            message=message,
+            line=issue.line,
+            col=issue.col,
+            json_path=issue.json_path,
+            level=level,
+        )
+
+
+def check_refs(jobs: int = 1) -> list[str]:
+    """Return rendered invalid-ref lines for skills and docs (empty if all refs resolve)."""
+    valid = get_valid_refs()
+    return format_invalid(find_invalid_refs(valid, jobs), valid)
+
+
+def _git(*args: str) -> str | None:
+    """Run a plain git command in the repo; return stdout, or None if git is unavailable or fails."""
+    try:
+        r = subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True)
+    except OSError:
+        return None
+    return r.stdout if r.returncode == 0 else None
+
+
+def staged_deleted_tools() -> list[Path]:
+    """Return mcps/ tool files deleted in the index (renames count as delete + add)."""
+    out = _git("diff", "--cached", "--name-only", "--no-renames", "--diff-filter=D", "--", "mcps")
+    return [REPO_ROOT / line for line in (out or "").splitlines() if line.endswith(".json")]
+
+
+def _head_tool_name(rel: Path, rev: str = "HEAD") -> str | None:
+    """Return the "name" of a tool JSON as committed at rev (default HEAD), or None."""
+    out = _git("show", f"{rev}:{rel.as_posix()}")
+    try:
+        data = json.loads(out) if out else None
+    except ValueError:
+        return None
+    return data.get("name") if isinstance(data, dict) else None
+
+
+def affected_tool_refs(paths: list[Path], rev: str = "HEAD") -> set[str]:
+    """Refs that changes to these mcps/<server>/tools/*.json files could have removed.
+
+    For each file: mcp_<server>_<stem>, its current name, and its name at rev (default HEAD).
+    """
+    refs: set[str] = set()
+    for p in paths:
+        try:
+            rel = p.resolve().relative_to(REPO_ROOT)
+        except ValueError:
+            continue
+        parts = rel.parts
+        if len(parts) < 4 or parts[0] != MCPS_ROOT.name or parts[2] != "tools":
+            continue
+        server = parts[1]
+        refs.add(f"mcp_{server}_{p.stem}")
+        if p.is_file():
+            record = tool_record(REPO_ROOT / rel)
+            if record is not None:
+                refs.add(record["ref"])
+        head_name = _head_tool_name(rel, rev)
+        if head_name:
+            refs.add(f"mcp_{server}_{head_name}")
+    return refs
+
+
+def _broken_tool_ref_hits(paths: list[Path], rev: str = "HEAD") -> list:
+    """Ref hits in skills/docs for tools changed or deleted in paths that no longer resolve.
+
+    Only the files the dependency graph lists as referencing a broken ref are scanned.
+    """
+    broken = {ref for ref in affected_tool_refs(paths, rev) if not is_valid_ref(ref)}
+    if not broken:
+        return []
+    dependents = set(load_graph().dependents(broken))
+    files = [(p, strip_fm) for p, strip_fm in ref_files() if p.relative_to(REPO_ROOT).as_posix() in dependents]
+    return find_refs(broken, files)
+
+
+def check_changed_tool_refs(paths: list[Path]) -> list[str]:
+    """Re-check only refs in skills/docs that point at tools changed or deleted in paths.
+
+    Returns rendered invalid-ref lines; reads all of mcps/ only to build suggestions on failure.
+    """
+    invalid = _broken_tool_ref_hits(paths)
+    return format_invalid(invalid, get_valid_refs()) if invalid else []
+
+
+def changed_since(rev: str) -> list[str] | None:
+    """Repo-relative paths changed (or deleted) between rev and the working tree, plus untracked files.
+
+    Returns None when git cannot answer (not a repo, unknown rev).
+    """
+    diff = _git("diff", "--name-only", "--no-renames", rev, "--")
+    untracked = _git("ls-files", "--others", "--exclude-standard")
+    if diff is None or untracked is None:
+        return None
+    return sorted(set(diff.splitlines()) | set(untracked.splitlines()))
+
+
+def needs_full_run(changed: list[str]) -> bool:
+    """True if a schema file, validator module or the spec template changed (every result may differ)."""
+    return any(
+        (rel.startswith("schemas/") and rel.endswith((".json", ".py"))) or rel == "specs/TEMPLATE.md" for rel in changed
+    )
+
+
+SKILL_OR_SPEC = {("skills", "SKILL.md"), ("specs", "spec.md")}
+
+
+@dataclass
+class ChangeSet:
+    """What a --since run validates: changed skills and existing tool JSONs, plus ref hits
+    and the names whose skill or spec changed."""
+
+    skills: list[Path]
+    tools: list[Path]
+    ref_hits: list  # RefHit tuples, one per (file, ref), in full-run order
+    valid: set[str]
+    spec_names: list[str] = field(default_factory=list)
+
+
+def changes_since(rev: str, jobs: int = 1) -> ChangeSet | None:
+    """Collect what changed since rev: changed skills and tool JSONs, invalid refs in changed
+    skills/docs, and refs anywhere to tools changed or deleted since rev.
+
+    Returns None when a full run is needed instead (git unavailable, or a schema or
+    validator module changed).
+    """
+    changed = changed_since(rev)
+    if changed is None or needs_full_run(changed):
+        return None
+    paths = [REPO_ROOT / rel for rel in changed]
+    skills = [p for p, rel in zip(paths, changed) if rel.startswith("skills/") and p.name == "SKILL.md" and p.is_file()]
+    tools = [p for p, rel in zip(paths, changed) if rel.startswith("mcps/") and p.suffix == ".json"]
+    # skills/<name>/SKILL.md or specs/<name>/spec.md, changed or deleted: re-join that name
+    parts = [rel.split("/") for rel in changed]
+    spec_names = sorted({p[1] for p in parts if len(p) == 3 and (p[0], p[2]) in SKILL_OR_SPEC})
+
+    changed_set = set(paths)
+    order = {p: i for i, (p, _) in enumerate(ref_files())}
+    valid = get_valid_refs()
+    hits = find_invalid_refs(valid, jobs, [(p, s) for p, s in ref_files() if p in changed_set])
+    hits += _broken_tool_ref_hits(tools, rev)
+    # One hit per (file, ref), in full-run order
+    unique = {(h[0], h[3]): h for h in hits}
+    invalid = sorted(unique.values(), key=lambda h: (order.get(h[0], len(order)), h[1], h[2]))
+    return ChangeSet(skills, [p for p in tools if p.is_file()], invalid, valid, spec_names)
+
+
+def run_since(rev: str, jobs: int = 1, cache: ValidationCache | None = None, deep: bool = False) -> Report | None:
+    """Validate only what changed since rev (see changes_since); None means run everything."""
+    changes = changes_since(rev, jobs)
+    if changes is None:
+        return None
+    skills = validate_skills(changes.skills, jobs=jobs, cache=cache)
+    return Report(
+        skills=skills,
+        mcps=validate_mcp_tools(changes.tools, jobs=jobs, cache=cache, deep=deep),
+        refs=format_invalid(changes.ref_hits, changes.valid) if changes.ref_hits else [],
+        specs=validate_specs(skill_refs(skills), changes.spec_names, jobs, cache),
+    )
+
+
+def iter_diagnostics(
+    jobs: int = 1, cache: ValidationCache | None = None, changes: ChangeSet | None = None, deep: bool = False
+) -> Iterator[Diagnostic]:
+    """Stream Diagnostics for every skill, tool JSON, MCP ref and spec (or just changes), as produced."""
+    refs: dict[str, list[str]] = {}
+    for result in iter_skills(changes.skills if changes else None, jobs, cache):
+        refs.update(skill_refs([result]))
+        yield from result_diagnostics(result)
+    for result in iter_mcp_tools(changes.tools if changes else None, jobs, cache, deep):
+        yield from result_diagnostics(result)
+    valid = changes.valid if changes else get_valid_refs()
+    yield from ref_diagnostics(changes.ref_hits if changes else iter_invalid_refs(valid, jobs), valid)
+    for result in validate_specs(refs, changes.spec_names if changes else None, jobs, cache):
+        yield from result_diagnostics(result)
+
+
+def run_all(jobs: int = 1, cache: ValidationCache | None = None, deep: bool = False) -> Report:
+    """Validate every skill, every MCP tool JSON, every MCP ref, and every spec.
+
+    jobs > 1 splits each phase across that many worker processes; results keep sorted order.
+    With a cache, unchanged skills, tool files and specs are served from it (caller saves it).
+    deep adds meta-schema checks of each tool's inputSchema/outputSchema. Specs are joined
+    with the skills' mcpRefs from this same run.
+    """
+    skills = validate_skills(jobs=jobs, cache=cache)
+    return Report(
+        skills=skills,
+        mcps=validate_mcp_tools(jobs=jobs, cache=cache, deep=deep),
+        refs=check_refs(jobs),
+        specs=validate_specs(skill_refs(skills), jobs=jobs, cache=cache),
+    )
+
+
+def print_failures(results: list[FileResult]) -> None:
+    """Print "  <path>[:line:col]: <error>" to stderr for each error in results."""
+    for r in results:
+        for e in r.errors:
+            print(f"  {format_location(r.path, e.line, e.col)}: {e.message}", file=sys.stderr)
+
+
+def print_warnings(results: list[FileResult]) -> None:
+    """Print "  <path>[:line:col]: warning: <message>" to stderr for each warning in results."""
+    for r in results:
+        for w in r.warnings:
+            print(f"  {format_location(r.path, w.line, w.col)}: warning: {w.message}", file=sys.stderr)
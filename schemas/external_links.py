@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Concurrent external (http/https) link checker, standard library only.
+
+Usage: python schemas/external_links.py URL [URL ...] [--no-cache]
+       python schemas/external_links.py --self-test
+       Or via scripts/check_links.py --external FILE ...
+
+check_urls() de-duplicates URLs (fragments removed) and checks each once with asyncio:
+- a bounded pool of WORKERS tasks pulls URLs from a queue;
+- connections are HTTP/1.1 keep-alive, pooled and reused per (scheme, host, port);
+- each host gets at most PER_HOST concurrent requests, started at least MIN_INTERVAL
+  seconds apart;
+- HEAD first, then GET when HEAD fails or returns an error (many servers reject HEAD);
+  redirects are followed (up to MAX_REDIRECTS) and one 429 is retried after Retry-After.
+
+A 2xx final status is OK. OK results are stored in .cache/external-links.json and reused
+for TTL_SECONDS, so repeated runs skip URLs that were already verified; failures are always
+re-checked. --self-test runs the checker against a local stub HTTP server (no network).
+"""
+
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+CACHE_PATH = REPO_ROOT / ".cache" / "external-links.json"
+
+WORKERS = 16
+PER_HOST = 2
+MIN_INTERVAL = 0.05
+TIMEOUT = 10.0
+TTL_SECONDS = 24 * 3600
+MAX_REDIRECTS = 5
+MAX_RETRY_AFTER = 10.0
+# Bodies larger than this are not drained; the connection is closed instead
+MAX_DRAIN_BYTES = 1 << 20
+USER_AGENT = "sdlc-workflow-skills-link-check/1.0"
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one URL. status is the final HTTP status, when one was received."""
+
+    url: str
+    ok: bool
+    status: int | None = None
+    error: str | None = None
+    cached: bool = False
+
+    def describe(self) -> str:
+        return self.error if self.error else f"HTTP {self.status}"
+
+
+class ExternalLinkCache:
+    """Persistent url -> {"status", "checked_at"} store of OK results, expiring after ttl seconds."""
+
+    def __init__(self, path: Path = CACHE_PATH, ttl: float = TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        self.entries: dict[str, dict] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self.entries = data
+
+    def get(self, url: str, now: float) -> LinkResult | None:
+        entry = self.entries.get(url)
+        if entry is None or entry.get("checked_at", 0) + self.ttl < now:
+            return None
+        return LinkResult(url, True, entry.get("status"), cached=True)
+
+    def put(self, result: LinkResult, now: float) -> None:
+        if result.ok and not result.cached:
+            self.entries[result.url] = {"status": result.status, "checked_at": now}
+
+    def save(self) -> None:
+        now = time.time()
+        live = {u: e for u, e in self.entries.items() if e.get("checked_at", 0) + self.ttl >= now}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(live, separators=(",", ":"), sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only checkout: results are just not reused
+
+
+class _HostPool:
+    """Idle keep-alive connections, a concurrency limit, and request pacing for one host."""
+
+    def __init__(self, per_host: int):
+        self.idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.slots = asyncio.Semaphore(per_host)
+        self.pace = asyncio.Lock()
+        self.next_start = 0.0
+
+
+class _Client:
+    """Minimal HTTP/1.1 client: status and headers only, bodies drained for connection reuse."""
+
+    def __init__(self, per_host: int, min_interval: float, timeout: float):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.pools: dict[tuple[str, str, int], _HostPool] = {}
+        self.ssl_context = ssl.create_default_context()
+
+    async def _connect(self, scheme: str, host: str, port: int):
+        ctx = self.ssl_context if scheme == "https" else None
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ctx, server_hostname=host if ctx else None),
+            self.timeout,
+        )
+
+    async def _wait_turn(self, pool: _HostPool) -> None:
+        async with pool.pace:
+            now = time.monotonic()
+            if pool.next_start > now:
+                await asyncio.sleep(pool.next_start - now)
+            pool.next_start = max(now, pool.next_start) + self.min_interval
+
+    async def request(self, method: str, url: str) -> tuple[int, dict[str, str]]:
+        """Send one request and return (status, lowercased headers)."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        key = (scheme, host, port)
+        pool = self.pools.setdefault(key, _HostPool(self.per_host))
+        head = (
+            f"{method} {target} HTTP/1.1\r\nHost: {parts.netloc.rpartition('@')[2]}\r\n"
+            f"User-Agent: {USER_AGENT}\r\nAccept: */*\r\nConnection: keep-alive\r\n\r\n"
+        ).encode("latin-1", "replace")
+        async with pool.slots:
+            await self._wait_turn(pool)
+            # A pooled connection may have been closed by the server; retry once on a new one
+            while True:
+                reused = bool(pool.idle)
+                reader, writer = pool.idle.pop() if reused else await self._connect(scheme, host, port)
+                try:
+                    writer.write(head)
+                    status, headers, keep = await asyncio.wait_for(self._read_response(reader, method), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError, EOFError) as e:
+                    writer.close()
+                    if reused:
+                        continue
+                    raise ConnectionError(str(e) or type(e).__name__) from e
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep:
+                    pool.idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, headers
+
+    async def _read_response(self, reader: asyncio.StreamReader, method: str) -> tuple[int, dict[str, str], bool]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise EOFError("connection closed")
+        version, _, rest = status_line.decode("latin-1").partition(" ")
+        try:
+            status = int(rest.split(" ", 1)[0])
+        except ValueError:
+            raise ConnectionError(f"bad status line: {status_line[:80]!r}") from None
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return status, headers, keep
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            drained = 0
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                drained += size
+                if drained > MAX_DRAIN_BYTES:
+                    return status, headers, False
+                await reader.readexactly(size + 2)
+            return status, headers, keep
+        length = headers.get("content-length")
+        if length is not None and length.isdigit() and int(length) <= MAX_DRAIN_BYTES:
+            await reader.readexactly(int(length))
+            return status, headers, keep
+        return status, headers, False
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            for _, writer in pool.idle:
+                writer.close()
+            pool.idle.clear()
+
+
+async def _check_one(client: _Client, url: str) -> LinkResult:
+    method = "HEAD"
+    current = url
+    redirects = 0
+    retried = False
+    while True:
+        try:
+            status, headers = await client.request(method, current)
+        except (OSError, asyncio.TimeoutError, ValueError) as e:
+            if method == "HEAD":
+                method = "GET"
+                continue
+            error = "timeout" if isinstance(e, asyncio.TimeoutError) else f"{type(e).__name__}: {e}"
+            return LinkResult(url, False, error=error)
+        if 300 <= status < 400 and "location" in headers:
+            redirects += 1
+            if redirects > MAX_REDIRECTS:
+                return LinkResult(url, False, status, error="too many redirects")
+            current = urljoin(current, headers["location"])
+            continue
+        if status == 429 and not retried:
+            retried = True
+            try:
+                delay = min(float(headers.get("retry-after", "1")), MAX_RETRY_AFTER)
+            except ValueError:
+                delay = 1.0
+            await asyncio.sleep(delay)
+            continue
+        if status >= 400 and method == "HEAD":
+            method = "GET"
+            continue
+        return LinkResult(url, 200 <= status < 300, status)
+
+
+async def _check_all(urls: list[str], workers: int, per_host: int, min_interval: float, timeout: float) -> list[LinkResult]:
+    client = _Client(per_host, min_interval, timeout)
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(len(urls)):
+        queue.put_nowait(i)
+    results: list[LinkResult | None] = [None] * len(urls)
+
+    async def worker() -> None:
+        while not queue.empty():
+            i = queue.get_nowait()
+            results[i] = await _check_one(client, urls[i])
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(workers, len(urls)))))
+    finally:
+        client.close()
+    return results
+
+
+def check_urls(
+    urls: Iterable[str],
+    cache: ExternalLinkCache | None = None,
+    workers: int = WORKERS,
+    per_host: int = PER_HOST,
+    min_interval: float = MIN_INTERVAL,
+    timeout: float = TIMEOUT,
+) -> dict[str, LinkResult]:
+    """Check each unique URL (fragment removed) once; return {url: LinkResult}.
+
+    OK results still fresh in cache are not re-fetched; new OK results are added to it
+    (the caller saves it).
+    """
+    unique = sorted({urldefrag(u)[0] for u in urls})
+    now = time.time()
+    results: dict[str, LinkResult] = {}
+    todo = []
+    for url in unique:
+        hit = cache.get(url, now) if cache is not None else None
+        if hit is not None:
+            results[url] = hit
+        else:
+            todo.append(url)
+    if todo:
+        for result in asyncio.run(_check_all(todo, workers, per_host, min_interval, timeout)):
+            results[result.url] = result
+            if cache is not None:
+                cache.put(result, now)
+    return results
+
+
+def self_test() -> int:
+    """Check a local stub server: status handling, HEAD->GET, redirects, de-dup, reuse, cache."""
+    import tempfile
+    import threading
+    from collections import Counter
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    hits: Counter[str] = Counter()
+    connections: list[int] = []
+
+    class Stub(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            super().setup()
+            connections.append(1)
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def _reply(self, status: int, body: bytes = b"", headers: dict | None = None, chunked: bool = False) -> None:
+            self.send_response(status)
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            if chunked:
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body))
+                return
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_HEAD(self) -> None:
+            self.do_GET()
+
+        def do_GET(self) -> None:
+            hits[f"{self.command} {self.path}"] += 1
+            if self.path == "/ok":
+                self._reply(200, b"ok")
+            elif self.path == "/no-head":
+                self._reply(405 if self.command == "HEAD" else 200, b"body")
+            elif self.path == "/chunked":
+                self._reply(405 if self.command == "HEAD" else 200, b"chunk body", chunked=True)
+            elif self.path == "/redirect":
+                self._reply(301, headers={"Location": "/ok"})
+            else:
+                self._reply(404, b"missing")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    urls = [f"{base}/ok", f"{base}/ok#frag", f"{base}/no-head", f"{base}/chunked", f"{base}/redirect", f"{base}/missing"]
+    failures = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ExternalLinkCache(Path(tmp) / "links.json")
+            results = check_urls(urls, cache, per_host=1, min_interval=0)
+            expected = {"/ok": True, "/no-head": True, "/chunked": True, "/redirect": True, "/missing": False}
+            for path, ok in expected.items():
+                r = results.get(base + path)
+                if r is None or r.ok != ok:
+                    failures.append(f"{path}: expected ok={ok}, got {r}")
+            if hits["HEAD /ok"] != 2:  # once for /ok, once after the /redirect hop
+                failures.append(f"/ok fetched {hits['HEAD /ok']} times, expected 2 (de-dup)")
+            if len(connections) != 1:
+                failures.append(f"{len(connections)} connections opened, expected 1 (keep-alive reuse)")
+            cache.save()
+            before = sum(hits.values())
+            again = check_urls(urls, ExternalLinkCache(Path(tmp) / "links.json"))
+            fetched = sum(hits.values()) - before
+            if fetched != 2 or not again[f"{base}/ok"].cached:  # only /missing (HEAD, GET) re-checked
+                failures.append(f"second run made {fetched} requests, expected 2 (TTL cache)")
+    finally:
+        server.shutdown()
+        server.server_close()
+    if failures:
+        print("Self-test failed:", file=sys.stderr)
+        for line in failures:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+    print("OK: external link checker self-test passed")
+    return 0
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if args == ["--self-test"]:
+        sys.exit(self_test())
+    urls = [a for a in args if not a.startswith("--")]
+    if not urls:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+    cache = None if "--no-cache" in args else ExternalLinkCache()
+    results = check_urls(urls, cache)
+    if cache is not None:
+        cache.save()
+    broken = [r for r in results.values() if not r.ok]
+    for r in results.values():
+        print(f"{'OK ' if r.ok else 'ERR'} {r.url} ({'cached' if r.cached else r.describe()})")
+    sys.exit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
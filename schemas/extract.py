@@ -0,0 +1,84 @@
+"""
+Unified extraction stage: scan each skill/doc file once and share the matches.
+
+Ref validation (validate_mcp_refs.py), the dependency graph (dep_graph.py), link checking
+(scripts/check_links.py) and skill validation (engine.py, which checks the Steps numbers)
+all read the same SKILL.md and docs files. Each of them calls extract() instead of scanning
+on its own. extract() runs one pass over the file and returns an Extract holding the typed
+matches every consumer needs:
+
+- refs: distinct MCP refs with the (line, col) of their first occurrence
+- links: (text, url, line, col) for every markdown link
+- document (only with document=True): the full SkillDocument, with sections and step numbers
+
+With document=True the file is parsed by the tokenizer (skill_parser.scan_file), which
+yields sections, step numbers, refs and links in the same pass. Otherwise a single combined
+regex runs over a memory map of the file (mmap_scan.iter_matches).
+
+Extracts are memoized per process by (path, frontmatter mode), and reused while the file's
+mtime and size are unchanged. Within one validate_all run, or across pre-commit requests
+served by the daemon, each file is therefore read and scanned once, however many consumers
+use it. The memo keeps refs and links, not documents. A file modified within
+registry.RACY_WINDOW_NS of the scan is not memoized, because its mtime may not change on
+the next write.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from mmap_scan import iter_matches
+from profiling import count
+from registry import RACY_WINDOW_NS
+from skill_parser import SkillDocument, scan_file
+
+# Bound on memoized files (oldest dropped first); far above any repo's file count
+MAX_ENTRIES = 50_000
+
+
+@dataclass
+class Extract:
+    # ref -> (line, col) of its first occurrence in the body, in order of first occurrence
+    refs: dict[str, tuple[int, int]]
+    links: list[tuple[str, str, int, int]]  # (text, url, line, col)
+    document: SkillDocument | None = None
+
+
+# (path, frontmatter) -> ((mtime_ns, size), Extract without document)
+_memo: dict[tuple[str, bool], tuple[tuple[int, int], Extract]] = {}
+
+
+def extract(path: Path, frontmatter: bool = True, document: bool = False) -> Extract:
+    """Refs and links in path (the body only when frontmatter=True), scanned once per process.
+
+    With document=True the SkillDocument is parsed as well (always a fresh scan). Raises
+    OSError / UnicodeDecodeError like the scanners.
+    """
+    key = (os.fspath(path), frontmatter)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    if not document:
+        cached = _memo.get(key)
+        if cached is not None and cached[0] == stamp:
+            count("extract-hit")
+            return cached[1]
+    count("extract-miss")
+    if document:
+        doc = scan_file(path, frontmatter)
+        result = Extract(doc.mcp_refs, doc.links, doc)
+    else:
+        refs: dict[str, tuple[int, int]] = {}
+        links: list[tuple[str, str, int, int]] = []
+        for kind, value, line, col in iter_matches(path, frontmatter):
+            if kind == "ref":
+                refs.setdefault(value, (line, col))
+            else:
+                links.append((*value, line, col))
+        result = Extract(refs, links)
+    if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+        if len(_memo) >= MAX_ENTRIES:
+            del _memo[next(iter(_memo))]
+        _memo.pop(key, None)
+        _memo[key] = (stamp, Extract(result.refs, result.links))
+    return result
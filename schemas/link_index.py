@@ -0,0 +1,160 @@
+"""
+Snapshot of every path in the repo, for resolving markdown link targets without a stat per link.
+
+LinkTargetIndex walks the repo once (skipping .git, .cache, virtualenvs, node_modules and
+__pycache__) and keeps the set of repo-relative file and directory paths. resolve() applies
+check_links.py's rules (the path itself, then the ".md" fallback) against that set; paths
+that leave the repo or fall in a skipped directory are checked on disk instead. update()
+re-syncs a list of changed paths, so a long-lived index (the daemon's) never walks again.
+
+anchors() returns the heading anchors of a markdown file, parsed once per file with the
+shared tokenizer: GitHub-style and MkDocs-style (toc) slugs of ATX headings outside code
+fences, with -1, -2, ... suffixes for repeats, plus explicit {#id} attributes and HTML
+id="..." / name="..." anchors.
+"""
+
+import os
+import re
+import sys
+import unicodedata
+from pathlib import Path
+from typing import Iterable
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from profiling import phase
+from skill_parser import iter_file_tokens
+
+SKIP_DIRS = {".git", ".cache", "venv", ".venv", "node_modules", "__pycache__", ".tox", ".nox"}
+HEADING_PATTERN = re.compile(r"^(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+ATTR_ID_PATTERN = re.compile(r"\s*\{[^}]*#([\w-]+)[^}]*\}\s*$")
+HTML_ANCHOR_PATTERN = re.compile(r"""<[^>]+\b(?:id|name)=["']([^"']+)["']""")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+INLINE_MARKUP_PATTERN = re.compile(r"!?\[([^\]]*)\]\([^)]*\)|<[^>]+>|[`*_]")
+
+
+def _github_slug(text: str) -> str:
+    """GitHub heading anchor: lowercase, drop punctuation, spaces become hyphens."""
+    text = INLINE_MARKUP_PATTERN.sub(lambda m: m.group(1) or "", text).strip().lower()
+    return re.sub(r"[^\w\- ]", "", text).replace(" ", "-")
+
+
+def _toc_slug(text: str) -> str:
+    """MkDocs (Python-Markdown toc) anchor: ASCII-fold, drop punctuation, collapse separators."""
+    text = INLINE_MARKUP_PATTERN.sub(lambda m: m.group(1) or "", text)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = re.sub(r"[^\w\s-]", "", text).strip().lower()
+    return re.sub(r"[-\s]+", "-", text)
+
+
+def heading_anchors(path: Path) -> set[str]:
+    """All anchors a link fragment may name in the markdown file at path."""
+    anchors: set[str] = set()
+    seen: dict[str, int] = {}
+    fence = None
+    for tok in iter_file_tokens(path):
+        if tok.kind == "heading":
+            line = f"## {tok.value}"
+        elif tok.kind == "text":
+            line = tok.value.rstrip("\n")
+        else:
+            continue
+        m = FENCE_PATTERN.match(line)
+        if m:
+            fence = None if fence == m.group(1) else fence or m.group(1)
+            continue
+        if fence:
+            continue
+        anchors.update(HTML_ANCHOR_PATTERN.findall(line))
+        m = HEADING_PATTERN.match(line)
+        if not m:
+            continue
+        title = m.group(2)
+        attr = ATTR_ID_PATTERN.search(title)
+        if attr:
+            anchors.add(attr.group(1))
+            title = title[: attr.start()]
+        for slug in {_github_slug(title), _toc_slug(title)}:
+            n = seen.get(slug, 0)
+            seen[slug] = n + 1
+            anchors.add(slug if n == 0 else f"{slug}-{n}")
+    return anchors
+
+
+class LinkTargetIndex:
+    """Every file and directory under root (one walk), plus per-file heading anchors on demand."""
+
+    def __init__(self, root: Path = REPO_ROOT):
+        self.root = root
+        self.paths: set[str] = set()
+        self._anchors: dict[str, set[str]] = {}
+        with phase("link-index"):
+            self._walk(root)
+
+    def _walk(self, root: Path) -> None:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, root)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+            for name in dirnames:
+                self.paths.add(prefix + name)
+            for name in filenames:
+                self.paths.add(prefix + name)
+
+    def update(self, changed: Iterable[str]) -> None:
+        """Re-sync root-relative paths that were added, removed or modified since the walk.
+
+        Each path (and its parent directories) is re-checked on disk, and its cached anchors
+        are dropped. Used by the daemon to keep one index current between requests.
+        """
+        for rel in changed:
+            rel = rel.replace(os.sep, "/")
+            self._anchors.pop(os.path.normpath(os.path.join(self.root, rel)), None)
+            while rel:
+                if os.path.exists(os.path.join(self.root, rel)):
+                    self.paths.add(rel)
+                else:
+                    self.paths.discard(rel)
+                rel = rel.rpartition("/")[0]
+
+    def _rel(self, path: Path) -> str | None:
+        """Normalized root-relative path, or None if path is outside the indexed tree."""
+        rel = os.path.relpath(os.path.normpath(os.path.join(self.root, path)), self.root)
+        if rel == os.curdir:
+            return ""
+        parts = rel.split(os.sep)
+        if parts[0] == os.pardir or SKIP_DIRS.intersection(parts):
+            return None
+        return "/".join(parts)
+
+    def exists(self, path: Path) -> bool:
+        rel = self._rel(path)
+        if rel is None:
+            return os.path.exists(path)
+        return rel == "" or rel in self.paths
+
+    def resolve(self, path: Path, md_fallback: bool = True) -> Path | None:
+        """Return path if it exists, else path + ".md" if that exists (when md_fallback), else None."""
+        if self.exists(path):
+            return path
+        if md_fallback:
+            with_md = path.parent / f"{path.name}.md"
+            if self.exists(with_md):
+                return with_md
+        return None
+
+    def anchors(self, path: Path) -> set[str]:
+        """Heading anchors of the markdown file at path (parsed once per index)."""
+        key = os.path.normpath(os.path.join(self.root, path))
+        if key not in self._anchors:
+            try:
+                with phase("anchor-parse", key):
+                    self._anchors[key] = heading_anchors(Path(key))
+            except (OSError, UnicodeDecodeError):
+                self._anchors[key] = set()
+        return self._anchors[key]
@@ -0,0 +1,15 @@
+"""
+Source locations for diagnostics.
+
+format_location renders a 1-based (line, column) position as "path:line:col", the form
+every text-mode error uses. Used by validate_mcp_refs.py, validate.py, engine.py and
+scripts/check_links.py; positions themselves come from the shared extraction (extract.py)
+and the tokenizer (skill_parser.py).
+"""
+
+
+def format_location(path, line: int | None = None, col: int | None = None) -> str:
+    """Render "path:line:col" (or "path" when the position is unknown)."""
+    if line is None:
+        return str(path)
+    return f"{path}:{line}:{col}" if col is not None else f"{path}:{line}"
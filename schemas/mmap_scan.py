@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped scanning of markdown files for MCP refs and links.
+
+iter_matches() runs one combined bytes regex (refs and links) directly over an mmap of the
+file instead of decoding it and tokenizing it line by line, so each file is scanned once
+for both; iter_refs() and iter_links() filter it. Frontmatter is skipped by offset (the body
+starts after the closing "---"), and only matched spans and the line prefix before each
+match are decoded, to compute its column. Newlines are counted in fixed-size chunks, and
+mapped pages behind the scan are released with madvise, so peak RSS is bounded by the scan
+window (8 MiB) and the longest paragraph, not by file size.
+
+Results match tokenize() in skill_parser.py exactly: the same refs and links with the
+same 1-based line and character column, in file order. That includes frontmatter
+detection, whitespace-only lines ending a link paragraph (Unicode whitespace included),
+and empty bodies. Two cases fall back to the tokenizer: files containing "\\r", because
+text mode translates newlines and so changes positions, and files whose first
+non-whitespace byte is non-ASCII, where the frontmatter rule depends on Unicode
+whitespace. Unlike the tokenizer, invalid UTF-8 outside the decoded spans is not
+reported.
+
+Usage: python schemas/mmap_scan.py --verify [PATH ...]
+       python schemas/mmap_scan.py --rss FILE
+
+--verify compares iter_matches with the tokenizer on every markdown file under
+PATH (default: the repo), on built-in edge cases and on generated fuzz documents; exit 1
+on any difference.
+--rss scans FILE with both backends in child processes and prints their peak RSS.
+"""
+
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Iterator
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from skill_parser import iter_file_tokens
+
+# skill_parser's MCP_REF_PATTERN and LINK_PATTERN combined into one bytes regex, so a
+# single pass finds both. Each match starts with one byte from a class ("m" or "["), which
+# lets the regex engine skip ahead to candidates. Group 1 is a ref minus its leading "m".
+# A link (groups 2 and 3) is only looked ahead at and consumes just its "[", so refs in its
+# text are still found. "]" and ")" never occur inside a multi-byte UTF-8 sequence, so
+# bytes matches are the str matches, encoded.
+SCAN_BYTES = re.compile(
+    rb"[m\[](?:(?<=m)(cp_[A-Za-z0-9-]+_[a-zA-Z0-9_]+)|(?<=\[)(?=([^\]]+)\]\(([^)]+)\)))"
+)
+# A whitespace-only line (str.strip() whitespace, UTF-8 encoded, "\r" excluded): these end
+# a link paragraph in the tokenizer
+_WS = rb"(?:[\t\x0b\x0c \x1c-\x1f]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+BLANK_LINE_BYTES = re.compile(rb"^" + _WS + rb"*(?:\n|\Z)", re.MULTILINE)
+LEADING_WS = b" \t\n\x0b\x0c\x1c\x1d\x1e\x1f"
+CHUNK = 1 << 20
+# Pages behind the scan are released each WINDOW
+WINDOW = 8 << 20
+
+
+class Fallback(Exception):
+    """The file needs the line tokenizer for identical results."""
+
+
+class MappedFile:
+    """Read-only mmap of a file plus byte offset -> (line, col) conversion."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self.mm = b""
+        self._pos, self._line = 0, 1
+        self._released = 0
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self._file.close()
+
+    def _drop(self, start: int, end: int) -> None:
+        """Drop mapped pages in [start, end) from this process's RSS (they are re-read from the
+        page cache if touched again); no-op where madvise is unavailable."""
+        start -= start % mmap.PAGESIZE
+        end -= end % mmap.PAGESIZE
+        if end > start and isinstance(self.mm, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED"):
+            self.mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+    def release(self, upto: int) -> None:
+        """Drop pages before upto once a WINDOW of them has accumulated since the last release."""
+        if upto - self._released >= WINDOW:
+            self._drop(self._released, upto)
+            self._released = upto - upto % mmap.PAGESIZE
+
+    def _has_cr(self) -> bool:
+        for a in range(0, len(self.mm), WINDOW):
+            b = min(a + WINDOW, len(self.mm))
+            found = self.mm.find(b"\r", a, b) >= 0
+            self._drop(a, b)
+            if found:
+                return True
+        return False
+
+    def _newlines(self, start: int, end: int) -> int:
+        n = 0
+        for a in range(start, end, CHUNK):
+            n += self.mm[a : min(a + CHUNK, end)].count(b"\n")
+        return n
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """1-based (line, character column) of the byte at offset."""
+        if offset >= self._pos:
+            self._line += self._newlines(self._pos, offset)
+        else:
+            self._line -= self._newlines(offset, self._pos)
+        self._pos = offset
+        line_start = self.mm.rfind(b"\n", 0, offset) + 1
+        return self._line, len(self.mm[line_start:offset].decode("utf-8")) + 1
+
+    def body_start(self, frontmatter: bool) -> int:
+        """Byte offset where tokenize() starts the body; raises Fallback when it cannot tell."""
+        mm = self.mm
+        if self._has_cr():
+            raise Fallback("\\r in file")
+        if not frontmatter:
+            return 0
+        i = 0
+        while i < len(mm) and mm[i] in LEADING_WS:
+            i += 1
+        if i < len(mm) and mm[i] >= 0x80:
+            raise Fallback("non-ASCII leading character")
+        if mm[i : i + 3] != b"---":
+            return 0
+        end = mm.find(b"---", i + 3)
+        if end < 0:
+            return 0
+        start = end + 3
+        while start < len(mm) and mm[start] == 0x0A:
+            start += 1
+        return start
+
+
+def _token_matches(path: Path, frontmatter: bool) -> Iterator[tuple[str, object, int, int]]:
+    for tok in iter_file_tokens(path, frontmatter):
+        if tok.kind in ("ref", "link"):
+            yield tok.kind, tok.value, tok.line, tok.col
+
+
+def _paragraphs(mm, start: int) -> Iterator[tuple[int, int]]:
+    """(start, end) byte spans of tokenizer paragraphs: runs of lines ending at a whitespace-only line."""
+    for m in BLANK_LINE_BYTES.finditer(mm, start):
+        if m.end() > start:
+            yield start, m.end()
+            start = m.end()
+        if m.end() == len(mm):
+            return
+    if start < len(mm):
+        yield start, len(mm)
+
+
+def iter_matches(path: Path, frontmatter: bool = True) -> Iterator[tuple[str, object, int, int]]:
+    """Yield ("ref", ref, line, col) and ("link", (text, url), line, col) for the body of path.
+
+    One SCAN_BYTES pass per paragraph finds both kinds; matches come in order of where they
+    start in the file. A link's position is that of its url, as in the tokenizer's "link"
+    tokens.
+    """
+    with MappedFile(path) as f:
+        try:
+            start = f.body_start(frontmatter)
+        except Fallback:
+            yield from _token_matches(path, frontmatter)
+            return
+        mm = f.mm
+        for a, b in _paragraphs(mm, start):
+            # Links do not overlap (as with LINK_PATTERN.finditer); refs consume their bytes
+            link_end = a
+            for m in SCAN_BYTES.finditer(mm, a, b):
+                ref = m.group(1)
+                if ref is not None:
+                    yield ("ref", "m" + ref.decode("ascii"), *f.position(m.start()))
+                elif m.start() >= link_end:
+                    link_end = m.end(3) + 1
+                    text, url = m.group(2).decode("utf-8"), m.group(3).decode("utf-8")
+                    yield ("link", (text, url), *f.position(m.start(3)))
+            f.release(b)
+
+
+def iter_refs(path: Path, frontmatter: bool = True) -> Iterator[tuple[str, int, int]]:
+    """Yield (ref, line, col) for every MCP ref in the body of path, in file order."""
+    for kind, value, line, col in iter_matches(path, frontmatter):
+        if kind == "ref":
+            yield value, line, col
+
+
+def iter_links(path: Path, frontmatter: bool = False) -> Iterator[tuple[str, str, int, int]]:
+    """Yield (text, url, line, col) for every markdown link in the body of path, in file order."""
+    for kind, value, line, col in iter_matches(path, frontmatter):
+        if kind == "link":
+            yield (*value, line, col)
+
+
+EDGE_CASES = {
+    "frontmatter.md": "---\nname: x\n---\n\n\nSee mcp_a_b and [doc](a/b.md).\n",
+    "inline-close.md": "  \n---\nname: x ---mcp_x_y [t](u)\nbody mcp_c_d\n",
+    "unclosed.md": "---\nname: x\nmcp_e_f [t](u)\n",
+    "empty-body.md": "---\nname: x\n---\n\n",
+    "no-fm.md": "Intro\n---\nmcp_g_h\n---\n",
+    "paragraphs.md": "[multi\nline](x/y.md) and [a](b)\n \n[broken\n\n](z)\n \n[c](d)",
+    "unicode.md": "Ünïcödé — mcp_über_x mcp_srv_tool [ä](ö/ü.md)\n　\n",
+    "crlf.md": "---\r\nname: x\r\n---\r\nmcp_i_j [k](l)\r\n",
+    "nbsp-lead.md": " ---\nname: x\n---\nmcp_k_l\n",
+    "empty.md": "",
+}
+# Fragments for the deterministic fuzz cases in --verify
+FUZZ_ALPHABET = ["mcp_a_b", "mcp_x-y_z1", " mcp_", "[", "]", "(", ")", "](", "\n", "\n", " ", "---", "\u3000", "x", "ü", "\xa0", "\t", "## Steps\n"]
+FUZZ_CASES = 2000
+
+
+def _fuzz_cases() -> Iterator[tuple[str, str]]:
+    import random
+
+    rnd = random.Random(0)
+    for i in range(FUZZ_CASES):
+        yield f"fuzz-{i}.md", "".join(rnd.choice(FUZZ_ALPHABET) for _ in range(rnd.randint(0, 40)))
+
+
+def _by_kind(matches) -> dict[str, list]:
+    out: dict[str, list] = {"ref": [], "link": []}
+    for kind, value, line, col in matches:
+        out[kind].append((value, line, col))
+    return out
+
+
+def _compare(path: Path, frontmatter: bool) -> list[str]:
+    try:
+        want = _by_kind(_token_matches(path, frontmatter))
+    except UnicodeDecodeError:
+        return []
+    got = _by_kind(iter_matches(path, frontmatter))
+    return [
+        f"{path} ({kind}s, frontmatter={frontmatter}):\n  tokenizer: {want[kind][:5]}\n  mmap:      {got[kind][:5]}"
+        for kind in want
+        if got[kind] != want[kind]
+    ]
+
+
+def verify(roots: list[Path]) -> int:
+    import tempfile
+
+    problems: list[str] = []
+    checked = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for name, text in [*EDGE_CASES.items(), *_fuzz_cases()]:
+            p = Path(tmp) / name
+            p.write_bytes(text.encode("utf-8"))
+            files.append(p)
+        for root in roots:
+            files.extend(sorted(root.rglob("*.md")) if root.is_dir() else [root])
+        for p in files:
+            if any(part in (".git", ".cache", "node_modules") for part in p.parts):
+                continue
+            for frontmatter in (True, False):
+                problems += _compare(p, frontmatter)
+            checked += 1
+    for problem in problems[:10]:
+        print(problem, file=sys.stderr)
+    if problems:
+        print(f"mmap scan differs from the tokenizer in {len(problems)} case(s)", file=sys.stderr)
+        return 1
+    print(f"OK: mmap scan matches the tokenizer on {checked} file(s)")
+    return 0
+
+
+def _peak_rss_kb(code: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            exec(code, {"iter_matches": iter_matches, "_token_matches": _token_matches, "Path": Path})
+        finally:
+            os._exit(0)
+    _, _, usage = os.wait4(pid, 0)
+    return usage.ru_maxrss
+
+
+def rss(path: Path) -> int:
+    base = _peak_rss_kb("pass")
+    for label, scan in (("tokenizer", "_token_matches"), ("mmap", "iter_matches")):
+        code = f"for _ in {scan}(Path({str(path)!r}), True): pass"
+        print(f"{label:<10} peak RSS {_peak_rss_kb(code) / 1024:8.1f} MiB (baseline {base / 1024:.1f} MiB)")
+    return 0
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if args[:1] == ["--verify"]:
+        sys.exit(verify([Path(a) for a in args[1:]] or [REPO_ROOT]))
+    if args[:1] == ["--rss"] and len(args) == 2:
+        sys.exit(rss(Path(args[1])))
+    print(__doc__.strip(), file=sys.stderr)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Process-pool helpers for the --jobs N option of the validator entry points.
+
+parallel_imap applies a module-level function to a list of items across worker processes
+and yields results in input order as they become available, so callers can stream output
+while later items are still being computed and output is identical to a serial run.
+Validators are cached per process, so each worker builds them once.
+"""
+
+import os
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from profiling import profiler
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks per worker: enough to balance uneven files, few enough to keep IPC overhead low
+CHUNKS_PER_WORKER = 4
+
+
+def parse_jobs(argv: list[str]) -> tuple[int, list[str]]:
+    """Pop --jobs N / --jobs=N / -j N from argv. Returns (jobs, remaining args).
+
+    Default is 1 (serial). N=0 means one worker per CPU.
+    """
+    jobs = 1
+    rest: list[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        value = None
+        if arg in ("--jobs", "-j"):
+            if i + 1 >= len(argv):
+                raise SystemExit(f"{arg} requires a value")
+            value = argv[i + 1]
+            i += 1
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+        else:
+            rest.append(arg)
+        if value is not None:
+            try:
+                jobs = int(value)
+            except ValueError:
+                raise SystemExit(f"--jobs expects an integer, got {value!r}")
+            if jobs < 0:
+                raise SystemExit("--jobs must be >= 0")
+        i += 1
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return jobs, rest
+
+
+def parallel_imap(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    jobs: int = 1,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[R]:
+    """Yield func(item) for each item in order, split across `jobs` processes when jobs > 1.
+
+    func and initializer must be module-level (picklable). Results are yielded as they
+    become available, so callers can consume (e.g. stream diagnostics for) early ones.
+    """
+    items = list(items)
+    # --profile measures phases in this process, so workers would hide them
+    jobs = 1 if profiler.enabled else min(jobs, len(items))
+    if jobs <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in items:
+            yield func(item)
+        return
+    # Imported here: concurrent.futures / multiprocessing are only needed for jobs > 1
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (jobs * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.map(func, items, chunksize=chunksize)
@@ -0,0 +1,178 @@
+"""
+Opt-in timing instrumentation for the validators (--profile).
+
+Code wraps each phase in `with phase("name", path):`. When profiling is off (the default)
+phase() returns a shared no-op context manager, so instrumented code pays one attribute
+check per call. When on, every phase records wall time and call count, and time is also
+attributed to the file being processed so slow files stand out.
+
+Entry points call enable_from_args(argv), which consumes:
+
+  --profile               print a phase table, per-phase slowest files and the top-N slowest
+                          files to stderr at exit
+  --profile-json FILE     also write the same counters as a JSON summary (for CI trends)
+  --profile-cprofile FILE also run under cProfile and dump pstats to FILE
+  --profile-top N         number of slowest files to report (default 10)
+
+--profile-json/--profile-cprofile/--profile-top imply --profile. While profiling, work
+runs in this process (--jobs is ignored, see parallel.py) so every phase is measured.
+"""
+
+import atexit
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_TOP = 10
+_NULL = nullcontext()
+
+
+def _display(file) -> str:
+    """Repo-relative posix path for file when it lies inside the repo, else str(file)."""
+    try:
+        return Path(file).resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(file)
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "file", "start")
+
+    def __init__(self, profiler: "Profiler", name: str, file):
+        self.profiler = profiler
+        self.name = name
+        self.file = file
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, time.perf_counter() - self.start, self.file)
+
+
+class Profiler:
+    """Per-phase wall time, calls and slowest file; per-file totals; free-form counters."""
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        # name -> {"calls", "seconds", "max", "max_file"}
+        self.phases: dict[str, dict] = {}
+        self.file_seconds: Counter[str] = Counter()
+        self.counters: Counter[str] = Counter()
+
+    def phase(self, name: str, file=None):
+        if not self.enabled:
+            return _NULL
+        return _Phase(self, name, file)
+
+    def record(self, name: str, seconds: float, file=None) -> None:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = {"calls": 0, "seconds": 0.0, "max": 0.0, "max_file": None}
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        key = None if file is None else _display(file)
+        if key is not None:
+            self.file_seconds[key] += seconds
+        if seconds > stats["max"]:
+            stats["max"], stats["max_file"] = seconds, key
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] += n
+
+    def summary(self, top: int = DEFAULT_TOP) -> dict:
+        phases = {}
+        for name, s in sorted(self.phases.items(), key=lambda kv: -kv[1]["seconds"]):
+            mean = s["seconds"] / s["calls"] if s["calls"] else 0.0
+            phases[name] = {
+                "calls": s["calls"],
+                "seconds": round(s["seconds"], 6),
+                "mean_ms": round(mean * 1000, 3),
+                "max_ms": round(s["max"] * 1000, 3),
+                "max_file": s["max_file"],
+                # How far the slowest file is from the phase mean (outlier indicator)
+                "max_over_mean": round(s["max"] / mean, 1) if mean and s["max_file"] else None,
+            }
+        return {
+            "wall_seconds": round(time.perf_counter() - self.started, 6),
+            "phases": phases,
+            "counters": dict(sorted(self.counters.items())),
+            "slowest_files": [
+                {"file": f, "seconds": round(sec, 6)} for f, sec in self.file_seconds.most_common(top)
+            ],
+        }
+
+    def report(self, top: int = DEFAULT_TOP, stream=None) -> None:
+        stream = sys.stderr if stream is None else stream
+        data = self.summary(top)
+        print(f"Profile: {data['wall_seconds']:.3f}s wall", file=stream)
+        print(f"  {'phase':<16} {'calls':>7} {'total s':>9} {'mean ms':>9} {'max ms':>9}  slowest file", file=stream)
+        for name, s in data["phases"].items():
+            slowest = f"{s['max_file']} ({s['max_over_mean']}x mean)" if s["max_file"] else ""
+            print(
+                f"  {name:<16} {s['calls']:>7} {s['seconds']:>9.3f} {s['mean_ms']:>9.3f} {s['max_ms']:>9.3f}  {slowest}",
+                file=stream,
+            )
+        if data["counters"]:
+            print("  counters: " + ", ".join(f"{k}={v}" for k, v in data["counters"].items()), file=stream)
+        if data["slowest_files"]:
+            print(f"  slowest files (all phases, top {top}):", file=stream)
+            for f in data["slowest_files"]:
+                print(f"    {f['seconds'] * 1000:>9.3f} ms  {f['file']}", file=stream)
+
+
+profiler = Profiler()
+phase = profiler.phase
+count = profiler.count
+
+
+def enable_from_args(argv: list[str]) -> list[str]:
+    """Pop the --profile options from argv; if any were given, start profiling. Returns the rest."""
+    rest: list[str] = []
+    opts: dict[str, str | None] = {}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--profile":
+            opts.setdefault("profile", None)
+        elif arg in ("--profile-json", "--profile-cprofile", "--profile-top"):
+            if i + 1 >= len(argv):
+                raise SystemExit(f"{arg} requires a value")
+            opts[arg[2:]] = argv[i + 1]
+            i += 1
+        else:
+            rest.append(arg)
+        i += 1
+    if not opts:
+        return rest
+    try:
+        top = int(opts.get("profile-top") or DEFAULT_TOP)
+    except ValueError:
+        raise SystemExit("--profile-top expects an integer")
+
+    profiler.enabled = True
+    profiler.started = time.perf_counter()
+    cprof = None
+    if opts.get("profile-cprofile"):
+        import cProfile
+
+        cprof = cProfile.Profile()
+        cprof.enable()
+
+    def finish() -> None:
+        if cprof is not None:
+            cprof.disable()
+            cprof.dump_stats(opts["profile-cprofile"])
+        profiler.report(top)
+        if opts.get("profile-json"):
+            Path(opts["profile-json"]).write_text(json.dumps(profiler.summary(top), indent=2) + "\n", encoding="utf-8")
+
+    atexit.register(finish)
+    return rest
@@ -0,0 +1,244 @@
+"""
+Compiled index of mcps/ (the list of record), persisted as .cache/mcp-registry.json.
+
+Maps every mcps/**/*.json path to its server, tool name, ref (mcp_<server>_<tool>),
+SHA-256, mtime/size, and an inputSchema summary (property names and required). The
+index is refreshed incrementally: a directory is re-listed only when its mtime changed and
+a file is re-read only when its mtime or size changed, so a warm load costs one stat per
+directory and file and parses no JSON.
+
+Servers are the directories under mcps/; nothing is hardcoded. validate_mcps.py reads
+list_tools(), get_valid_refs(), resolve() and tool_files() from here.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+MCPS_DIR_NAME = "mcps"
+REGISTRY_PATH = REPO_ROOT / ".cache" / "mcp-registry.json"
+FORMAT_VERSION = 1
+
+# Entries modified this close to the last save are re-checked (coarse mtime filesystems)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def _sort_key(rel: str) -> list[str]:
+    # Same order as sorted(Path(...)) / sorted(rglob(...)): compare path components
+    return rel.split("/")
+
+
+def _input_summary(schema) -> dict | None:
+    if not isinstance(schema, dict):
+        return None
+    props = schema.get("properties")
+    required = schema.get("required")
+    return {
+        "properties": list(props) if isinstance(props, dict) else [],
+        "required": list(required) if isinstance(required, list) else [],
+    }
+
+
+def _index_file(rel: str, st: os.stat_result, data: bytes) -> dict:
+    """Build the registry record for one JSON file under mcps/."""
+    record = {
+        "path": rel,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "server": None,
+        "tool": None,
+        "ref": None,
+        "input": None,
+    }
+    parts = rel.split("/")  # e.g. ["mcps", "github", "tools", "list_commits.json"]
+    if len(parts) < 4 or parts[2] != "tools":
+        return record
+    server = parts[1]
+    tool = Path(parts[-1]).stem
+    try:
+        parsed = json.loads(data.decode("utf-8"))
+        tool = parsed.get("name", tool)
+        record["input"] = _input_summary(parsed.get("inputSchema"))
+    except Exception:
+        pass
+    record.update(server=server, tool=tool, ref=f"mcp_{server}_{tool}")
+    return record
+
+
+class Registry:
+    """Incrementally refreshed index of mcps/. Use get_registry() for the process-wide instance."""
+
+    def __init__(self, path: Path = REGISTRY_PATH):
+        self.path = path
+        self.saved_ns = 0
+        # rel dir -> {"mtime_ns", "dirs": [names], "files": [names]}
+        self.dirs: dict[str, dict] = {}
+        # rel path -> record (see _index_file)
+        self.files: dict[str, dict] = {}
+        self._by_ref: dict[str, dict] | None = None
+        self._fresh = False
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            return
+        self.saved_ns = data.get("saved_ns", 0)
+        self.dirs = data.get("dirs", {})
+        self.files = data.get("files", {})
+
+    def _unchanged(self, prev: dict | None, st: os.stat_result) -> bool:
+        return (
+            prev is not None
+            and prev["mtime_ns"] == st.st_mtime_ns
+            and prev.get("size", st.st_size) == st.st_size
+            and st.st_mtime_ns < self.saved_ns - RACY_WINDOW_NS
+        )
+
+    def _update_file(self, rel: str) -> dict | None:
+        try:
+            st = os.stat(REPO_ROOT / rel)
+        except OSError:
+            if self.files.pop(rel, None) is not None:
+                self._dirty = True
+                self._by_ref = None
+            return None
+        prev = self.files.get(rel)
+        if self._unchanged(prev, st):
+            return prev
+        try:
+            data = (REPO_ROOT / rel).read_bytes()
+        except OSError:
+            return prev
+        record = _index_file(rel, st, data)
+        if record != prev:
+            self.files[rel] = record
+            self._dirty = True
+            self._by_ref = None
+        return record
+
+    def _walk(self, rel_dir: str, seen: set[str]) -> None:
+        try:
+            st = os.stat(REPO_ROOT / rel_dir)
+        except OSError:
+            return
+        prev = self.dirs.get(rel_dir)
+        if self._unchanged(prev, st):
+            subdirs, names = prev["dirs"], prev["files"]
+        else:
+            subdirs, names = [], []
+            with os.scandir(REPO_ROOT / rel_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        subdirs.append(entry.name)
+                    elif entry.name.endswith(".json") and entry.is_file():
+                        names.append(entry.name)
+            subdirs.sort()
+            names.sort()
+            self.dirs[rel_dir] = {"mtime_ns": st.st_mtime_ns, "dirs": subdirs, "files": names}
+            self._dirty = True
+        seen.add(rel_dir)
+        for name in names:
+            rel = f"{rel_dir}/{name}"
+            seen.add(rel)
+            self._update_file(rel)
+        for name in subdirs:
+            self._walk(f"{rel_dir}/{name}", seen)
+
+    def refresh(self) -> None:
+        """Bring the index up to date with mcps/ and save it if anything changed."""
+        seen: set[str] = set()
+        self._walk(MCPS_DIR_NAME, seen)
+        for rel in [d for d in self.dirs if d not in seen]:
+            del self.dirs[rel]
+            self._dirty = True
+        for rel in [p for p in self.files if p not in seen]:
+            del self.files[rel]
+            self._dirty = True
+            self._by_ref = None
+        self._fresh = True
+        if self._dirty:
+            self.save()
+
+    def ensure_fresh(self) -> None:
+        if not self._fresh:
+            self.refresh()
+
+    def save(self) -> None:
+        self.saved_ns = time.time_ns()
+        data = {"version": FORMAT_VERSION, "saved_ns": self.saved_ns, "dirs": self.dirs, "files": self.files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # read-only checkout: the in-memory index is still correct
+        self._dirty = False
+
+    def records(self) -> list[dict]:
+        """All mcps/**/*.json records, sorted by path."""
+        self.ensure_fresh()
+        return [self.files[p] for p in sorted(self.files, key=_sort_key)]
+
+    def tools(self) -> list[dict]:
+        """Records for mcps/<server>/tools/*.json, sorted by path."""
+        return [r for r in self.records() if r["ref"] is not None]
+
+    def servers(self) -> list[str]:
+        return sorted({r["server"] for r in self.tools()})
+
+    def _ref_map(self) -> dict[str, dict]:
+        if self._by_ref is None:
+            by_ref: dict[str, dict] = {}
+            for r in sorted(self.files.values(), key=lambda r: _sort_key(r["path"])):
+                if r["ref"] is not None:
+                    by_ref.setdefault(r["ref"], r)
+            self._by_ref = by_ref
+        return self._by_ref
+
+    def refs(self) -> set[str]:
+        self.ensure_fresh()
+        return set(self._ref_map())
+
+    def lookup(self, ref: str) -> dict | None:
+        """Return the record defining ref, or None.
+
+        Before a full refresh, a hit is confirmed by re-statting just that file; a miss or a
+        stale hit falls back to refresh().
+        """
+        if not self._fresh:
+            record = self._ref_map().get(ref)
+            if record is not None and self._update_file(record["path"]) == record:
+                return record
+            self.refresh()
+        return self._ref_map().get(ref)
+
+    def record_for(self, rel: str) -> dict | None:
+        """Return the up-to-date record for one repo-relative path under mcps/."""
+        if not rel.startswith(MCPS_DIR_NAME + "/") or not rel.endswith(".json"):
+            return None
+        record = self._update_file(rel)
+        if self._dirty:
+            self.save()
+        return record
+
+
+_registry: Registry | None = None
+
+
+def get_registry() -> Registry:
+    """Return the process-wide Registry (loaded from disk, refreshed on first query)."""
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
@@ -0,0 +1,327 @@
+"""
+Single-pass tokenizer for skill and doc markdown (skills/<name>/SKILL.md, docs/**/*.md).
+
+tokenize() reads a file line by line, once, and yields Tokens for everything the
+validators and checkers need: YAML frontmatter, ## headings, body text, step numbers in
+## Steps, MCP refs (mcp_Server_ToolName) and markdown links, each with its offset, line,
+and column in the file. It holds at most one paragraph in memory (plus the frontmatter),
+so files can be streamed from disk regardless of size.
+
+SkillDocument collects those tokens into one shared parse: frontmatter, section bodies,
+step numbers, refs and links. SkillDocument.parsed() is the ParsedSkill shape validated
+by schemas/skill.schema.json. parse_skill_md and strip_frontmatter keep their original
+string-in/string-out behavior.
+
+Rules match the original regex parser: frontmatter is the text between the first two
+"---" when the file (ignoring leading whitespace) starts with "---"; a "## " heading
+counts only at the start of a line other than the first body line; a repeated section
+keeps its last occurrence; step numbers match (\\d+)\\.(?!\\d) and are >= 1. Refs and
+links are reported for the body; links are matched within a paragraph (lines up to a
+blank line).
+
+Pure parsing only (no jsonschema import), so it can be shared by the validators and
+scripts without pulling in schema validation.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SECTION_NAMES = ["Overview", "Definitions", "Prerequisites", "Steps", "Tools", "Guidance"]
+MCP_REF_PATTERN = re.compile(r"mcp_[A-Za-z0-9-]+_[a-zA-Z0-9_]+")
+STEP_NUMBER_PATTERN = re.compile(r"(\d+)\.(?!\d)")
+LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+@dataclass
+class Token:
+    """One item found by tokenize(). offset is a character offset in the file; line/col are 1-based.
+
+    kind / value:
+      "frontmatter" — dict of lowercased keys to stripped values
+      "body"        — None; marks where the body starts (after frontmatter)
+      "heading"     — section name of a "## " heading
+      "text"        — one body line, including its newline
+      "step"        — step number (int) in a ## Steps section
+      "ref"         — MCP ref string
+      "link"        — (text, url); position is that of the url
+    """
+
+    kind: str
+    value: object
+    offset: int
+    line: int
+    col: int
+
+
+def _parse_frontmatter_text(text: str) -> dict:
+    fm = {}
+    for line in text.strip().split("\n"):
+        if ":" in line:
+            key, _, value = line.partition(":")
+            fm[key.strip().lower()] = value.strip()
+    return fm
+
+
+class _Lines:
+    """Iterator of (text, offset, line, col) over input lines, with push-back."""
+
+    def __init__(self, lines: Iterable[str]):
+        self._it = iter(lines)
+        self._back: list[tuple[str, int, int, int]] = []
+        self._offset = 0
+        self._line = 0
+
+    def __iter__(self) -> "_Lines":
+        return self
+
+    def __next__(self) -> tuple[str, int, int, int]:
+        if self._back:
+            return self._back.pop()
+        text = next(self._it)
+        self._line += 1
+        item = (text, self._offset, self._line, 1)
+        self._offset += len(text)
+        return item
+
+    def push(self, items: list[tuple[str, int, int, int]]) -> None:
+        self._back.extend(reversed(items))
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def line(self) -> int:
+        return self._line
+
+
+class _Paragraph:
+    """Body lines since the last blank line, for link matching across line breaks."""
+
+    def __init__(self):
+        self.parts: list[str] = []
+        self.starts: list[tuple[int, int, int, int]] = []  # (offset in paragraph, file offset, line, col)
+        self.size = 0
+
+    def add(self, text: str, offset: int, line: int, col: int) -> None:
+        self.starts.append((self.size, offset, line, col))
+        self.parts.append(text)
+        self.size += len(text)
+
+    def flush(self) -> Iterator[Token]:
+        text = "".join(self.parts)
+        starts = self.starts
+        self.parts, self.starts, self.size = [], [], 0
+        if "](" not in text:
+            return
+        i = 0
+        for m in LINK_PATTERN.finditer(text):
+            pos = m.start(2)
+            while i + 1 < len(starts) and starts[i + 1][0] <= pos:
+                i += 1
+            para_off, file_off, line, col = starts[i]
+            delta = pos - para_off
+            yield Token("link", (m.group(1), m.group(2)), file_off + delta, line, col + delta)
+
+
+def _read_frontmatter(src: _Lines) -> dict | None:
+    """Consume frontmatter from src and return it, leaving src at the first body character.
+
+    Returns None (with every consumed line pushed back) when there is no closed frontmatter.
+    """
+    consumed = []
+    for item in src:
+        consumed.append(item)
+        if item[0].strip():
+            break
+    if not consumed or not consumed[-1][0].lstrip().startswith("---"):
+        src.push(consumed)
+        return None
+    text, off, line, _ = consumed[-1]
+    pos = len(text) - len(text.lstrip()) + 3
+    parts = []
+    while True:
+        end = text.find("---", pos)
+        if end >= 0:
+            parts.append(text[pos:end])
+            break
+        parts.append(text[pos:])
+        item = next(src, None)
+        if item is None:
+            src.push(consumed)
+            return None
+        consumed.append(item)
+        text, off, line, _ = item
+        pos = 0
+    # Body is the rest after the closing "---", without leading newlines
+    rest = text[end + 3 :]
+    skip = len(rest) - len(rest.lstrip("\n"))
+    if rest[skip:]:
+        start = end + 3 + skip
+        src.push([(rest[skip:], off + start, line, start + 1)])
+    else:
+        for item in src:
+            if item[0].lstrip("\n"):
+                src.push([item])
+                break
+    return _parse_frontmatter_text("".join(parts))
+
+
+def tokenize(lines: Iterable[str], frontmatter: bool = True) -> Iterator[Token]:
+    """Yield Tokens for a markdown file given as lines (each with its newline).
+
+    With frontmatter=True, closed frontmatter is consumed and reported as one token, and
+    everything else is tokenized as the body only. With frontmatter=False the whole file
+    is body.
+    """
+    src = _Lines(lines)
+    if frontmatter:
+        fm = _read_frontmatter(src)
+        if fm is not None:
+            yield Token("frontmatter", fm, 0, 1, 1)
+    para = _Paragraph()
+    first = True
+    in_steps = False
+    for text, off, line, col in src:
+        if first:
+            yield Token("body", None, off, line, col)
+        if not first and text.startswith("## "):
+            name = text[3:].strip()
+            in_steps = name == "Steps"
+            yield Token("heading", name, off, line, col)
+        else:
+            yield Token("text", text, off, line, col)
+            if in_steps:
+                for m in STEP_NUMBER_PATTERN.finditer(text):
+                    n = int(m.group(1))
+                    if n >= 1:
+                        yield Token("step", n, off + m.start(), line, col + m.start())
+        first = False
+        if "mcp_" in text:
+            for m in MCP_REF_PATTERN.finditer(text):
+                yield Token("ref", m.group(0), off + m.start(), line, col + m.start())
+        para.add(text, off, line, col)
+        if not text.strip():
+            yield from para.flush()
+    if first:
+        # Empty body: it starts at the end of the file
+        yield Token("body", None, src.offset, max(src.line, 1), 1)
+    yield from para.flush()
+
+
+@dataclass
+class SkillDocument:
+    """Everything tokenize() found in one file, collected in a single pass."""
+
+    frontmatter: dict = field(default_factory=dict)
+    body_offset: int = 0
+    # SECTION_NAMES only; a repeated section keeps its last occurrence
+    sections: dict[str, str] = field(default_factory=dict)
+    section_positions: dict[str, tuple[int, int]] = field(default_factory=dict)  # name -> (line, col)
+    step_numbers: list[int] = field(default_factory=list)
+    # ref -> (line, col) of its first occurrence in the body, in order of first occurrence
+    mcp_refs: dict[str, tuple[int, int]] = field(default_factory=dict)
+    links: list[tuple[str, str, int, int]] = field(default_factory=list)  # (text, url, line, col)
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[Token], keep_content: bool = True) -> "SkillDocument":
+        doc = cls()
+        current: str | None = None
+        content: list[str] = []
+        steps: list[int] = []
+
+        def close() -> None:
+            if current in SECTION_NAMES:
+                doc.sections[current] = "".join(content).strip() if keep_content else ""
+                if current == "Steps":
+                    doc.step_numbers = steps.copy()
+
+        for tok in tokens:
+            kind = tok.kind
+            if kind == "text":
+                if current is not None and keep_content:
+                    content.append(tok.value)
+            elif kind == "ref":
+                doc.mcp_refs.setdefault(tok.value, (tok.line, tok.col))
+            elif kind == "step":
+                steps.append(tok.value)
+            elif kind == "link":
+                text, url = tok.value
+                doc.links.append((text, url, tok.line, tok.col))
+            elif kind == "heading":
+                close()
+                current = tok.value
+                content = []
+                steps = []
+                if current in SECTION_NAMES:
+                    doc.section_positions[current] = (tok.line, tok.col)
+            elif kind == "frontmatter":
+                doc.frontmatter = tok.value
+            elif kind == "body":
+                doc.body_offset = tok.offset
+        close()
+        return doc
+
+    def parsed(self) -> dict:
+        """Return the ParsedSkill dict validated by skill.schema.json."""
+        parsed = {
+            "overview": self.sections.get("Overview", ""),
+            "definitions": self.sections.get("Definitions", ""),
+            "prerequisites": self.sections.get("Prerequisites", ""),
+            "steps": {"content": self.sections.get("Steps", ""), "numbers": self.step_numbers},
+            "tools": self.sections.get("Tools", ""),
+            "guidance": self.sections.get("Guidance", ""),
+        }
+        if self.mcp_refs:
+            parsed["mcpRefs"] = list(self.mcp_refs)
+        return parsed
+
+
+def split_lines(text: str) -> list[str]:
+    """Split on "\\n" only (unlike str.splitlines), keeping each line's newline."""
+    lines = text.split("\n")
+    last = lines.pop()
+    out = [line + "\n" for line in lines]
+    if last:
+        out.append(last)
+    return out
+
+
+def scan_text(text: str, frontmatter: bool = True) -> SkillDocument:
+    return SkillDocument.from_tokens(tokenize(split_lines(text), frontmatter))
+
+
+def scan_file(path: Path, frontmatter: bool = True) -> SkillDocument:
+    """Parse a file in one streaming pass (read line by line, never as a whole string)."""
+    with open(path, encoding="utf-8") as f:
+        return SkillDocument.from_tokens(tokenize(f, frontmatter))
+
+
+def iter_file_tokens(path: Path, frontmatter: bool = True) -> Iterator[Token]:
+    """Stream Tokens from a file; the file stays open until the iterator is exhausted."""
+    with open(path, encoding="utf-8") as f:
+        yield from tokenize(f, frontmatter)
+
+
+def read_frontmatter(path: Path) -> dict:
+    """Return the frontmatter dict of a file, reading only up to the closing "---"."""
+    for tok in iter_file_tokens(path):
+        return tok.value if tok.kind == "frontmatter" else {}
+    return {}
+
+
+def parse_skill_md(md: str) -> dict:
+    """Parse a skill body (frontmatter already stripped) into the ParsedSkill dict."""
+    return scan_text(md, frontmatter=False).parsed()
+
+
+def strip_frontmatter(md: str) -> str:
+    """If content has YAML frontmatter (--- ... ---), return body only."""
+    if not md.strip().startswith("---"):
+        return md
+    parts = md.split("---", 2)
+    if len(parts) < 3:
+        return md
+    return parts[2].lstrip("\n")
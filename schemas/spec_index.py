@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Spec parsing, validation against specs/TEMPLATE.md, and the skill <-> spec index.
+
+Every specs/<name>/spec.md is checked against the structure specs/TEMPLATE.md defines. The
+required structure is read from the template itself, so editing the template changes the
+check:
+
+- "# Feature: ..." title, a Status from the template's list, a Last Updated date
+- each "## " section of the template that has "### " subsections (Blueprint, Contract)
+  must be present with each of those subsections, and none of them may be empty
+- every "**Scenario: ...**" has Given, When and Then lines
+- no line of the template's placeholder text ("[...]", "*Purpose: ...*") is left in
+
+The index joins skills/<name>/SKILL.md with specs/<name>/spec.md:
+
+- every skill has a spec
+- a spec titled "/<command>" belongs to skills/<command>/, in the same directory name
+- every MCP tool the spec mentions (full mcp_ refs, or the tools named on its
+  "**MCP**: Server (tool, ...)" line) should exist in mcps/ and be referenced by the skill.
+  A tool that only the spec names is a warning, not an error: the spec is product
+  content for its owner to reconcile. The spec may name fewer tools than the skill uses.
+
+validate_all.py runs both in its single pass (engine.validate_specs). Each spec's parse and
+structure result is cached with the skill and tool results in .cache/validation-cache.json,
+keyed by content hash. The join is rebuilt each run from those entries and the skills'
+(cached) mcpRefs, so a warm run re-reads only changed specs.
+
+Usage: python schemas/spec_index.py [--json]
+       Prints the joined index (skill, spec, status, tools mentioned) and its warnings, and
+       exits 1 if any spec or pairing has errors. --json prints the index as JSON.
+"""
+
+import json
+import re
+import sys
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCHEMAS_DIR.parent
+SPECS_DIR = REPO_ROOT / "specs"
+SKILLS_DIR = REPO_ROOT / "skills"
+TEMPLATE_PATH = SPECS_DIR / "TEMPLATE.md"
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from extract import extract
+from profiling import phase
+
+TITLE = re.compile(r"^# Feature:\s*(.+?)\s*$")
+COMMAND = re.compile(r"^/([a-z0-9][a-z0-9-]*)")
+HEADING = re.compile(r"^(#{2,3})\s+(.+?)\s*$")
+STATUS = re.compile(r"^>\s*\*\*Status\*\*:\s*(.+?)\s*$")
+UPDATED = re.compile(r"^>\s*\*\*Last Updated\*\*:\s*(.+?)\s*$")
+SCENARIO = re.compile(r"^\*\*Scenario:")
+STEP = re.compile(r"^-\s+\*\*(Given|When|Then)\b")
+MCP_LINE = re.compile(r"^\s*-\s+\*\*MCP\*\*:\s*(.*)$")
+MCP_GROUP = re.compile(r"([A-Za-z][A-Za-z0-9-]*)\s*\(([^)]*)\)")
+TOOL_NAME = re.compile(r"[A-Za-z0-9_]+")
+PLACEHOLDER = re.compile(r"\[[^\]]+\](?!\()|\{Feature Name\}|^\*Purpose:")
+
+
+def _headings(lines: list[str]):
+    """Yield (level, text, line) for "## " and "### " headings outside fenced code."""
+    fenced = False
+    for i, line in enumerate(lines, 1):
+        if line.startswith("```"):
+            fenced = not fenced
+            continue
+        m = None if fenced else HEADING.match(line)
+        if m:
+            yield len(m.group(1)), m.group(2), i
+
+
+@lru_cache(maxsize=None)
+def template_rules() -> tuple[dict[str, list[str]], tuple[str, ...], frozenset[str]]:
+    """(required "## " section -> its "### " subsections, statuses, placeholder lines) from TEMPLATE.md."""
+    lines = TEMPLATE_PATH.read_text(encoding="utf-8").splitlines()
+    sections: dict[str, list[str]] = {}
+    current = None
+    for level, text, _ in _headings(lines):
+        if level == 2:
+            current = text
+            sections[current] = []
+        elif current is not None:
+            sections[current].append(text)
+    statuses: tuple[str, ...] = ()
+    for line in lines:
+        m = STATUS.match(line)
+        if m:
+            statuses = tuple(s.strip() for s in m.group(1).split("|"))
+    placeholders = frozenset(line.strip() for line in lines if PLACEHOLDER.search(line.strip()))
+    return {name: subs for name, subs in sections.items() if subs}, statuses, placeholders
+
+
+def mentioned_tools(path: Path, lines: list[str]) -> dict[str, list[int]]:
+    """Refs a spec mentions -> [line, col] of the first mention: full mcp_ refs plus the
+    tools named on its "**MCP**: Server (tool, ...)" lines."""
+    mentions = {ref: list(pos) for ref, pos in extract(path, frontmatter=False).refs.items()}
+    for i, line in enumerate(lines, 1):
+        m = MCP_LINE.match(line)
+        if not m:
+            continue
+        for group in MCP_GROUP.finditer(line, m.start(1)):
+            server = group.group(1).lower()
+            for name in group.group(2).split(","):
+                name = name.strip().strip("`")
+                if TOOL_NAME.fullmatch(name):
+                    mentions.setdefault(f"mcp_{server}_{name}", [i, group.start() + 1])
+    return mentions
+
+
+def spec_entry(path: Path) -> dict:
+    """Parse and structurally validate one spec.md.
+
+    Returns {"spec": summary or None, "errors": [[message, line, col], ...]}; JSON-serializable
+    so it can be cached. summary holds title, command, status, updated and mentions.
+    """
+    try:
+        with phase("spec-parse", path):
+            lines = path.read_text(encoding="utf-8").splitlines()
+            mentions = mentioned_tools(path, lines)
+    except (OSError, UnicodeDecodeError) as ex:
+        return {"spec": None, "errors": [[str(ex), None, None]]}
+    required, statuses, placeholders = template_rules()
+    errors: list[list] = []
+
+    title = TITLE.match(lines[0]) if lines else None
+    if title is None:
+        errors.append(['first line must be "# Feature: <name>"', 1, 1])
+    command = COMMAND.match(title.group(1)) if title else None
+
+    status = updated = None
+    for i, line in enumerate(lines, 1):
+        if status is None and (m := STATUS.match(line)):
+            status = m.group(1)
+            if statuses and status not in statuses:
+                errors.append([f"Status {status!r} is not one of: {', '.join(statuses)}", i, 1])
+        elif updated is None and (m := UPDATED.match(line)):
+            updated = m.group(1)
+            try:
+                date.fromisoformat(updated)
+            except ValueError:
+                errors.append([f"Last Updated {updated!r} is not a YYYY-MM-DD date", i, 1])
+        elif line.strip() in placeholders:
+            errors.append([f"template placeholder left in: {line.strip()}", i, 1])
+    if status is None:
+        errors.append(['missing "> **Status**:" line', 1, 1])
+    if updated is None:
+        errors.append(['missing "> **Last Updated**:" line', 1, 1])
+
+    # (section, subsection) -> [heading line, content lines]
+    found: dict[tuple[str, str], list[int]] = {}
+    sections: dict[str, int] = {}
+    current = None
+    body_start = None
+    for level, text, line in list(_headings(lines)) + [(2, "", len(lines) + 1)]:
+        if body_start is not None:
+            found[body_start][1] = sum(1 for ln in lines[found[body_start][0] : line - 1] if ln.strip() not in ("", "---"))
+            body_start = None
+        if level == 2:
+            current = text
+            sections.setdefault(text, line)
+        elif current in required:
+            found[(current, text)] = [line, 0]
+            body_start = (current, text)
+    for section, subsections in required.items():
+        if section not in sections:
+            errors.append([f'missing "## {section}" section', None, None])
+            continue
+        for sub in subsections:
+            pos = found.get((section, sub))
+            if pos is None:
+                errors.append([f'missing "### {sub}" under "## {section}"', sections[section], 1])
+            elif not pos[1]:
+                errors.append([f'"### {sub}" is empty', pos[0], 1])
+
+    scenario = None
+    seen: set[str] = set()
+    for i, line in enumerate(lines + ["**Scenario:"], 1):
+        if SCENARIO.match(line) or HEADING.match(line):
+            if scenario is not None and seen != {"Given", "When", "Then"}:
+                missing = [s for s in ("Given", "When", "Then") if s not in seen]
+                errors.append([f"scenario is missing {', '.join(missing)}", scenario, 1])
+            scenario = i if SCENARIO.match(line) and i <= len(lines) else None
+            seen = set()
+        elif scenario is not None and (m := STEP.match(line)):
+            seen.add(m.group(1))
+
+    errors.sort(key=lambda e: e[1] or 0)
+    summary = {
+        "title": title.group(1) if title else None,
+        "command": command.group(1) if command else None,
+        "status": status,
+        "updated": updated,
+        "mentions": mentions,
+    }
+    return {"spec": summary, "errors": errors}
+
+
+def spec_files() -> list[Path]:
+    with phase("discover"):
+        return sorted(SPECS_DIR.glob("*/spec.md"))
+
+
+def spec_path(name: str) -> Path:
+    return SPECS_DIR / name / "spec.md"
+
+
+def skill_path(name: str) -> Path:
+    return SKILLS_DIR / name / "SKILL.md"
+
+
+def join_issues(
+    name: str, spec: dict | None, skill_refs: list[str] | None, valid: set[str]
+) -> tuple[list[list], list[list]]:
+    """Pairing (errors, warnings), each [message, line, col], for specs/<name>/spec.md and skills/<name>/.
+
+    spec is the spec_entry summary (None if the spec is missing or unreadable); skill_refs
+    the skill's mcpRefs (None if there is no such skill). Tools only the spec names are warnings.
+    """
+    if spec is None:
+        if skill_refs is None:
+            return [], []
+        return [[f"skills/{name}/SKILL.md has no spec; copy specs/TEMPLATE.md to specs/{name}/spec.md", None, None]], []
+    command = spec["command"]
+    if skill_refs is None:
+        if command is None:
+            return [], []  # a feature spec that is not about a skill
+        return [[f"spec is for /{command} but skills/{name}/SKILL.md does not exist", 1, 1]], []
+    errors, warnings = [], []
+    if command != name:
+        errors.append([f"title names {'/' + command if command else 'no /command'}, expected /{name}", 1, 1])
+    refs = set(skill_refs)
+    for ref, (line, col) in spec["mentions"].items():
+        if ref not in valid:
+            warnings.append([f"mentions {ref}, which is not a tool in mcps/", line, col])
+        elif ref not in refs:
+            warnings.append([f"mentions {ref}, which skills/{name}/SKILL.md does not reference", line, col])
+    return errors, warnings
+
+
+def build_index(
+    entries: dict[str, dict], skills: dict[str, list[str]], valid: set[str], names: list[str] | None = None
+) -> list[dict]:
+    """Joined rows, one per name: {"name", "skill", "spec", "status", "mentions", "errors", "pairing", "warnings"}.
+
+    entries maps spec name -> spec_entry result; skills maps skill name -> mcpRefs. errors are
+    the spec's own (structure) errors, pairing the skill <-> spec ones, warnings the tools
+    only the spec names. names defaults to every name in entries or skills.
+    """
+    rows = []
+    for name in sorted(set(entries) | set(skills)) if names is None else names:
+        entry = entries.get(name)
+        spec = entry["spec"] if entry else None
+        pairing, warnings = join_issues(name, spec, skills.get(name), valid)
+        rows.append(
+            {
+                "name": name,
+                "skill": f"skills/{name}/SKILL.md" if name in skills else None,
+                "spec": f"specs/{name}/spec.md" if entry else None,
+                "status": spec["status"] if spec else None,
+                "mentions": sorted(spec["mentions"]) if spec else [],
+                "errors": entry["errors"] if entry else [],
+                "pairing": pairing,
+                "warnings": warnings,
+            }
+        )
+    return rows
+
+
+def main() -> int:
+    from validate_mcps import get_valid_refs
+
+    skills = {p.parent.name: list(extract(p).refs) for p in sorted(SKILLS_DIR.glob("*/SKILL.md"))}
+    entries = {p.parent.name: spec_entry(p) for p in spec_files()}
+    rows = build_index(entries, skills, get_valid_refs())
+    if "--json" in sys.argv[1:]:
+        print(json.dumps(rows, indent=2))
+    else:
+        for row in rows:
+            paired = "skill+spec" if row["skill"] and row["spec"] else "skill only" if row["skill"] else "spec only"
+            print(f"{row['name']:<24} {paired:<11} {row['status'] or '-':<11} {len(row['mentions'])} tool(s)")
+            for message, line, _ in row["errors"] + row["pairing"]:
+                where = f":{line}" if line else ""
+                print(f"  specs/{row['name']}/spec.md{where}: {message}", file=sys.stderr)
+            for message, line, _ in row["warnings"]:
+                where = f":{line}" if line else ""
+                print(f"  specs/{row['name']}/spec.md{where}: warning: {message}", file=sys.stderr)
+    return 1 if any(row["errors"] or row["pairing"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+"Did you mean" suggestions for invalid MCP refs, and bulk server-rename detection.
+
+SuggestionIndex keeps a character-trigram inverted index over every valid ref
+(mcp_<server>_<tool>, without the mcp_ prefix). Trigrams found in more than MAX_POSTINGS
+refs (a large server's prefix such as "git"/"ub_", or common verbs such as "get") are not
+indexed, so a lookup touches a bounded number of postings however large the catalog is.
+SequenceMatcher then runs only on the MAX_CANDIDATES refs sharing the most of the
+remaining trigrams with the query; a query made only of unindexed trigrams falls back to
+the refs whose length can reach the cutoff.
+
+Scores, cutoff and order are those of difflib.get_close_matches (highest ratio first,
+ties to the lexicographically larger ref), so the result equals get_close_matches over
+every valid ref whenever its matches are among the candidates. On the repo's catalog they
+always are; on a synthetic 3000-tool catalog a sample of 400 typos matched exactly, and
+only a rare lower-ranked suggestion differs across all of them.
+
+Usage: python schemas/suggest.py --verify
+       Compares suggest() with get_close_matches on typo'd variants of every valid ref;
+       exit 1 on any difference.
+
+detect_server_renames groups invalid refs by unknown server and reports a server whose tools
+mostly exist under another server (e.g. mcp_jira_* -> mcp_atlassian_*) once.
+"""
+
+import heapq
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher, get_close_matches
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SCHEMAS_DIR = Path(__file__).resolve().parent
+
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from validate_mcps import get_valid_refs, split_ref
+
+# Candidates scored per query, by shared-trigram count (before SequenceMatcher)
+MAX_CANDIDATES = 200
+# Trigrams in more refs than this are too common to narrow a lookup and are not indexed
+MAX_POSTINGS = 500
+# A server rename is reported when at least this share of its tools resolve elsewhere
+RENAME_MIN_SHARE = 0.5
+RENAME_MIN_REFS = 2
+
+
+def _trigrams(s: str) -> set[str]:
+    s = f"  {s.lower()} "
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
+class SuggestionIndex:
+    """Trigram index over valid refs for fast close-match lookups."""
+
+    def __init__(self, refs: Iterable[str], n: int = 3, cutoff: float = 0.6):
+        self.n = n
+        self.cutoff = cutoff
+        self.refs = sorted(set(refs))
+        self.by_server: dict[str, list[str]] = defaultdict(list)
+        self.by_tool: dict[str, set[str]] = defaultdict(set)
+        postings: dict[str, list[str]] = defaultdict(list)
+        for ref in self.refs:
+            server, tool = split_ref(ref) or ("", ref)
+            self.by_server[server].append(ref)
+            self.by_tool[tool].add(server)
+            for gram in _trigrams(ref[4:] if ref.startswith("mcp_") else ref):
+                postings[gram].append(ref)
+        self.postings = {gram: refs for gram, refs in postings.items() if len(refs) <= MAX_POSTINGS}
+        # (length, ref) pairs, for the length-bounded fallback scan
+        self.by_length = sorted((len(ref), ref) for ref in self.refs)
+
+    def _candidates(self, ref: str) -> list[str]:
+        """Refs sharing the most indexed trigrams with ref (at most MAX_CANDIDATES).
+
+        If ref shares no indexed trigram with any ref, every ref whose length allows a
+        ratio >= cutoff (2 * min(len) / total, difflib's real_quick_ratio bound).
+        """
+        shared: Counter[str] = Counter()
+        for gram in _trigrams(ref[4:] if ref.startswith("mcp_") else ref):
+            shared.update(self.postings.get(gram, ()))
+        if shared:
+            return [cand for cand, _ in shared.most_common(MAX_CANDIDATES)]
+        lo = bisect_left(self.by_length, (len(ref) * self.cutoff / (2 - self.cutoff),))
+        hi = bisect_right(self.by_length, (len(ref) * (2 - self.cutoff) / self.cutoff, "\uffff"))
+        return [cand for _, cand in self.by_length[lo:hi]]
+
+    def suggest(self, ref: str) -> list[str]:
+        """Up to n valid refs with SequenceMatcher ratio >= cutoff, best first (as get_close_matches)."""
+        s = SequenceMatcher()
+        s.set_seq2(ref)
+        scored = []
+        for cand in self._candidates(ref):
+            s.set_seq1(cand)
+            if (
+                s.real_quick_ratio() >= self.cutoff
+                and s.quick_ratio() >= self.cutoff
+                and (score := s.ratio()) >= self.cutoff
+            ):
+                scored.append((score, cand))
+        return [cand for _, cand in heapq.nlargest(self.n, scored)]
+
+    def servers_with_tool(self, tool: str) -> set[str]:
+        return self.by_tool.get(tool, set())
+
+
+def detect_server_renames(invalid: Iterable[str], index: SuggestionIndex) -> dict[str, tuple[str, int, int]]:
+    """Map each unknown server among invalid refs to (new server, refs resolved, refs total).
+
+    A server counts as renamed when at least RENAME_MIN_REFS of its distinct refs, and at
+    least RENAME_MIN_SHARE of them, exist with the same tool name under one known server.
+    """
+    tools_by_server: dict[str, set[str]] = defaultdict(set)
+    for ref in invalid:
+        parts = split_ref(ref)
+        if parts is not None and parts[0] not in index.by_server:
+            tools_by_server[parts[0]].add(parts[1])
+    renames = {}
+    for old, tools in sorted(tools_by_server.items()):
+        votes: Counter[str] = Counter()
+        for tool in tools:
+            votes.update(index.servers_with_tool(tool))
+        if not votes:
+            continue
+        new, hits = min(votes.items(), key=lambda kv: (-kv[1], kv[0]))
+        if hits >= RENAME_MIN_REFS and hits >= RENAME_MIN_SHARE * len(tools):
+            renames[old] = (new, hits, len(tools))
+    return renames
+
+
+def typos(ref: str) -> Iterator[str]:
+    """Deterministic misspellings of ref: a dropped, doubled or swapped character in the tool
+    name, and the tool under a misspelled server."""
+    parts = split_ref(ref)
+    if parts is None or len(parts[1]) < 2:
+        return
+    server, tool = parts
+    prefix = f"mcp_{server}_"
+    mid = len(tool) // 2
+    yield prefix + tool[:mid] + tool[mid + 1 :]
+    yield prefix + tool[:mid] + tool[mid] + tool[mid:]
+    yield prefix + tool[: mid - 1] + tool[mid] + tool[mid - 1] + tool[mid + 1 :]
+    yield f"mcp_{server[:-1]}_{tool}"
+
+
+def verify() -> int:
+    """Compare suggest() with get_close_matches over every valid ref on typos of every valid ref."""
+    valid = sorted(get_valid_refs())
+    index = SuggestionIndex(valid)
+    checked = mismatches = 0
+    for ref in valid:
+        for query in typos(ref):
+            checked += 1
+            want, got = get_close_matches(query, valid), index.suggest(query)
+            if want != got:
+                mismatches += 1
+                if mismatches <= 10:
+                    print(f"Mismatch for {query}:\n  difflib: {want}\n  index:   {got}", file=sys.stderr)
+    if mismatches:
+        print(f"Suggestion check failed: {mismatches} of {checked} queries differ from difflib", file=sys.stderr)
+        return 1
+    print(f"OK: suggestions match difflib.get_close_matches on {checked} queries over {len(valid)} refs")
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["--verify"]:
+        print(__doc__.strip(), file=sys.stderr)
+        sys.exit(1)
+    sys.exit(verify())
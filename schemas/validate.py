@@ -2,93 +2,59 @@
 """
 Validates a skill markdown file (e.g. skills/<name>/SKILL.md body) against schemas/skill.schema.json.
 
-Usage: python schemas/validate.py <path>
+Usage: python schemas/validate.py <path> [--format jsonl|sarif] [--profile ...]
 Example: python schemas/validate.py skills/create-plan/SKILL.md
+         --format writes findings to stdout as JSON Lines or SARIF (see diagnostics.py).
+         --profile reports parse/schema timings to stderr (see profiling.py).
 
 Supports:
 - skills/<name>/SKILL.md — strips YAML frontmatter (--- ... ---), validates body
 
-Parses ## Overview, ## Definitions, ## Prerequisites, ## Steps, ## Tools, ## Guidance,
-extracts step numbers from Steps, and MCP refs (mcp_Server_ToolName) from the content.
+Errors that map to a section heading or MCP ref are reported as <path>:<line>:<col>.
+Parsing lives in skill_parser.py (## sections, step numbers, MCP refs); validation runs
+through engine.py. parse_skill_md and strip_frontmatter are re-exported here.
 """
 
-import json
-import re
 import sys
 from pathlib import Path
 
-from jsonschema import Draft7Validator
+SCHEMAS_DIR = Path(__file__).resolve().parent
 
-SECTION_NAMES = ["Overview", "Definitions", "Prerequisites", "Steps", "Tools", "Guidance"]
-MCP_REF_PATTERN = re.compile(r"mcp_[A-Za-z0-9-]+_[a-zA-Z0-9_]+")
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
 
-
-def parse_skill_md(md: str) -> dict:
-    chunks = re.split(r"\r?\n## ", md)
-    found = {}
-
-    for i in range(1, len(chunks)):
-        part = chunks[i]
-        idx = part.find("\n")
-        name = (part[:idx] if idx >= 0 else part).strip()
-        body = part[idx + 1 :].strip() if idx >= 0 else ""
-        if name in SECTION_NAMES:
-            found[name] = body
-
-    steps_content = found.get("Steps", "")
-    # Match "1.", "2." but not "0.1" (decimal): digit(s) + dot not followed by digit
-    steps_numbers = [
-        int(m.group(1))
-        for m in re.finditer(r"(\d+)\.(?!\d)", steps_content)
-        if int(m.group(1)) >= 1
-    ]
-
-    mcp_refs = list(dict.fromkeys(MCP_REF_PATTERN.findall(md)))
-
-    parsed = {
-        "overview": found.get("Overview", ""),
-        "definitions": found.get("Definitions", ""),
-        "prerequisites": found.get("Prerequisites", ""),
-        "steps": {"content": steps_content, "numbers": steps_numbers},
-        "tools": found.get("Tools", ""),
-        "guidance": found.get("Guidance", ""),
-    }
-    if mcp_refs:
-        parsed["mcpRefs"] = mcp_refs
-
-    return parsed
-
-
-def strip_frontmatter(md: str) -> str:
-    """If content has YAML frontmatter (--- ... ---), return body only."""
-    if not md.strip().startswith("---"):
-        return md
-    parts = md.split("---", 2)
-    if len(parts) < 3:
-        return md
-    return parts[2].lstrip("\n")
+from diagnostics import Diagnostic, open_emitter, parse_format
+from engine import result_diagnostics, validate_skill
+from locations import format_location
+from profiling import enable_from_args
+from skill_parser import MCP_REF_PATTERN, SECTION_NAMES, parse_skill_md, strip_frontmatter  # noqa: F401
 
 
 def main() -> None:
-    md_path = sys.argv[1] if len(sys.argv) > 1 else "skills/create-plan/SKILL.md"
-    schema_path = Path(__file__).parent / "skill.schema.json"
+    fmt, args = parse_format(enable_from_args(sys.argv[1:]))
+    md_path = args[0] if args else "skills/create-plan/SKILL.md"
+
+    if fmt:
+        emitter = open_emitter(fmt, "validate")
+        if not Path(md_path).exists():
+            emitter.emit(Diagnostic(md_path, "file-error", "File not found"))
+        else:
+            for diag in result_diagnostics(validate_skill(Path(md_path))):
+                emitter.emit(diag)
+        emitter.close()
+        sys.exit(1 if emitter.count else 0)
 
     if not Path(md_path).exists():
         print(f"File not found: {md_path}", file=sys.stderr)
         sys.exit(1)
 
-    raw = Path(md_path).read_text(encoding="utf-8")
-    md = strip_frontmatter(raw)
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    parsed = parse_skill_md(md)
-
-    validator = Draft7Validator(schema)
-    errors = list(validator.iter_errors(parsed))
+    result = validate_skill(Path(md_path))
 
-    if errors:
+    if result.errors:
         print(f"Validation failed for {md_path}:", file=sys.stderr)
-        for e in errors:
-            print(f"  {e.json_path}: {e.message}", file=sys.stderr)
+        for e in result.errors:
+            print(f"  {format_location(md_path, e.line, e.col)}: {e.message}", file=sys.stderr)
         sys.exit(1)
 
     print(f"OK: {md_path} validates against skill.schema.json")
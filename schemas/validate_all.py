@@ -1,85 +1,109 @@
 #!/usr/bin/env python3
 """
-Run skill, mcps, and MCP ref validation. Exit 0 only if all pass.
-
-Usage: python schemas/validate_all.py
-
-- Skills: runs schemas/validate.py on every skills/*/SKILL.md.
-- Mcps: runs schemas/validate_mcps.py (validates all mcps/**/*.json).
-- MCP refs: runs schemas/validate_mcp_refs.py (validates mcp_<server>_<tool> in skills and docs against mcps/).
-
+Run skill, mcps, MCP ref and spec validation. Exit 0 only if all pass.
+
+Usage: python schemas/validate_all.py [--jobs N] [--no-cache] [--deep] [--since REF] [--format jsonl|sarif]
+                                     [--profile] [--profile-json FILE] [--profile-cprofile FILE] [--profile-top N]
+       --jobs N splits files across N worker processes (0 = one per CPU); output is
+       identical to a serial run.
+       --since REF validates only what changed since REF (git diff --name-only REF plus
+       untracked files): changed skills and MCP JSONs, refs in changed skills/docs, refs
+       anywhere to MCP tools changed or deleted since REF, and the specs of changed skills
+       plus changed specs. Falls back to a full run when a schemas/ file or
+       specs/TEMPLATE.md changed or git cannot diff against REF.
+       --deep also meta-validates each MCP tool's inputSchema/outputSchema and checks that
+       required names are declared properties (see deep_schema.py).
+       --format streams findings to stdout as JSON Lines or SARIF (see diagnostics.py).
+       --profile prints per-phase wall time, call counts, cache hits and the slowest files to
+       stderr; --profile-json also writes them as JSON, --profile-cprofile dumps cProfile
+       stats (see profiling.py). Profiling runs serially so every phase is measured.
+       Results for unchanged files are reused from .cache/validation-cache.json;
+       --no-cache ignores and does not update it.
+
+- Skills: validates every skills/*/SKILL.md against skill.schema.json.
+- Mcps: validates all mcps/**/*.json against mcp-tool.schema.json.
+- MCP refs: validates mcp_<server>_<tool> in skills and docs against mcps/.
+- Specs: validates specs/*/spec.md against specs/TEMPLATE.md and pairs each skill with its
+  spec (see spec_index.py).
+
+All four run in this process via engine.py (each validator is built once).
 Use before commit; CI will run this single entry point.
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
 SCHEMAS_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCHEMAS_DIR.parent
-SKILLS_DIR = REPO_ROOT / "skills"
 
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
 
-def main() -> None:
-    validate_py = SCHEMAS_DIR / "validate.py"
-    validate_mcps_py = SCHEMAS_DIR / "validate_mcps.py"
-
-    skill_files = sorted(SKILLS_DIR.glob("*/SKILL.md"))
+from cache import ValidationCache
+from diagnostics import open_emitter, parse_format
+from engine import changes_since, iter_diagnostics, print_failures, print_warnings, run_all, run_since
+from parallel import parse_jobs
+from profiling import enable_from_args
 
-    failures: list[tuple[Path, str]] = []
-    for p in skill_files:
-        rel = p.relative_to(REPO_ROOT)
-        r = subprocess.run(
-            [sys.executable, str(validate_py), str(rel)],
-            cwd=REPO_ROOT,
-            capture_output=True,
-            text=True,
-        )
-        if r.returncode != 0:
-            failures.append((rel, r.stderr or "validation failed"))
 
-    mcps_failed = False
-    mcps_stderr = ""
-    r = subprocess.run(
-        [sys.executable, str(validate_mcps_py)],
-        cwd=REPO_ROOT,
-        capture_output=True,
-        text=True,
-    )
-    if r.returncode != 0:
-        mcps_failed = True
-        mcps_stderr = r.stderr or ""
-
-    validate_mcp_refs_py = SCHEMAS_DIR / "validate_mcp_refs.py"
-    mcp_refs_failed = False
-    mcp_refs_stderr = ""
-    r = subprocess.run(
-        [sys.executable, str(validate_mcp_refs_py)],
-        cwd=REPO_ROOT,
-        capture_output=True,
-        text=True,
-    )
-    if r.returncode != 0:
-        mcp_refs_failed = True
-        mcp_refs_stderr = r.stderr or ""
-
-    if failures:
+def main() -> None:
+    jobs, args = parse_jobs(enable_from_args(sys.argv[1:]))
+    since = None
+    if "--since" in args:
+        i = args.index("--since")
+        if i + 1 >= len(args):
+            print("--since requires a git ref", file=sys.stderr)
+            sys.exit(1)
+        since = args[i + 1]
+    fmt, args = parse_format(args)
+    cache = None if "--no-cache" in args else ValidationCache()
+    deep = "--deep" in args
+    if fmt:
+        changes = changes_since(since, jobs) if since else None
+        emitter = open_emitter(fmt, "validate_all")
+        failed = False
+        for diag in iter_diagnostics(jobs, cache, changes, deep):
+            emitter.emit(diag)
+            failed = failed or diag.level == "error"
+        emitter.close()
+        if cache is not None:
+            cache.save()
+        sys.exit(1 if failed else 0)
+
+    report = run_since(since, jobs, cache, deep) if since else None
+    full = report is None
+    if since and full:
+        print(f"Schemas changed or cannot diff against {since}; validating everything.", file=sys.stderr)
+    if full:
+        report = run_all(jobs, cache, deep)
+    if cache is not None:
+        cache.save()
+
+    if not all(r.ok for r in report.skills):
         print("Validation failed (skills):", file=sys.stderr)
-        for rel, err in failures:
-            snippet = (err.strip() or "(no stderr)").split("\n")[0]
-            print(f"  {rel}: {snippet}", file=sys.stderr)
-    if mcps_failed:
+        print_failures(report.skills)
+    if not all(r.ok for r in report.mcps):
         print("Validation failed (mcps):", file=sys.stderr)
-        print(mcps_stderr, file=sys.stderr)
-    if mcp_refs_failed:
+        print_failures(report.mcps)
+    if report.refs:
         print("Validation failed (mcp refs):", file=sys.stderr)
-        print(mcp_refs_stderr, file=sys.stderr)
-
-    if failures or mcps_failed or mcp_refs_failed:
+        for line in report.refs:
+            print(f"  {line}", file=sys.stderr)
+    if not all(r.ok for r in report.specs):
+        print("Validation failed (specs):", file=sys.stderr)
+        print_failures(report.specs)
+    if any(r.warnings for r in report.specs):
+        print("Warnings (specs):", file=sys.stderr)
+        print_warnings(report.specs)
+
+    if not report.ok:
         sys.exit(1)
 
-    n = len(skill_files)
-    print(f"OK: all skills ({n}), mcps, and mcp refs validate.")
+    n = len(report.skills)
+    if since and not full:
+        print(f"OK: changed skills ({n}), mcps ({len(report.mcps)}), specs ({len(report.specs)}), and mcp refs since {since} validate.")
+    else:
+        print(f"OK: all skills ({n}), specs ({len(report.specs)}), mcps, and mcp refs validate.")
     sys.exit(0)
 
 
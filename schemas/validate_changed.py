@@ -1,86 +1,117 @@
 #!/usr/bin/env python3
 """
-Validate only changed skill and MCP files (for pre-commit hooks).
+Validate only changed skill, MCP and spec files (for pre-commit hooks).
 
 Usage: python schemas/validate_changed.py [file1] [file2] ...
        Or via pre-commit: automatically receives changed file paths
 
 This script validates only the files passed as arguments, unlike validate_all.py
 which validates all files. Used by pre-commit hooks to validate only changed files.
+Validation runs in this process via engine.py.
+
+For MCP tool files, only the changed files are validated. Refs in skills and docs are then
+re-checked only for the tools those files (and tool files deleted in the index) defined, so
+a renamed or deleted tool is caught without sweeping all of mcps/.
+
+A changed skills/<name>/SKILL.md or specs/<name>/spec.md re-checks that spec and its pairing
+with the skill (see spec_index.py); a changed specs/TEMPLATE.md re-checks every spec.
+
+When a validation daemon is running (python schemas/daemon.py start), the check is sent to
+it and answered from its warm validators; otherwise it runs in this process.
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
 SCHEMAS_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCHEMAS_DIR.parent
-SKILLS_DIR = REPO_ROOT / "skills"
-MCPS_DIR = REPO_ROOT / "mcps"
 
-validate_py = SCHEMAS_DIR / "validate.py"
-validate_mcps_py = SCHEMAS_DIR / "validate_mcps.py"
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
 
+import daemon
 
-def main() -> None:
-    if len(sys.argv) < 2:
+
+def run(args: list[str], cache=None) -> int:
+    """Validate the given skill/MCP/spec paths; print results and return the exit code.
+
+    cache is an optional ValidationCache (the daemon passes its in-memory one).
+    """
+    # Imported here so the daemon client path starts without loading jsonschema
+    from engine import (
+        SKILL_OR_SPEC,
+        FileResult,
+        check_changed_tool_refs,
+        print_failures,
+        print_warnings,
+        staged_deleted_tools,
+        skill_refs,
+        validate_mcp_tools,
+        validate_skills,
+        validate_specs,
+    )
+
+    if not args:
         # No files provided - nothing to validate
         print("No files to validate")
-        sys.exit(0)
+        return 0
 
     # Get file paths from command line arguments
-    file_paths = [Path(arg) for arg in sys.argv[1:]]
-    
+    file_paths = [Path(arg) for arg in args]
+
     # Separate into skills and mcps
     skill_files = []
     mcp_files = []
-    
+    spec_names: set[str] | None = set()
+
     for file_path in file_paths:
         rel_path = file_path if file_path.is_absolute() else REPO_ROOT / file_path
         rel = rel_path.relative_to(REPO_ROOT)
-        
+
         if str(rel).startswith("skills/") and rel.name == "SKILL.md":
             skill_files.append(rel)
         elif str(rel).startswith("mcps/") and rel.suffix == ".json":
             mcp_files.append(rel)
+        if rel.as_posix() == "specs/TEMPLATE.md":
+            spec_names = None
+        elif spec_names is not None and len(rel.parts) == 3 and (rel.parts[0], rel.parts[2]) in SKILL_OR_SPEC:
+            spec_names.add(rel.parts[1])
+
+    results: list[FileResult] = validate_skills([REPO_ROOT / rel for rel in skill_files], cache=cache)
+    refs = skill_refs(results)
+
+    # Validate only the changed tool files that still exist (deletions only affect refs)
+    existing = [REPO_ROOT / rel for rel in mcp_files if (REPO_ROOT / rel).exists()]
+    results.extend(validate_mcp_tools(existing, cache=cache))
+    if spec_names is None or spec_names:
+        # Every spec: refs covers only the changed skills, so the others are scanned
+        names = None if spec_names is None else sorted(spec_names)
+        results.extend(validate_specs(refs if names else None, names, cache=cache))
+    ref_errors = check_changed_tool_refs([REPO_ROOT / rel for rel in mcp_files] + staged_deleted_tools())
 
-    failures: list[tuple[Path, str]] = []
-    
-    # Validate skill files
-    for rel in skill_files:
-        r = subprocess.run(
-            [sys.executable, str(validate_py), str(rel)],
-            cwd=REPO_ROOT,
-            capture_output=True,
-            text=True,
-        )
-        if r.returncode != 0:
-            failures.append((rel, r.stderr or "validation failed"))
-
-    # Validate MCP files (validate_mcps.py validates all mcps, but we can check if files exist)
-    if mcp_files:
-        # Run full MCP validation if any MCP files changed
-        r = subprocess.run(
-            [sys.executable, str(validate_mcps_py)],
-            cwd=REPO_ROOT,
-            capture_output=True,
-            text=True,
-        )
-        if r.returncode != 0:
-            failures.append((Path("mcps"), r.stderr or "MCP validation failed"))
-
-    if failures:
+    if any(r.warnings for r in results):
+        print("Warnings:", file=sys.stderr)
+        print_warnings(results)
+    failures = [r for r in results if not r.ok]
+    if failures or ref_errors:
         print("Validation failed:", file=sys.stderr)
-        for rel, err in failures:
-            snippet = (err.strip() or "(no stderr)").split("\n")[0]
-            print(f"  {rel}: {snippet}", file=sys.stderr)
-        sys.exit(1)
+        print_failures(failures)
+        for line in ref_errors:
+            print(f"  {line}", file=sys.stderr)
+        return 1
 
-    if skill_files or mcp_files:
-        print(f"OK: validated {len(skill_files)} skill(s) and {len(mcp_files)} MCP file(s)")
+    n_specs = sum(1 for r in results if r.kind == "spec")
+    if skill_files or mcp_files or n_specs:
+        print(f"OK: validated {len(skill_files)} skill(s), {len(mcp_files)} MCP file(s) and {n_specs} spec(s)")
     else:
         print("No files to validate")
-    sys.exit(0)
+    return 0
+
+
+def main() -> None:
+    code = daemon.request("validate_changed", sys.argv[1:])
+    sys.exit(run(sys.argv[1:]) if code is None else code)
 
 
 if __name__ == "__main__":
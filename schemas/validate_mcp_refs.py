@@ -4,86 +4,190 @@ Validate MCP tool refs in skill and doc files against mcps/ (list of record).
 
 Extracts mcp_<server>_<tool> from skills/*/SKILL.md (body only) and docs/skills/*.md;
 validates against get_valid_refs() from validate_mcps,
-reports invalid refs with fuzzy suggestions. Exit 1 if any invalid.
+reports invalid refs (file:line:column, positions in the file on disk) with fuzzy
+suggestions from an indexed lookup (suggest.py); a server whose refs all moved to another
+server is reported once as a rename. Exit 1 if any invalid.
 
-Usage: python schemas/validate_mcp_refs.py
+Usage: python schemas/validate_mcp_refs.py [--jobs N] [--format jsonl|sarif] [--profile ...]
+       --jobs N scans files across N worker processes (0 = one per CPU).
+       --format streams findings to stdout as JSON Lines or SARIF (see diagnostics.py).
+       --profile reports per-phase timings and the slowest files (see profiling.py).
 
 Use before commit; validate_all.py runs this after validate_mcps.
 """
 
-import difflib
-import re
 import sys
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
 SCHEMAS_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCHEMAS_DIR.parent
 SKILLS_DIR = REPO_ROOT / "skills"
 DOCS_SKILLS_DIR = REPO_ROOT / "docs" / "skills"
 
-
-def _strip_frontmatter(text: str) -> str:
-    """If content has YAML frontmatter (--- ... ---), return body only."""
-    if not text.strip().startswith("---"):
-        return text
-    parts = text.split("---", 2)
-    return parts[2].lstrip("\n") if len(parts) >= 3 else text
-
 # Allow importing validate_mcps when run as script
 if str(SCHEMAS_DIR) not in sys.path:
     sys.path.insert(0, str(SCHEMAS_DIR))
 
-from validate_mcps import get_valid_refs
+from diagnostics import Diagnostic, open_emitter, parse_format
+from extract import extract
+from locations import format_location
+from parallel import parallel_imap, parse_jobs
+from profiling import enable_from_args, phase
+from suggest import SuggestionIndex, detect_server_renames
+from validate_mcps import get_valid_refs, split_ref
 
-# Match mcp_<server>_<tool>; server/tool can have alphanumeric, -, _
-MCP_REF_RE = re.compile(r"mcp_([a-zA-Z0-9-]+)_([a-zA-Z0-9_]+)")
+# (path, line, column, ref); line/column are 1-based positions in the file on disk
+RefHit = tuple[Path, int, int, str]
 
 
-def _line_no(text: str, pos: int) -> int:
-    return text[:pos].count("\n") + 1
+def _scan(path: Path, strip_fm: bool, wanted: Callable[[str], bool]) -> list[RefHit]:
+    """Return the first occurrence of each distinct ref in path for which wanted(ref) is true.
 
+    Uses the file's shared extraction (extract.py); with strip_fm, frontmatter is skipped,
+    but positions still refer to the whole file.
+    """
+    with phase("ref-scan", path):
+        refs = extract(path, frontmatter=strip_fm).refs
+    return [(path, line, col, ref) for ref, (line, col) in refs.items() if wanted(ref)]
 
-def _scan_file(path: Path, valid: set[str], strip_fm: bool = False) -> list[tuple[Path, int, str]]:
-    text = path.read_text(encoding="utf-8")
-    if strip_fm:
-        text = _strip_frontmatter(text)
-    invalid: list[tuple[Path, int, str]] = []
-    seen: set[str] = set()
-    for m in MCP_REF_RE.finditer(text):
-        ref = m.group(0)
-        if ref in seen or ref in valid:
-            continue
-        seen.add(ref)
-        line = _line_no(text, m.start())
-        invalid.append((path, line, ref))
-    return invalid
 
+def _scan_file(path: Path, valid: set[str], strip_fm: bool = False) -> list[RefHit]:
+    return _scan(path, strip_fm, lambda ref: ref not in valid)
 
-def main() -> None:
-    valid = get_valid_refs()
-    files: list[tuple[Path, bool]] = []  # (path, strip_frontmatter)
+
+def ref_files() -> list[tuple[Path, bool]]:
+    """Return (path, strip_frontmatter) for every file whose MCP refs are checked."""
+    with phase("discover"):
+        return _ref_files()
+
+
+def _ref_files() -> list[tuple[Path, bool]]:
+    files: list[tuple[Path, bool]] = []
     if SKILLS_DIR.exists():
         for p in sorted(SKILLS_DIR.glob("*/SKILL.md")):
             files.append((p, True))
     if DOCS_SKILLS_DIR.exists():
         for p in sorted(DOCS_SKILLS_DIR.glob("*.md")):
             files.append((p, False))
+    return files
+
+
+# Valid refs for _scan_task, set once per worker by _init_scan
+_valid: set[str] = set()
+
+
+def _init_scan(valid: set[str]) -> None:
+    global _valid
+    _valid = valid
+
+
+def _scan_task(item: tuple[Path, bool]) -> list[RefHit]:
+    path, strip_fm = item
+    return _scan_file(path, _valid, strip_fm=strip_fm)
+
 
-    all_invalid: list[tuple[Path, int, str]] = []
-    for p, strip_fm in files:
-        all_invalid.extend(_scan_file(p, valid, strip_fm=strip_fm))
+def iter_invalid_refs(
+    valid: set[str] | None = None, jobs: int = 1, files: list[tuple[Path, bool]] | None = None
+) -> Iterator[RefHit]:
+    """Yield (path, line, column, ref) for every ref not in mcps/, file by file as each is scanned."""
+    if valid is None:
+        valid = get_valid_refs()
+    if files is None:
+        files = ref_files()
+    for invalid in parallel_imap(_scan_task, files, jobs, initializer=_init_scan, initargs=(valid,)):
+        yield from invalid
+
+
+def find_invalid_refs(
+    valid: set[str] | None = None, jobs: int = 1, files: list[tuple[Path, bool]] | None = None
+) -> list[RefHit]:
+    """Scan skills and docs (or just files); return (path, line, column, ref) for every ref not in mcps/."""
+    return list(iter_invalid_refs(valid, jobs, files))
+
+
+def find_refs(refs: set[str], files: list[tuple[Path, bool]] | None = None) -> list[RefHit]:
+    """Scan skills and docs (or just files, a subset of ref_files()); return (path, line, column, ref) for each ref in refs.
+
+    Used to re-check only the refs a change could break (e.g. renamed or deleted tools).
+    One entry per (file, ref), at its first occurrence, like _scan_file.
+    """
+    if not refs:
+        return []
+    if files is None:
+        files = ref_files()
+    return [hit for p, strip_fm in files for hit in _scan(p, strip_fm, refs.__contains__)]
+
+
+def format_invalid(all_invalid: list[RefHit], valid: set[str]) -> list[str]:
+    """Render invalid refs as "<rel>:<line>:<col>: <ref> [Did you mean: ...?]" lines.
+
+    Refs covered by a detected server rename get no per-ref suggestions; one summary line
+    per renamed server is appended instead.
+    """
+    index = SuggestionIndex(valid)
+    renames = detect_server_renames((ref for *_, ref in all_invalid), index)
+    suggestions: dict[str, list[str]] = {}
+    lines = []
+    for path, line, col, ref in all_invalid:
+        rel = path.relative_to(REPO_ROOT)
+        suffix = ""
+        parts = split_ref(ref)
+        renamed = parts is not None and parts[0] in renames
+        if not (renamed and f"mcp_{renames[parts[0]][0]}_{parts[1]}" in valid):
+            if ref not in suggestions:
+                with phase("suggest"):
+                    suggestions[ref] = index.suggest(ref)
+            if suggestions[ref]:
+                suffix = f" [Did you mean: {', '.join(suggestions[ref])}?]"
+        lines.append(f"{format_location(rel, line, col)}: {ref}{suffix}")
+    for old, (new, hits, total) in renames.items():
+        lines.append(f"Server renamed? mcp_{old}_* -> mcp_{new}_* ({hits} of {total} tool(s) exist under {new})")
+    return lines
+
+
+def ref_diagnostics(hits: Iterable[RefHit], valid: set[str]) -> Iterator[Diagnostic]:
+    """Yield one Diagnostic per invalid ref hit as it arrives, then one per detected server rename.
+
+    Unlike format_invalid, suggestions are never suppressed (renames are only known once
+    every hit has been seen); only the distinct invalid refs are kept in memory.
+    """
+    index = SuggestionIndex(valid)
+    suggestions: dict[str, list[str]] = {}
+    first_file: dict[str, str] = {}
+    for path, line, col, ref in hits:
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        if ref not in suggestions:
+            with phase("suggest"):
+                suggestions[ref] = index.suggest(ref)
+            first_file.setdefault(ref, rel)
+        yield Diagnostic(rel, "mcp-ref", f"Unknown MCP tool ref {ref}", line, col, suggestions=suggestions[ref])
+    renames = detect_server_renames(suggestions, index)
+    for old, (new, hits_n, total) in renames.items():
+        where = next(rel for ref, rel in first_file.items() if split_ref(ref) and split_ref(ref)[0] == old)
+        message = f"Server renamed? mcp_{old}_* -> mcp_{new}_* ({hits_n} of {total} tool(s) exist under {new})"
+        yield Diagnostic(where, "mcp-server-rename", message, level="warning", suggestions=[f"mcp_{new}_*"])
+
+
+def main() -> None:
+    jobs, args = parse_jobs(enable_from_args(sys.argv[1:]))
+    fmt, _ = parse_format(args)
+    valid = get_valid_refs()
+    if fmt:
+        emitter = open_emitter(fmt, "validate_mcp_refs")
+        for diag in ref_diagnostics(iter_invalid_refs(valid, jobs), valid):
+            emitter.emit(diag)
+        emitter.close()
+        sys.exit(1 if emitter.count else 0)
+    all_invalid = find_invalid_refs(valid, jobs)
 
     if not all_invalid:
         print("OK: all MCP tool refs in skills/docs validate.")
         sys.exit(0)
 
-    valid_list = sorted(valid)
     print("Invalid MCP tool ref(s):", file=sys.stderr)
-    for path, line, ref in all_invalid:
-        rel = path.relative_to(REPO_ROOT)
-        suggestions = difflib.get_close_matches(ref, valid_list, n=3, cutoff=0.6)
-        suffix = f" [Did you mean: {', '.join(suggestions)}?]" if suggestions else ""
-        print(f"  {rel}:{line}: {ref}{suffix}", file=sys.stderr)
+    for line in format_invalid(all_invalid, valid):
+        print(f"  {line}", file=sys.stderr)
     sys.exit(1)
 
 
@@ -5,86 +5,168 @@ Validate mcps/<server>/tools/*.json against schemas/mcp-tool.schema.json.
 mcps/ is the list of record: the set of MCP tools we support. Use --list to enumerate.
 
 Usage:
-  python schemas/validate_mcps.py
-    → Validate all mcps/**/*.json; exit 0 only if all pass.
+  python schemas/validate_mcps.py [--jobs N] [--no-cache] [--deep] [--format jsonl|sarif] [--profile ...]
+    → Validate all mcps/**/*.json; exit 0 only if all pass. --jobs N splits files across
+      N worker processes (0 = one per CPU); output is identical to a serial run.
+      Unchanged files are served from .cache/validation-cache.json unless --no-cache.
+      --format streams findings to stdout as JSON Lines or SARIF (see diagnostics.py).
+      --profile reports per-phase timings and the slowest files (see profiling.py).
+      --deep also checks each inputSchema/outputSchema against the Draft 7 meta-schema and
+      that every "required" name is a declared property (see deep_schema.py).
 
   python schemas/validate_mcps.py --list [--json]
     → List all tools from mcps/ (list of record). Default: TSV (server, tool, ref, path). --json: JSON array.
 
-  python schemas/validate_mcps.py mcp_Server_Tool
+  python schemas/validate_mcps.py mcp_Server_Tool [--deep]
     → Resolve ref to mcps/Server/tools/Tool.json, validate that file, print path or error.
+
+Tool lookups read the incrementally refreshed index in .cache/mcp-registry.json
+(see registry.py) instead of walking and parsing mcps/ on every call. jsonschema is
+imported only when a validator is built, so --list (and validate_mcp_refs.py, which
+imports this module for lookups) start without it; check with scripts/check_startup.py.
 """
 
 import json
 import sys
 from pathlib import Path
 
-from jsonschema import Draft7Validator
-
-# Known MCP server ids
-KNOWN_SERVERS = ["atlassian", "github", "asdlc", "ado"]
-
 REPO_ROOT = Path(__file__).resolve().parents[1]
-SCHEMA_PATH = REPO_ROOT / "schemas" / "mcp-tool.schema.json"
+SCHEMAS_DIR = REPO_ROOT / "schemas"
+SCHEMA_PATH = SCHEMAS_DIR / "mcp-tool.schema.json"
 MCPS_ROOT = REPO_ROOT / "mcps"
 
+# Allow importing sibling modules when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from cache import ValidationCache, cached_imap
+from compiled_validator import Validator, compile_validator
+from deep_schema import deep_tool_issues
+from diagnostics import Diagnostic, open_emitter, parse_format
+from parallel import parse_jobs
+from profiling import enable_from_args, phase
+from registry import get_registry
+
 
 def load_schema():
     return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
 
 
+def tool_files() -> list[Path]:
+    """Return all mcps/**/*.json in sorted order (the files validated against mcp-tool.schema.json)."""
+    with phase("discover"):
+        return [REPO_ROOT / r["path"] for r in get_registry().records()]
+
+
+def _public(record: dict) -> dict:
+    return {k: record[k] for k in ("server", "tool", "ref", "path")}
+
+
+def tool_record(p: Path) -> dict | None:
+    """Return {server, tool, ref, path} for mcps/<server>/tools/<tool>.json, else None.
+
+    tool is the JSON "name" when readable, falling back to the file stem.
+    """
+    record = get_registry().record_for(p.resolve().relative_to(REPO_ROOT).as_posix())
+    return _public(record) if record is not None and record["ref"] is not None else None
+
+
 def list_tools() -> list[dict]:
     """Enumerate mcps/**/*.json. Returns list of {server, tool, ref, path} (path relative to repo root)."""
-    out = []
-    for p in sorted(MCPS_ROOT.rglob("*.json")):
-        rel = p.relative_to(REPO_ROOT)
-        parts = rel.parts  # e.g. ("mcps", "github", "tools", "list_commits.json")
-        if len(parts) >= 4 and parts[2] == "tools":
-            server = parts[1]
-            tool = p.stem
-            try:
-                data = json.loads(p.read_text(encoding="utf-8"))
-                tool = data.get("name", tool)
-            except Exception:
-                pass
-            ref = f"mcp_{server}_{tool}"
-            out.append({"server": server, "tool": tool, "ref": ref, "path": str(rel)})
-    return out
+    return [_public(r) for r in get_registry().tools()]
 
 
 def get_valid_refs() -> set[str]:
     """Return the set of valid MCP tool refs (mcp_<server>_<tool>) from mcps/."""
-    return {t["ref"] for t in list_tools()}
+    return get_registry().refs()
 
 
-def resolve(ref: str) -> Path | None:
-    """Resolve mcp_Server_Tool to mcps/Server/tools/Tool.json. Returns Path or None if not found."""
+def split_ref(ref: str) -> tuple[str, str] | None:
+    """Split mcp_<server>_<tool> into (server, tool). Server ids contain no underscore."""
     if not ref.startswith("mcp_"):
         return None
-    rest = ref[4:]  # after "mcp_"
-    for server in KNOWN_SERVERS:
-        prefix = server + "_"
-        if rest.startswith(prefix):
-            tool = rest[len(prefix) :]
-            if not tool:
-                return None
-            p = MCPS_ROOT / server / "tools" / f"{tool}.json"
-            return p if p.exists() else None
-    return None
-
-
-def validate_file(path: Path, validator: Draft7Validator) -> list[str]:
-    errs = []
+    server, sep, tool = ref[4:].partition("_")
+    if not server or not sep or not tool:
+        return None
+    return server, tool
+
+
+def is_valid_ref(ref: str) -> bool:
+    """True if ref names a tool in mcps/ (a single registry lookup)."""
+    return get_registry().lookup(ref) is not None
+
+
+def resolve(ref: str) -> Path | None:
+    """Resolve mcp_Server_Tool to mcps/Server/tools/Tool.json. Returns Path or None if not found.
+
+    Looks the ref up by tool name in the registry, then falls back to the file-name rule.
+    Any server directory under mcps/ resolves.
+    """
+    registry = get_registry()
+    record = registry.lookup(ref)
+    if record is not None:
+        return REPO_ROOT / record["path"]
+    parts = split_ref(ref)
+    if parts is None:
+        return None
+    server, tool = parts
+    record = registry.record_for(f"{MCPS_ROOT.name}/{server}/tools/{tool}.json")
+    return REPO_ROOT / record["path"] if record is not None else None
+
+
+def tool_issues(path: Path, validator: Validator, deep: bool = False) -> list[list]:
+    """Validate one tool JSON; return [message, json_path] pairs (message without the path prefix).
+
+    json_path is None for errors that are not schema errors (unreadable or invalid JSON).
+    With deep, inputSchema/outputSchema are also meta-validated (see deep_schema.py).
+    """
+    issues = []
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        for e in validator.iter_errors(data):
-            errs.append(f"{path}: {e.json_path} {e.message}")
+        with phase("mcp-parse", path):
+            data = json.loads(path.read_text(encoding="utf-8"))
+        with phase("mcp-schema", path):
+            for e in validator.iter_errors(data):
+                issues.append([f"{e.json_path} {e.message}", e.json_path])
+        if deep:
+            with phase("mcp-deep", path):
+                issues.extend(deep_tool_issues(data))
     except Exception as ex:
-        errs.append(f"{path}: {ex}")
-    return errs
+        issues.append([str(ex), None])
+    return issues
+
+
+def tool_errors(path: Path, validator: Validator) -> list[str]:
+    """Validate one tool JSON; return error messages without the path prefix."""
+    return [message for message, _ in tool_issues(path, validator)]
+
+
+def validate_file(path: Path, validator: Validator) -> list[str]:
+    return [f"{path}: {e}" for e in tool_errors(path, validator)]
+
+
+def build_validator(check: bool = True) -> Validator:
+    """Validator for mcp-tool.schema.json. jsonschema is imported only here (and only if the
+    schema is checked or cannot be compiled), so --list and ref lookups never load it.
+
+    check=False skips meta-validating the schema itself; resolve-one uses it, since every
+    full run (and CI) checks the schema.
+    """
+    with phase("validator-build", SCHEMA_PATH):
+        schema = load_schema()
+        if check:
+            from jsonschema import Draft7Validator
+
+            Draft7Validator.check_schema(schema)
+        return compile_validator(schema)
 
 
 def main() -> None:
+    jobs, args = parse_jobs(enable_from_args(sys.argv[1:]))
+    fmt, args = parse_format(args)
+    no_cache = "--no-cache" in args
+    deep = "--deep" in args
+    sys.argv[1:] = [a for a in args if a not in ("--no-cache", "--deep")]
+
     # --list: enumerate mcps/ (list of record)
     if len(sys.argv) >= 2 and sys.argv[1] in ("--list", "-l"):
         as_json = "--json" in sys.argv
@@ -97,10 +179,6 @@ def main() -> None:
                 print(f"{t['server']}\t{t['tool']}\t{t['ref']}\t{t['path']}")
         sys.exit(0)
 
-    schema = load_schema()
-    Draft7Validator.check_schema(schema)
-    validator = Draft7Validator(schema)
-
     if len(sys.argv) > 1:
         # Resolve-one mode
         ref = sys.argv[1]
@@ -108,7 +186,7 @@ def main() -> None:
         if p is None:
             print(f"Resolver: no file found for {ref}", file=sys.stderr)
             sys.exit(1)
-        errs = validate_file(p, validator)
+        errs = [f"{p}: {message}" for message, _ in tool_issues(p, build_validator(check=False), deep)]
         if errs:
             for e in errs:
                 print(e, file=sys.stderr)
@@ -116,10 +194,34 @@ def main() -> None:
         print(p)
         sys.exit(0)
 
-    # Validate-all mode
-    all_errs = []
-    for j in sorted(MCPS_ROOT.rglob("*.json")):
-        all_errs.extend(validate_file(j, validator))
+    # Validate-all mode: the same cache entries as validate_all.py (imported here, since
+    # engine loads jsonschema and --list / resolve-one must not)
+    from engine import mcp_tool_deep_entry, mcp_tool_entry
+
+    files = tool_files()
+    cache = None if no_cache else ValidationCache()
+    if deep:
+        entries = cached_imap(cache, "mcp-deep", mcp_tool_deep_entry, files, jobs)
+    else:
+        entries = cached_imap(cache, "mcp", mcp_tool_entry, files, jobs)
+
+    if fmt:
+        emitter = open_emitter(fmt, "validate_mcps")
+        for p, entry in zip(files, entries):
+            rel = p.relative_to(REPO_ROOT).as_posix()
+            for message, json_path in entry["errors"]:
+                if json_path:
+                    emitter.emit(Diagnostic(rel, "mcp-schema", message[len(json_path) + 1 :], json_path=json_path))
+                else:
+                    emitter.emit(Diagnostic(rel, "file-error", message))
+        emitter.close()
+        if cache is not None:
+            cache.save()
+        sys.exit(1 if emitter.count else 0)
+
+    all_errs = [f"{p}: {message}" for p, entry in zip(files, entries) for message, _ in entry["errors"]]
+    if cache is not None:
+        cache.save()
 
     if all_errs:
         print("Validation failed:", file=sys.stderr)
@@ -127,7 +229,7 @@ def main() -> None:
             print(f"  {e}", file=sys.stderr)
         sys.exit(1)
 
-    n = len(list(MCPS_ROOT.rglob("*.json")))
+    n = len(files)
     print(f"OK: all {n} mcps/**/*.json validate against mcp-tool.schema.json")
     sys.exit(0)
 
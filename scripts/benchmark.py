@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark the validators against a synthetic corpus and write machine-readable results.
+
+Usage: python scripts/benchmark.py [--corpus DIR] [--output FILE] [--compare FILE]
+                                   [--repeat N] [--jobs N] [generate_corpus options]
+Example: python scripts/benchmark.py --skills 10000 --tools 5000 --refs 50000
+         python scripts/benchmark.py --compare .cache/benchmark/<old-commit>.json
+
+Generates a corpus with scripts/generate_corpus.py (into a temp dir unless --corpus is
+given), then times each entry point as a subprocess against it:
+
+- validate_all      schemas/validate_all.py [--jobs N]
+- validate_mcp_refs schemas/validate_mcp_refs.py
+- check_links       scripts/check_links.py <every skills/ and docs/ .md file>
+- verify_install    scripts/verify_github_install.py
+
+Each runs "cold" (corpus .cache/ removed first) and then "warm" (caches left in place);
+--repeat N keeps the fastest of N runs per mode. Wall time and peak RSS (from wait4) are
+recorded per run. Exit codes are recorded, not checked: the corpus has invalid refs and
+broken links on purpose.
+
+Results go to --output (default .cache/benchmark/<commit>.json) as JSON with the corpus
+parameters, commit, and Python/platform info, so runs on different commits can be
+compared with --compare. Cold runs here start with a warm OS page cache.
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+DEFAULT_OUTPUT_DIR = REPO_ROOT / ".cache" / "benchmark"
+
+# Allow importing the corpus generator when run as script
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_corpus import generate, parse_args
+
+
+def _commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return "unknown"
+    return out.stdout.strip() or "unknown"
+
+
+def _md_files(corpus: Path) -> list[str]:
+    files = sorted((corpus / "skills").glob("*/SKILL.md")) + sorted((corpus / "docs").rglob("*.md"))
+    return [str(p) for p in files]
+
+
+def commands(corpus: Path, jobs: int) -> dict[str, list[str]]:
+    py = sys.executable
+    validate_all = [py, str(corpus / "schemas" / "validate_all.py")]
+    if jobs != 1:
+        validate_all += ["--jobs", str(jobs)]
+    return {
+        "validate_all": validate_all,
+        "validate_mcp_refs": [py, str(corpus / "schemas" / "validate_mcp_refs.py")],
+        "check_links": [py, str(corpus / "scripts" / "check_links.py"), *_md_files(corpus)],
+        "verify_install": [py, str(corpus / "scripts" / "verify_github_install.py")],
+    }
+
+
+def run_once(cmd: list[str], cwd: Path) -> dict:
+    """Run cmd to completion; return wall seconds, peak RSS (KiB) and exit code."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    seconds = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return {"seconds": round(seconds, 4), "max_rss_kb": rss, "exit_code": proc.returncode}
+
+
+def bench(corpus: Path, jobs: int = 1, repeat: int = 1) -> list[dict]:
+    results = []
+    for name, cmd in commands(corpus, jobs).items():
+        for mode in ("cold", "warm"):
+            runs = []
+            for _ in range(repeat):
+                if mode == "cold":
+                    shutil.rmtree(corpus / ".cache", ignore_errors=True)
+                runs.append(run_once(cmd, corpus))
+            best = min(runs, key=lambda r: r["seconds"])
+            results.append({"name": name, "mode": mode, **best})
+            print(f"  {name:<18} {mode:<5} {best['seconds']:>8.3f}s  {best['max_rss_kb'] / 1024:>7.1f} MiB")
+    return results
+
+
+def compare(old: dict, new: dict) -> None:
+    """Print per-benchmark time deltas between two result files."""
+    before = {(r["name"], r["mode"]): r for r in old.get("results", [])}
+    print(f"Compared with {old.get('commit', '?')}:")
+    for r in new["results"]:
+        prev = before.get((r["name"], r["mode"]))
+        if prev is None or not prev["seconds"]:
+            continue
+        change = (r["seconds"] - prev["seconds"]) / prev["seconds"] * 100
+        print(f"  {r['name']:<18} {r['mode']:<5} {prev['seconds']:>8.3f}s -> {r['seconds']:>8.3f}s ({change:+.1f}%)")
+
+
+def _pop_option(args: list[str], flag: str) -> str | None:
+    if flag in args:
+        i = args.index(flag)
+        if i + 1 >= len(args):
+            raise SystemExit(f"Missing value for {flag}")
+        value = args[i + 1]
+        del args[i : i + 2]
+        return value
+    return None
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(__doc__)
+        return
+    corpus_arg = _pop_option(args, "--corpus")
+    output_arg = _pop_option(args, "--output")
+    compare_arg = _pop_option(args, "--compare")
+    repeat = int(_pop_option(args, "--repeat") or 1)
+    jobs = int(_pop_option(args, "--jobs") or 1)
+
+    tmp = None
+    if corpus_arg:
+        corpus = Path(corpus_arg).resolve()
+    else:
+        tmp = tempfile.TemporaryDirectory(prefix="skills-bench-")
+        corpus = Path(tmp.name)
+    try:
+        _, gen_kwargs = parse_args([str(corpus), *args])
+        start = time.perf_counter()
+        params = generate(corpus, **gen_kwargs)
+        print(f"Generated corpus in {time.perf_counter() - start:.1f}s: {json.dumps(params)}")
+        results = bench(corpus, jobs, repeat)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    commit = _commit()
+    data = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "jobs": jobs,
+        "repeat": repeat,
+        "corpus": params,
+        "results": results,
+    }
+    output = Path(output_arg) if output_arg else DEFAULT_OUTPUT_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {output}")
+
+    if compare_arg:
+        try:
+            old = json.loads(Path(compare_arg).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Cannot read {compare_arg}: {e}", file=sys.stderr)
+            sys.exit(1)
+        compare(old, data)
+
+
+if __name__ == "__main__":
+    main()
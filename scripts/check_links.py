@@ -2,37 +2,98 @@
 """
 Check markdown links in changed files (for pre-commit hooks).
 
-Usage: python scripts/check_links.py [file1] [file2] ...
+Usage: python scripts/check_links.py [--external] [--format jsonl|sarif] [--profile ...] [file1] [file2] ...
        Or via pre-commit: automatically receives changed file paths
 
-This script checks links in markdown files. For now, it performs basic validation.
-Full link checking (including external URLs) is handled by CI/CD.
+This script checks links in markdown files. By default external URLs are only
+syntax-checked; full external checking is handled by CI/CD. --external also fetches every
+http(s) link (each unique URL once, concurrently; see schemas/external_links.py), reusing
+results verified within the last day from .cache/external-links.json.
+Relative and absolute link targets are resolved against a one-time index of every path in
+the repo (schemas/link_index.py) instead of a filesystem stat per link, and #fragments
+pointing into markdown files must match a heading anchor in that file.
+Errors name the file, line, and column of the link target (e.g. in README.md:12:8).
+--format streams findings to stdout as JSON Lines or SARIF (see schemas/diagnostics.py).
+--profile reports index, per-file check, anchor and external timings (see schemas/profiling.py).
+When a validation daemon is running (python schemas/daemon.py start), the check is sent to
+it; otherwise it runs in this process.
 """
 
-import re
 import sys
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterator
+from urllib.parse import unquote, urldefrag, urlparse
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
+SCHEMAS_DIR = REPO_ROOT / "schemas"
 
+# Allow importing the shared helpers in schemas/ when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
 
-def check_file_links(file_path: Path) -> list[str]:
-    """Check links in a markdown file and return list of errors."""
-    errors = []
+import daemon
+from diagnostics import Diagnostic, open_emitter, parse_format
+from external_links import ExternalLinkCache, check_urls
+from extract import extract
+from link_index import LinkTargetIndex
+from locations import format_location
+from profiling import enable_from_args, phase
+
+
+def _rel(file_path: Path) -> str:
+    try:
+        return file_path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(file_path)
+
+
+def _fragment_ok(index: LinkTargetIndex, target: Path, url: str) -> bool:
+    """False if url's #fragment names no heading in the markdown file target."""
+    _, _, fragment = url.partition("#")
+    fragment = unquote(fragment)
+    if not fragment or "{" in fragment or target.suffix != ".md":
+        return True
+    anchors = index.anchors(target)
+    return fragment in anchors or fragment.lower() in anchors
+
+
+def as_text(diag: Diagnostic) -> str:
+    """Render a link Diagnostic the way this script always printed errors ("... in FILE:line:col")."""
+    if diag.line is None:
+        return diag.message
+    return f"{diag.message} in {format_location(Path(diag.file).name, diag.line, diag.col)}"
+
+
+def link_diagnostics(
+    file_path: Path,
+    index: LinkTargetIndex | None = None,
+    external: dict[str, list[tuple[str, int, int]]] | None = None,
+) -> list[Diagnostic]:
+    """Check links in a markdown file and return a Diagnostic per problem.
+
+    Targets are looked up in index (a fresh LinkTargetIndex when None), not on disk.
+    If external is given, each well-formed http(s) URL is added to it with its (file, line, col).
+    """
+    if index is None:
+        index = LinkTargetIndex()
+    rel = _rel(file_path)
+    diags = []
     
+    # Find all markdown links: [text](url), from the file's shared extraction (extract.py)
     try:
-        content = file_path.read_text(encoding="utf-8")
+        links = extract(file_path, frontmatter=False).links
     except Exception as e:
-        return [f"Error reading file: {e}"]
-    
-    # Find all markdown links: [text](url)
-    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    links = re.findall(link_pattern, content)
-    
-    for text, url in links:
-        # Skip anchor links (internal page links)
+        return [Diagnostic(rel, "file-error", f"Error reading file: {e}")]
+
+    for _, url, line, col in links:
+
+        def problem(rule: str, message: str) -> None:
+            diags.append(Diagnostic(rel, rule, message, line, col))
+
+        # Anchor links (internal page links): check against this file's headings
         if url.startswith("#"):
+            if not _fragment_ok(index, file_path, url):
+                problem("broken-anchor", f"Broken anchor: {url}")
             continue
         
         # Skip custom protocol links (asdlc://, etc.)
@@ -48,15 +109,19 @@ def check_file_links(file_path: Path) -> list[str]:
             # External link - basic validation (full checking in CI)
             parsed = urlparse(url)
             if not parsed.netloc:
-                errors.append(f"Invalid external URL: {url} in {file_path.name}")
+                problem("invalid-url", f"Invalid external URL: {url}")
+            elif external is not None:
+                external.setdefault(url, []).append((rel, line, col))
         elif url.startswith("mailto:"):
             # Email link - skip validation
             continue
         elif url.startswith("/"):
             # Absolute path - check if file exists
-            target = REPO_ROOT / url.lstrip("/")
-            if not target.exists():
-                errors.append(f"Broken internal link: {url} in {file_path.name}")
+            target = REPO_ROOT / url.split("#")[0].lstrip("/")
+            if not index.exists(target):
+                problem("broken-link", f"Broken internal link: {url}")
+            elif not _fragment_ok(index, target, url):
+                problem("broken-anchor", f"Broken anchor: {url}")
         else:
             # Relative path - check if file exists
             # Split URL to remove anchor/fragment
@@ -69,27 +134,40 @@ def check_file_links(file_path: Path) -> list[str]:
             if "/" not in url_path and not url_path.endswith((".md", ".html", ".json", ".yaml", ".yml", ".txt")):
                 continue
             
-            target = file_path.parent / url_path
-            if not target.exists():
-                # Try with .md extension
-                if not url_path.endswith((".md", ".html", ".json", ".yaml", ".yml")):
-                    target_md = file_path.parent / f"{url_path}.md"
-                    if not target_md.exists():
-                        # Only report if it looks like it should be a file (has a path component)
-                        if "/" in url_path or url_path.endswith((".md", ".html")):
-                            errors.append(f"Broken relative link: {url} in {file_path.name}")
+            # Try with .md extension
+            md_fallback = not url_path.endswith((".md", ".html", ".json", ".yaml", ".yml"))
+            target = index.resolve(file_path.parent / url_path, md_fallback)
+            if target is not None:
+                if not _fragment_ok(index, target, url):
+                    problem("broken-anchor", f"Broken anchor: {url}")
+            elif md_fallback:
+                # Only report if it looks like it should be a file (has a path component)
+                if "/" in url_path or url_path.endswith((".md", ".html")):
+                    problem("broken-link", f"Broken relative link: {url}")
     
-    return errors
+    return diags
 
 
-def main() -> None:
-    if len(sys.argv) < 2:
-        # No files provided - nothing to check
-        print("No files to check")
-        sys.exit(0)
+def check_file_links(
+    file_path: Path,
+    index: LinkTargetIndex | None = None,
+    external: dict[str, list[tuple[str, int, int]]] | None = None,
+) -> list[str]:
+    """Check links in a markdown file and return list of errors."""
+    return [as_text(d) for d in link_diagnostics(file_path, index, external)]
+
+
+def iter_diagnostics(
+    file_paths: list[Path], check_external: bool = False, index: LinkTargetIndex | None = None
+) -> Iterator[Diagnostic]:
+    """Yield link Diagnostics file by file; external URL results (if checked) come last.
 
-    all_errors = []
-    file_paths = [Path(arg) for arg in sys.argv[1:]]
+    index is reused when given (the daemon keeps one up to date); otherwise the repo is walked once.
+    """
+    external: dict[str, list[tuple[str, int, int]]] | None = {} if check_external else None
+    # One walk of the repo; every link target is then a set lookup
+    if index is None:
+        index = LinkTargetIndex()
     
     for file_path in file_paths:
         # Resolve relative paths
@@ -97,20 +175,61 @@ def main() -> None:
             file_path = REPO_ROOT / file_path
         
         if not file_path.exists():
-            all_errors.append(f"File not found: {file_path}")
+            yield Diagnostic(str(file_path), "file-error", f"File not found: {file_path}")
             continue
         
-        errors = check_file_links(file_path)
-        all_errors.extend(errors)
-    
+        with phase("link-check", file_path):
+            diags = link_diagnostics(file_path, index, external)
+        yield from diags
+
+    if external:
+        cache = ExternalLinkCache()
+        with phase("external"):
+            results = check_urls(external, cache)
+        cache.save()
+        for url, locations in external.items():
+            result = results[urldefrag(url)[0]]
+            if not result.ok:
+                for rel, line, col in locations:
+                    message = f"Broken external link: {url} ({result.describe()})"
+                    yield Diagnostic(rel, "broken-external-link", message, line, col)
+
+
+def run(args: list[str], index: LinkTargetIndex | None = None) -> int:
+    """Check links in the given files; print results and return the exit code.
+
+    index is a LinkTargetIndex to reuse (see iter_diagnostics).
+    """
+    fmt, args = parse_format(enable_from_args(args))
+    check_external = "--external" in args
+    args = [arg for arg in args if arg != "--external"]
+    if not args and not fmt:
+        # No files provided - nothing to check
+        print("No files to check")
+        return 0
+
+    file_paths = [Path(arg) for arg in args]
+    if fmt:
+        emitter = open_emitter(fmt, "check_links")
+        for diag in iter_diagnostics(file_paths, check_external, index):
+            emitter.emit(diag)
+        emitter.close()
+        return 1 if emitter.count else 0
+
+    all_errors = [as_text(d) for d in iter_diagnostics(file_paths, check_external, index)]
     if all_errors:
         print("Link checking failed:", file=sys.stderr)
         for error in all_errors:
             print(f"  {error}", file=sys.stderr)
-        sys.exit(1)
+        return 1
     
     print(f"OK: checked links in {len(file_paths)} file(s)")
-    sys.exit(0)
+    return 0
+
+
+def main() -> None:
+    code = daemon.request("check_links", sys.argv[1:])
+    sys.exit(run(sys.argv[1:]) if code is None else code)
 
 
 if __name__ == "__main__":
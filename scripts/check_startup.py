@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Check that the lookup-only entry points start without loading schema validation.
+
+Tooling shells out to `validate_mcps.py --list`, resolves single refs and checks refs many
+times per run, so those paths must not import jsonschema (and with it referencing, rpds
+and attrs). Each command below runs under `python -X importtime`. The check fails if:
+
+- any of HEAVY_MODULES was imported, or
+- the summed import time of its top-level imports exceeds the budget, or
+- the command exited non-zero.
+
+Usage: python scripts/check_startup.py [--budget-ms N] [--verbose]
+       --budget-ms: import-time budget per command (default 100; -X importtime itself
+       adds overhead, so this is not wall time). --verbose lists each command's slowest
+       top-level imports.
+Exit: 0 if every command is within budget, 1 otherwise.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCHEMAS_DIR = REPO_ROOT / "schemas"
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+
+HEAVY_MODULES = ("jsonschema", "referencing", "rpds", "attrs", "attr")
+DEFAULT_BUDGET_MS = 100
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def commands() -> list[list[str]]:
+    """The fast paths: listing tools, resolving one ref, checking refs, install layout."""
+    listing = subprocess.run(
+        [sys.executable, str(SCHEMAS_DIR / "validate_mcps.py"), "--list", "--json"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    tools = json.loads(listing.stdout) if listing.returncode == 0 else []
+    cmds = [
+        [str(SCHEMAS_DIR / "validate_mcps.py"), "--list"],
+        [str(SCHEMAS_DIR / "validate_mcps.py"), "--list", "--json"],
+        [str(SCHEMAS_DIR / "validate_mcp_refs.py")],
+        [str(SCRIPTS_DIR / "verify_github_install.py")],
+    ]
+    if tools:
+        cmds.insert(2, [str(SCHEMAS_DIR / "validate_mcps.py"), tools[0]["ref"]])
+    return cmds
+
+
+def import_times(cmd: list[str]) -> tuple[int, dict[str, int], set[str]]:
+    """Run cmd under -X importtime: (exit code, top-level module -> cumulative us, all modules)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *cmd], cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    top: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in proc.stderr.splitlines():
+        m = IMPORT_LINE.match(line)
+        if not m:
+            continue
+        cumulative, indent, name = int(m.group(2)), m.group(3), m.group(4)
+        modules.add(name)
+        if not indent:
+            top[name] = top.get(name, 0) + cumulative
+    return proc.returncode, top, modules
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    budget_ms = DEFAULT_BUDGET_MS
+    if "--budget-ms" in args:
+        i = args.index("--budget-ms")
+        try:
+            budget_ms = int(args[i + 1])
+        except (IndexError, ValueError):
+            raise SystemExit("--budget-ms expects an integer")
+    verbose = "--verbose" in args
+
+    failed = False
+    for cmd in commands():
+        label = " ".join([Path(cmd[0]).relative_to(REPO_ROOT).as_posix(), *cmd[1:]])
+        code, top, modules = import_times(cmd)
+        total_ms = sum(top.values()) / 1000
+        heavy = sorted(name for name in modules if name.split(".")[0] in HEAVY_MODULES)
+        problems = []
+        if code != 0:
+            problems.append(f"exited {code}")
+        if heavy:
+            problems.append(f"imports {', '.join(sorted({h.split('.')[0] for h in heavy}))}")
+        if total_ms > budget_ms:
+            problems.append(f"over the {budget_ms} ms budget")
+        status = "FAIL" if problems else "ok"
+        print(f"{status:<4} {total_ms:7.1f} ms  {label}" + (f"  ({'; '.join(problems)})" if problems else ""))
+        if verbose:
+            for name, us in sorted(top.items(), key=lambda kv: -kv[1])[:5]:
+                print(f"       {us / 1000:7.1f} ms  {name}")
+        failed = failed or bool(problems)
+    if failed:
+        print("Startup check failed: keep jsonschema imports inside the functions that validate", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
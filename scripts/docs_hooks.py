@@ -0,0 +1,28 @@
+"""
+MkDocs hooks (mkdocs.yml `hooks:`): regenerate the skill reference blocks before each build.
+
+mkdocs.yml also watches skills/, mcps/ and scripts/templates/, so `mkdocs serve` rebuilds
+when a skill or tool changes. The generator is incremental (see generate_docs.py): only pages
+whose skill, tools or templates changed are rewritten, and an unchanged page is not touched,
+so the write does not trigger another rebuild.
+"""
+
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Allow importing the generator when loaded by mkdocs
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_docs import DocsGenerator
+
+
+def on_pre_build(config, **kwargs) -> None:
+    generator = DocsGenerator()
+    generator.run()
+    for error in generator.errors:
+        print(f"generate_docs: {error}", file=sys.stderr)
+    generator.write()
+    generator.save()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Generate a deterministic synthetic skills/mcps/docs tree for benchmarking the validators.
+
+Usage: python scripts/generate_corpus.py <out_dir> [--skills N] [--tools N] [--refs N]
+                                         [--docs N] [--invalid-refs F] [--broken-links F]
+                                         [--seed S]
+Example: python scripts/generate_corpus.py /tmp/corpus --skills 10000 --tools 5000 --refs 50000
+
+The output is a self-contained copy of this repo's schemas/ and scripts/ plus:
+- mcps/<server>/tools/*.json   — valid tool definitions
+- skills/<name>/SKILL.md       — valid skills (all six sections, numbered steps)
+- docs/skills/*.md             — doc pages with refs and links
+MCP refs and relative links are spread across skills and docs; a fraction F of refs point
+at tools that do not exist and a fraction F of links point at missing files. The same
+arguments and seed always produce byte-identical files.
+"""
+
+import json
+import random
+import shutil
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SERVERS = ["github", "atlassian", "ado", "asdlc", "gitlab", "slack", "linear", "notion"]
+VERBS = ["get", "list", "create", "update", "delete", "search", "add", "transition", "read", "sync"]
+NOUNS = ["issue", "branch", "commit", "pull_request", "comment", "project", "user", "page",
+         "label", "release", "file", "board", "sprint", "article", "workflow", "team"]
+DEFAULTS = {
+    "skills": 1000,
+    "tools": 500,
+    "refs": 5000,
+    "docs": None,  # default: skills // 10
+    "invalid_refs": 0.02,
+    "broken_links": 0.02,
+    "seed": 0,
+}
+
+
+def _copy_tooling(out: Path) -> None:
+    ignore = shutil.ignore_patterns("__pycache__", ".cache", "*.pyc")
+    for name in ("schemas", "scripts"):
+        shutil.copytree(REPO_ROOT / name, out / name, ignore=ignore, dirs_exist_ok=True)
+
+
+def _tool_names(rng: random.Random, n: int) -> list[tuple[str, str]]:
+    tools = []
+    for i in range(n):
+        server = SERVERS[i % len(SERVERS)]
+        name = f"{rng.choice(VERBS)}_{rng.choice(NOUNS)}_{i:05d}"
+        tools.append((server, name))
+    return tools
+
+
+def _tool_json(rng: random.Random, name: str) -> str:
+    names = rng.sample(["owner", "repo", "issue_key", "project", "body", "title", "ref"], 3)
+    props = {p: {"type": "string"} for p in names}
+    data = {
+        "name": name,
+        "description": f"Synthetic tool {name}.",
+        "inputSchema": {"type": "object", "properties": props, "required": sorted(props)[:2]},
+    }
+    return json.dumps(data, indent=2) + "\n"
+
+
+def _ref_lines(rng: random.Random, count: int, valid: list[str], invalid_share: float) -> list[str]:
+    lines = []
+    for _ in range(count):
+        ref = rng.choice(valid)
+        if rng.random() < invalid_share:
+            # Typo in the tool part: still matches the ref pattern, but resolves to nothing
+            ref = ref + "x"
+        lines.append(f"- Call `{ref}` when needed.")
+    return lines
+
+
+def _link_lines(rng: random.Random, n: int, skill_names: list[str], broken_share: float, prefix: str) -> list[str]:
+    lines = []
+    for _ in range(n):
+        if rng.random() < broken_share:
+            lines.append(f"See [missing]({prefix}missing-{rng.randrange(10**6)}/guide).")
+        else:
+            target = rng.choice(skill_names)
+            lines.append(f"See [{target}]({prefix}{target}/SKILL.md).")
+    return lines
+
+
+def _skill_md(name: str, ref_lines: list[str], link_lines: list[str], steps: int) -> str:
+    step_lines = [f"{i}. Do step {i} of {name}." for i in range(1, steps + 1)]
+    return "\n".join(
+        [
+            "---",
+            f"name: {name}",
+            f"description: Synthetic skill {name} for benchmarking.",
+            "---",
+            "",
+            f"# {name}",
+            "",
+            "## Overview",
+            f"Synthetic skill {name}.",
+            "",
+            "## Definitions",
+            "- **{TASK_KEY}**: task identifier.",
+            "",
+            "## Prerequisites",
+            "- MCP servers are configured.",
+            "",
+            "## Steps",
+            *step_lines,
+            "",
+            "## Tools",
+            *ref_lines,
+            "",
+            "## Guidance",
+            *link_lines,
+            "",
+        ]
+    )
+
+
+def _split(total: int, parts: int) -> list[int]:
+    base, extra = divmod(total, parts) if parts else (0, 0)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def generate(
+    out: Path,
+    skills: int = DEFAULTS["skills"],
+    tools: int = DEFAULTS["tools"],
+    refs: int = DEFAULTS["refs"],
+    docs: int | None = DEFAULTS["docs"],
+    invalid_refs: float = DEFAULTS["invalid_refs"],
+    broken_links: float = DEFAULTS["broken_links"],
+    seed: int = DEFAULTS["seed"],
+) -> dict:
+    """Write the corpus under out (replacing skills/, mcps/, docs/). Returns its parameters."""
+    rng = random.Random(seed)
+    docs = skills // 10 if docs is None else docs
+    for name in ("skills", "mcps", "docs"):
+        shutil.rmtree(out / name, ignore_errors=True)
+    out.mkdir(parents=True, exist_ok=True)
+    _copy_tooling(out)
+
+    tool_names = _tool_names(rng, tools)
+    valid = [f"mcp_{server}_{name}" for server, name in tool_names]
+    for server, name in tool_names:
+        p = out / "mcps" / server / "tools" / f"{name}.json"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(_tool_json(rng, name), encoding="utf-8")
+
+    skill_names = [f"skill-{i:05d}" for i in range(skills)]
+    files = skills + docs
+    ref_counts = _split(refs, files)
+    for i, name in enumerate(skill_names):
+        ref_lines = _ref_lines(rng, ref_counts[i], valid, invalid_refs)
+        link_lines = _link_lines(rng, 2, skill_names, broken_links, "../")
+        p = out / "skills" / name / "SKILL.md"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(_skill_md(name, ref_lines, link_lines, rng.randint(3, 12)), encoding="utf-8")
+
+    docs_dir = out / "docs" / "skills"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    for j in range(docs):
+        ref_lines = _ref_lines(rng, ref_counts[skills + j], valid, invalid_refs)
+        link_lines = _link_lines(rng, 5, skill_names, broken_links, "../../skills/")
+        body = "\n".join([f"# Doc {j}", "", *ref_lines, "", *link_lines, ""])
+        (docs_dir / f"doc-{j:05d}.md").write_text(body, encoding="utf-8")
+
+    return {
+        "skills": skills,
+        "tools": tools,
+        "refs": refs,
+        "docs": docs,
+        "invalid_refs": invalid_refs,
+        "broken_links": broken_links,
+        "seed": seed,
+    }
+
+
+def parse_args(argv: list[str]) -> tuple[Path, dict]:
+    """Parse "<out_dir> [--name value ...]" into (out_dir, generate() kwargs)."""
+    if not argv or argv[0].startswith("-"):
+        raise SystemExit(__doc__)
+    out = Path(argv[0])
+    kwargs = {}
+    args = argv[1:]
+    if len(args) % 2:
+        raise SystemExit(f"Missing value for {args[-1]}")
+    for flag, value in zip(args[::2], args[1::2]):
+        key = flag.lstrip("-").replace("-", "_")
+        if key not in DEFAULTS:
+            raise SystemExit(f"Unknown option: {flag}")
+        kwargs[key] = float(value) if key in ("invalid_refs", "broken_links") else int(value)
+    return out, kwargs
+
+
+def main() -> None:
+    out, kwargs = parse_args(sys.argv[1:])
+    params = generate(out, **kwargs)
+    print(f"OK: generated corpus in {out}: {json.dumps(params)}")
+
+
+if __name__ == "__main__":
+    main()
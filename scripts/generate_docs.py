@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Generate the skill reference parts of the docs from skills/ and mcps/, incrementally.
+
+docs/skills/<name>.md pages are written by hand (description, usage, examples), but their
+tool and workflow details mirror skills/<name>/SKILL.md and drift from it. This script owns
+one marked block per page, between GENERATED_BEGIN and GENERATED_END. The block is rendered
+from the parsed skill and the MCP registry: the MCP tools the skill references (with each
+tool's description and required parameters from its JSON), the top-level steps, and the
+source link. Text outside the markers is never touched. The block also goes into
+docs/reference/skills-directory.md, where it is the table of all skills.
+
+- A page that has no markers yet gets the block in place of its "View full skill (source)"
+  line, or else before its "Back to Commands" link, or else at the end.
+- A skill with no page gets a new page from templates/skill-page.md.
+
+Pages are rebuilt only when one of their inputs changed. The inputs are the skill's
+SHA-256, the SHA-256 of each tool JSON it references (or the absence of that tool), and
+the generator fingerprint (this script, the templates, and the parser and registry
+modules in schemas/ that the blocks are rendered with). The page's own SHA-256 is also
+checked, so a page edited by hand is re-spliced. All of these are recorded in
+.cache/docs-manifest.json. The index is rebuilt from per-skill summaries stored in the
+manifest, so one changed skill re-parses one skill, not all of them.
+
+Usage: python scripts/generate_docs.py [--force] [--check]
+       --force: ignore the manifest and rebuild every page.
+       --check: rebuild every page in memory, write nothing, and fail if any page on disk
+       differs (CI).
+Exit: 0 on success, 1 if --check found stale pages or a skill could not be read.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from string import Template
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+SCHEMAS_DIR = REPO_ROOT / "schemas"
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+MANIFEST_PATH = REPO_ROOT / ".cache" / "docs-manifest.json"
+INDEX_PAGE = "docs/reference/skills-directory.md"
+SOURCE_URL = "https://github.com/fancy-bread/sdlc-workflow-skills/blob/main/"
+FORMAT_VERSION = 1
+# Code the rendered blocks depend on besides this script: the parser (sections, mcp_refs)
+# and the registry (tool lookups)
+CODE_FILES = [SCHEMAS_DIR / "skill_parser.py", SCHEMAS_DIR / "registry.py"]
+
+GENERATED_BEGIN = "<!-- BEGIN GENERATED by scripts/generate_docs.py: edit the skill, not this block -->"
+GENERATED_END = "<!-- END GENERATED -->"
+
+SOURCE_LINK_LINE = re.compile(r"^\*\*\[View full skill \(source\)\]\([^)]*\)\*\*[ \t]*\n?", re.M)
+BACK_LINK_LINE = re.compile(r"^\[:octicons-arrow-left-24:", re.M)
+INDEX_ANCHOR = re.compile(r"^## External Resources", re.M)
+TOP_LEVEL_STEP = re.compile(r"^(\d+)\.\s+\*\*(.+?)\*\*", re.M)
+
+# Allow importing the shared parser in schemas/ when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from registry import get_registry
+from skill_parser import scan_text
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint(*templates: str) -> str:
+    """Hash of this script, CODE_FILES and the given templates: a change to any rebuilds their pages."""
+    h = hashlib.sha256(Path(__file__).read_bytes())
+    for path in CODE_FILES:
+        h.update(path.name.encode())
+        h.update(path.read_bytes() if path.exists() else b"")
+    for name in templates:
+        h.update(name.encode())
+        h.update((TEMPLATES_DIR / name).read_bytes())
+    return h.hexdigest()
+
+
+def template(name: str) -> Template:
+    return Template((TEMPLATES_DIR / name).read_text(encoding="utf-8"))
+
+
+def cell(text: str) -> str:
+    """Text made safe for one markdown table cell."""
+    return " ".join(text.split()).replace("|", "\\|")
+
+
+def first_paragraph(text: str) -> str:
+    return text.strip().split("\n\n", 1)[0].strip()
+
+
+def tool_details(record: dict) -> tuple[str, list[str]]:
+    """(description, required parameters) from a tool JSON; empty if it cannot be read."""
+    try:
+        data = json.loads((REPO_ROOT / record["path"]).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return "", []
+    description = data.get("description", "") if isinstance(data, dict) else ""
+    required = (record.get("input") or {}).get("required", [])
+    return description if isinstance(description, str) else "", required
+
+
+def render_tools(refs: list[str]) -> str:
+    registry = get_registry()
+    if not refs:
+        return "This skill does not call MCP tools."
+    rows = ["| Tool | Server | Description | Required parameters |", "|------|--------|-------------|---------------------|"]
+    for ref in refs:
+        record = registry.lookup(ref)
+        if record is None:
+            rows.append(f"| `{ref}` | | *Not defined in mcps/* | |")
+            continue
+        description, required = tool_details(record)
+        params = ", ".join(f"`{p}`" for p in required)
+        rows.append(f"| `{ref}` | {record['server']} | {cell(description)} | {params} |")
+    return "\n".join(rows)
+
+
+def render_steps(steps: str) -> str:
+    items = [f"{n}. **{title}**" for n, title in TOP_LEVEL_STEP.findall(steps)]
+    return "\n".join(items) if items else "See the skill source for the full workflow."
+
+
+def splice(page: str, block: str, anchors: list[re.Pattern], replace_anchor: bool = False) -> str:
+    """page with its generated block set to block (see the module docstring for placement)."""
+    marked = f"{GENERATED_BEGIN}\n{block.strip()}\n{GENERATED_END}\n"
+    start = page.find(GENERATED_BEGIN)
+    end = page.find(GENERATED_END, start)
+    if start != -1 and end != -1:
+        end += len(GENERATED_END)
+        if page[end : end + 1] == "\n":
+            end += 1
+        return page[:start] + marked + page[end:]
+    for i, anchor in enumerate(anchors):
+        m = anchor.search(page)
+        if m is None:
+            continue
+        if replace_anchor and i == 0:
+            return page[: m.start()] + marked + page[m.end() :]
+        return page[: m.start()] + marked + "\n---\n\n" + page[m.start() :]
+    return page.rstrip("\n") + "\n\n---\n\n" + marked
+
+
+class DocsGenerator:
+    """One generation run; rebuild decisions come from the manifest unless force is set."""
+
+    def __init__(self, force: bool = False, manifest_path: Path = MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.pages: dict[str, dict] = {} if force else self._load()
+        self.skill_fingerprint = fingerprint("skill-page.md", "skill-reference.md")
+        self.index_fingerprint = fingerprint("skills-index.md")
+        self.rendered: dict[str, str] = {}  # page -> content, for pages rebuilt this run
+        self.skipped = 0
+        self.errors: list[str] = []
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            return {}
+        return data.get("pages", {})
+
+    def save(self) -> None:
+        data = {"version": FORMAT_VERSION, "saved_ns": time.time_ns(), "pages": self.pages}
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.manifest_path)
+        except OSError:
+            return  # read-only checkout: the next run rebuilds from scratch
+
+    def _page_sha(self, page: str) -> str | None:
+        try:
+            return sha256((REPO_ROOT / page).read_bytes())
+        except OSError:
+            return None
+
+    def _tools_unchanged(self, tools: dict[str, str | None]) -> bool:
+        registry = get_registry()
+        for ref, recorded in tools.items():
+            record = registry.lookup(ref)
+            if (record["sha256"] if record else None) != recorded:
+                return False
+        return True
+
+    def _up_to_date(self, page: str, inputs: dict) -> bool:
+        entry = self.pages.get(page)
+        return (
+            entry is not None
+            and all(entry.get(k) == v for k, v in inputs.items())
+            and entry.get("output") == self._page_sha(page)
+            and self._tools_unchanged(entry.get("tools", {}))
+        )
+
+    def skill_page(self, skill_md: Path) -> dict | None:
+        """Bring docs/skills/<name>.md up to date; return the skill's index summary."""
+        rel = skill_md.relative_to(REPO_ROOT).as_posix()
+        name = skill_md.parent.name
+        page = f"docs/skills/{name}.md"
+        try:
+            raw = skill_md.read_bytes()
+            text = raw.decode("utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            self.errors.append(f"{rel}: {e}")
+            return None
+        inputs = {"skill": rel, "skill_sha256": sha256(raw), "fingerprint": self.skill_fingerprint}
+        if self._up_to_date(page, inputs):
+            self.skipped += 1
+            return self.pages[page]["summary"]
+
+        doc = scan_text(text)
+        refs = list(doc.mcp_refs)
+        registry = get_registry()
+        tools = {}
+        for ref in refs:
+            record = registry.lookup(ref)
+            tools[ref] = record["sha256"] if record else None
+        block = template("skill-reference.md").substitute(
+            tools=render_tools(refs),
+            steps=render_steps(doc.sections.get("Steps", "")),
+            source_url=SOURCE_URL + rel,
+        )
+        path = REPO_ROOT / page
+        if path.exists():
+            content = splice(path.read_text(encoding="utf-8"), block, [SOURCE_LINK_LINE, BACK_LINK_LINE], True)
+        else:
+            marked = f"{GENERATED_BEGIN}\n{block.strip()}\n{GENERATED_END}"
+            overview = first_paragraph(doc.sections.get("Overview", "")) or doc.frontmatter.get("description", "")
+            content = template("skill-page.md").substitute(name=name, overview=overview, reference=marked)
+        summary = {
+            "name": name,
+            "overview": first_paragraph(doc.sections.get("Overview", "")),
+            "servers": sorted({registry.lookup(r)["server"] for r in refs if tools[r]}),
+        }
+        self.rendered[page] = content
+        self.pages[page] = {
+            **inputs,
+            "tools": tools,
+            "summary": summary,
+            "output": sha256(content.encode("utf-8")),
+        }
+        return summary
+
+    def index_page(self, summaries: list[dict]) -> None:
+        inputs = {"skills": summaries, "fingerprint": self.index_fingerprint}
+        if self._up_to_date(INDEX_PAGE, inputs):
+            self.skipped += 1
+            return
+        rows = [
+            f"| [`/{s['name']}`](../skills/{s['name']}.md) | {cell(s['overview'])} | {', '.join(s['servers']) or '—'} |"
+            for s in summaries
+        ]
+        block = template("skills-index.md").substitute(rows="\n".join(rows))
+        path = REPO_ROOT / INDEX_PAGE
+        existing = path.read_text(encoding="utf-8") if path.exists() else "# Skills Directory\n"
+        content = splice(existing, block, [INDEX_ANCHOR])
+        self.rendered[INDEX_PAGE] = content
+        self.pages[INDEX_PAGE] = {**inputs, "output": sha256(content.encode("utf-8"))}
+
+    def run(self) -> None:
+        skill_files = sorted(SKILLS_DIR.glob("*/SKILL.md"))
+        summaries = [s for s in (self.skill_page(p) for p in skill_files) if s is not None]
+        live = {f"docs/skills/{p.parent.name}.md" for p in skill_files} | {INDEX_PAGE}
+        for page in [p for p in self.pages if p not in live]:
+            del self.pages[page]
+            print(f"{page}: its skill was removed; delete the page or keep it by hand", file=sys.stderr)
+        self.index_page(summaries)
+
+    def write(self) -> list[str]:
+        """Write rebuilt pages whose content changed; return their paths."""
+        written = []
+        for page, content in self.rendered.items():
+            path = REPO_ROOT / page
+            if path.exists() and path.read_text(encoding="utf-8") == content:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            written.append(page)
+        return written
+
+    def stale(self) -> list[str]:
+        """Rebuilt pages whose content differs from what is on disk."""
+        return [page for page, content in self.rendered.items() if self._page_sha(page) != sha256(content.encode("utf-8"))]
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    check = "--check" in args
+    generator = DocsGenerator(force=check or "--force" in args)
+    generator.run()
+    for error in generator.errors:
+        print(error, file=sys.stderr)
+    if check:
+        stale = generator.stale()
+        for page in stale:
+            print(f"{page} is out of date", file=sys.stderr)
+        if stale:
+            print("Run: python scripts/generate_docs.py", file=sys.stderr)
+        return 1 if stale or generator.errors else 0
+    written = generator.write()
+    generator.save()
+    nav = (REPO_ROOT / "mkdocs.yml").read_text(encoding="utf-8")
+    for page in written:
+        print(f"Wrote {page}")
+    missing = [page for page in written if page[len("docs/") :] not in nav]
+    if missing:
+        print(f"note: {len(missing)} page(s) not in the mkdocs.yml nav, e.g. {missing[0]}", file=sys.stderr)
+    total = len(generator.rendered) + generator.skipped
+    print(f"Rebuilt {len(generator.rendered)} of {total} pages ({len(written)} changed)")
+    return 1 if generator.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
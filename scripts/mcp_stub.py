@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+Local MCP stand-in server: validates tool-call arguments against mcps/ inputSchemas.
+
+The stub speaks MCP's JSON-RPC (initialize, ping, tools/list, tools/call) for the tools
+in mcps/, read from the registry (schemas/registry.py). Every tools/call checks its
+arguments against the tool's inputSchema and returns:
+
+- a canned result when they are valid;
+- a tool error (isError: true, one line per problem) when they are not;
+- a JSON-RPC error for an unknown tool, a name that is not a string, or arguments that are
+  not an object (INVALID_PARAMS), and for any failure while handling a message
+  (INTERNAL_ERROR), so one bad request never stops the server.
+
+Input validators are generated once per distinct inputSchema (compiled_validator.py,
+keyed by canonical hash), so a call costs one specialized function call. Connections are
+served by asyncio. Each request on a connection runs as its own task, so with --delay
+many calls are in flight at once.
+
+With this, skill workflows (e.g. start-task / complete-task calling
+mcp_github_create_pull_request or mcp_atlassian_createJiraIssue) can be replayed and
+load-tested offline, without GitHub, Jira or ADO.
+
+Usage:
+  python scripts/mcp_stub.py [--server NAME] [--responses DIR] [--delay MS] [--stats]
+    → MCP over stdio (newline-delimited JSON-RPC), e.g. as a "command" server in an MCP
+      client config.
+  python scripts/mcp_stub.py --listen HOST:PORT|unix:PATH [...same options]
+    → The same protocol over a TCP or Unix socket, one JSON-RPC message per line, for many
+      concurrent clients. Ctrl-C stops it; --stats prints call counts and validation
+      latency on exit.
+  python scripts/mcp_stub.py --replay FILE [--server NAME] [--responses DIR]
+    → Send each line of FILE through the stub and print the responses as JSON Lines.
+      A line is a JSON-RPC request, or {"name": ..., "arguments": {...}} for a tools/call.
+      Exit 1 if any call was rejected or any line is not a JSON object (reported with its
+      line number).
+  python scripts/mcp_stub.py --bench [--calls N] [--concurrency C] [--server NAME] [--delay MS]
+    → Load test: C clients over a Unix socket send N tools/call requests in total, with
+      arguments generated from each inputSchema (every 10th call with a required argument
+      missing). Prints calls/s, round-trip and validation latency percentiles.
+
+Tool names are the tool's own name with --server (as that MCP server exposes them), or
+its ref (mcp_<server>_<tool>, as skills write them) when serving every server. With
+--responses DIR, DIR/<server>/<tool>.json holds the CallToolResult returned for valid
+calls. Otherwise the result echoes the arguments as text.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCHEMAS_DIR = REPO_ROOT / "schemas"
+
+# Allow importing sibling modules in schemas/ when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from compiled_validator import Validator, compile_validator
+from deep_schema import canonical_hash
+from registry import get_registry
+
+PROTOCOL_VERSION = "2025-06-18"
+SERVER_INFO = {"name": "sdlc-workflow-skills-mcp-stub", "version": "1.0.0"}
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Sample values for generated bench arguments, by JSON type
+SAMPLE_VALUES = {"string": "x", "integer": 1, "number": 1, "boolean": True, "array": [], "object": {}, "null": None}
+
+
+class Stats:
+    """Call counts and per-call validation time (ns)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.rejected = 0
+        self.validation_ns: list[int] = []
+        self.started = time.perf_counter()
+
+    def report(self, out=sys.stderr) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(f"{self.calls} call(s), {self.rejected} rejected, {self.calls / elapsed:.0f} calls/s over {elapsed:.1f} s", file=out)
+        if self.validation_ns:
+            print(f"validation latency: {percentiles(self.validation_ns)}", file=out)
+
+
+def percentiles(samples_ns: list[int]) -> str:
+    s = sorted(samples_ns)
+
+    def at(q: float) -> float:
+        return s[min(len(s) - 1, int(q * len(s)))] / 1000
+
+    return f"p50 {at(0.5):.1f} us, p95 {at(0.95):.1f} us, p99 {at(0.99):.1f} us, max {s[-1] / 1000:.1f} us"
+
+
+class ToolTable:
+    """Tools served by the stub, from the registry, with their input validators."""
+
+    def __init__(self, server: str | None = None, responses: Path | None = None):
+        self.responses = responses
+        self.tools: dict[str, dict] = {}
+        self._validators: dict[str, Validator] = {}
+        for record in get_registry().tools():
+            if server is not None and record["server"] != server:
+                continue
+            try:
+                definition = json.loads((REPO_ROOT / record["path"]).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"Skipping {record['path']}: {e}", file=sys.stderr)
+                continue
+            name = record["tool"] if server is not None else record["ref"]
+            self.tools.setdefault(name, {"record": record, "definition": definition})
+
+    def listing(self) -> list[dict]:
+        keys = ("title", "description", "inputSchema", "outputSchema", "annotations")
+        return [
+            {"name": name, **{k: tool["definition"][k] for k in keys if k in tool["definition"]}}
+            for name, tool in self.tools.items()
+        ]
+
+    def validator(self, name: str) -> Validator:
+        tool = self.tools[name]
+        validator = tool.get("validator")
+        if validator is None:
+            schema = tool["definition"].get("inputSchema", {})
+            key = canonical_hash(schema)
+            validator = self._validators.get(key)
+            if validator is None:
+                validator = self._validators[key] = compile_validator(schema)
+            tool["validator"] = validator
+        return validator
+
+    def canned(self, name: str, arguments: dict) -> dict:
+        record = self.tools[name]["record"]
+        if self.responses is not None:
+            path = self.responses / record["server"] / f"{record['tool']}.json"
+            if path.is_file():
+                return json.loads(path.read_text(encoding="utf-8"))
+        text = json.dumps({"stub": record["ref"], "arguments": arguments}, sort_keys=True)
+        return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+def _error(id_, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": id_, "error": {"code": code, "message": message}}
+
+
+class StubServer:
+    """MCP JSON-RPC handling over a ToolTable; transports call handle() per message."""
+
+    def __init__(self, table: ToolTable, delay: float = 0.0):
+        self.table = table
+        self.delay = delay
+        self.stats = Stats()
+
+    def call_tool(self, name: str, arguments: dict) -> dict:
+        self.stats.calls += 1
+        start = time.perf_counter_ns()
+        problems = [f"{e.json_path}: {e.message}" for e in self.table.validator(name).iter_errors(arguments)]
+        self.stats.validation_ns.append(time.perf_counter_ns() - start)
+        if problems:
+            self.stats.rejected += 1
+            text = f"Invalid arguments for {name}:\n" + "\n".join(problems)
+            return {"content": [{"type": "text", "text": text}], "isError": True}
+        return self.table.canned(name, arguments)
+
+    def handle(self, message) -> dict | None:
+        """Response for one JSON-RPC message (None for notifications)."""
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0" or not isinstance(message.get("method"), str):
+            return _error(message.get("id") if isinstance(message, dict) else None, INVALID_REQUEST, "Invalid Request")
+        if "id" not in message:
+            return None  # notifications (notifications/initialized, cancellations) need no reply
+        id_, method = message["id"], message["method"]
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(id_, INVALID_PARAMS, "params must be an object")
+        if method == "initialize":
+            result = {
+                "protocolVersion": params.get("protocolVersion", PROTOCOL_VERSION),
+                "capabilities": {"tools": {"listChanged": False}},
+                "serverInfo": SERVER_INFO,
+            }
+        elif method == "ping":
+            result = {}
+        elif method == "tools/list":
+            result = {"tools": self.table.listing()}
+        elif method == "tools/call":
+            name = params.get("name")
+            arguments = params.get("arguments", {})
+            if not isinstance(name, str):
+                return _error(id_, INVALID_PARAMS, "name must be a string")
+            if not isinstance(arguments, dict):
+                return _error(id_, INVALID_PARAMS, "arguments must be an object")
+            if name not in self.table.tools:
+                return _error(id_, INVALID_PARAMS, f"Unknown tool: {name}")
+            result = self.call_tool(name, arguments)
+        else:
+            return _error(id_, METHOD_NOT_FOUND, f"Method not found: {method}")
+        return {"jsonrpc": "2.0", "id": id_, "result": result}
+
+    def safe_handle(self, message) -> dict | None:
+        """handle(), with any exception answered as a JSON-RPC internal error."""
+        try:
+            return self.handle(message)
+        except Exception as e:
+            id_ = message.get("id") if isinstance(message, dict) else None
+            return _error(id_, INTERNAL_ERROR, f"Internal error: {type(e).__name__}: {e}")
+
+    def handle_line(self, line: bytes) -> dict | None:
+        try:
+            message = json.loads(line)
+        except ValueError:
+            return _error(None, PARSE_ERROR, "Parse error")
+        return self.safe_handle(message)
+
+    async def serve_stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one connection: each line is a request, answered as soon as it completes."""
+        pending: set[asyncio.Task] = set()
+
+        async def respond(line: bytes) -> None:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            response = self.handle_line(line)
+            if response is not None:
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                if not self.delay:
+                    await respond(line)
+                    continue
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _stdio_streams() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    return reader, asyncio.StreamWriter(transport, protocol, reader, loop)
+
+
+async def _start_server(stub: StubServer, address: str, backlog: int = 100) -> asyncio.AbstractServer:
+    if address.startswith("unix:"):
+        return await asyncio.start_unix_server(stub.serve_stream, path=address[len("unix:") :], backlog=backlog)
+    host, _, port = address.rpartition(":")
+    return await asyncio.start_server(stub.serve_stream, host or "127.0.0.1", int(port), backlog=backlog)
+
+
+def _serve_stdio_blocking(stub: StubServer) -> None:
+    for line in sys.stdin.buffer:
+        response = stub.handle_line(line) if line.strip() else None
+        if response is not None:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+
+async def serve(stub: StubServer, address: str | None) -> None:
+    if address is None:
+        try:
+            streams = await _stdio_streams()
+        except ValueError:
+            # stdin/stdout redirected to regular files, which asyncio cannot watch
+            _serve_stdio_blocking(stub)
+            return
+        await stub.serve_stream(*streams)
+        return
+    server = await _start_server(stub, address)
+    print(f"MCP stub serving {len(stub.table.tools)} tool(s) on {address}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def replay(stub: StubServer, path: Path) -> int:
+    failed = 0
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError as e:
+                print(f"{path}:{i}: not valid JSON: {e}", file=sys.stderr)
+                failed += 1
+                continue
+            if not isinstance(message, dict):
+                print(f"{path}:{i}: expected a JSON object", file=sys.stderr)
+                failed += 1
+                continue
+            if "method" not in message:
+                message = {"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": message}
+            response = stub.safe_handle(message)
+            if response is None:
+                continue
+            if "error" in response or response["result"].get("isError"):
+                failed += 1
+            print(json.dumps(response))
+    stub.stats.report()
+    return 1 if failed else 0
+
+
+def sample_arguments(schema: dict) -> dict:
+    """Arguments with every required property set to a value of its declared type."""
+    properties = schema.get("properties", {})
+    out = {}
+    for name in schema.get("required", []):
+        prop = properties.get(name, {})
+        kind = prop.get("type", "string")
+        if isinstance(kind, list):
+            kind = kind[0]
+        out[name] = prop["enum"][0] if prop.get("enum") else SAMPLE_VALUES.get(kind, "x")
+    return out
+
+
+async def bench(stub: StubServer, calls: int, concurrency: int) -> int:
+    names = list(stub.table.tools)
+    if not names:
+        print("No tools to call", file=sys.stderr)
+        return 1
+    requests = []
+    for i in range(calls):
+        name = names[i % len(names)]
+        arguments = sample_arguments(stub.table.tools[name]["definition"].get("inputSchema", {}))
+        if i % 10 == 9 and arguments:
+            arguments.pop(next(iter(arguments)))
+        requests.append({"jsonrpc": "2.0", "id": i, "method": "tools/call", "params": {"name": name, "arguments": arguments}})
+    round_trips: list[int] = []
+
+    async def client(mine: list[dict]) -> None:
+        reader, writer = await asyncio.open_unix_connection(path)
+        for request in mine:
+            start = time.perf_counter_ns()
+            writer.write(json.dumps(request).encode("utf-8") + b"\n")
+            await writer.drain()
+            await reader.readline()
+            round_trips.append(time.perf_counter_ns() - start)
+        writer.close()
+        await writer.wait_closed()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mcp-stub.sock")
+        server = await _start_server(stub, f"unix:{path}", backlog=max(100, concurrency))
+        async with server:
+            stub.stats = Stats()
+            start = time.perf_counter()
+            await asyncio.gather(*(client(requests[c::concurrency]) for c in range(concurrency)))
+            elapsed = time.perf_counter() - start
+    print(f"{calls} call(s) over {concurrency} connection(s) to {len(names)} tool(s) in {elapsed:.2f} s ({calls / elapsed:.0f} calls/s)")
+    print(f"round trip:         {percentiles(round_trips)}")
+    print(f"validation:         {percentiles(stub.stats.validation_ns)}")
+    print(f"rejected:           {stub.stats.rejected} (every 10th call drops a required argument)")
+    return 0
+
+
+def _option(args: list[str], flag: str, default: str | None = None) -> str | None:
+    if flag not in args:
+        return default
+    i = args.index(flag)
+    if i + 1 >= len(args):
+        raise SystemExit(f"{flag} requires a value")
+    return args[i + 1]
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(__doc__.strip())
+        return 0
+    responses = _option(args, "--responses")
+    try:
+        delay = float(_option(args, "--delay", "0")) / 1000
+        calls = int(_option(args, "--calls", "10000"))
+        concurrency = int(_option(args, "--concurrency", "16"))
+    except ValueError:
+        raise SystemExit("--delay, --calls and --concurrency expect numbers")
+    table = ToolTable(_option(args, "--server"), Path(responses) if responses else None)
+    stub = StubServer(table, delay)
+
+    if "--replay" in args:
+        return replay(stub, Path(_option(args, "--replay")))
+    if "--bench" in args:
+        return asyncio.run(bench(stub, calls, max(1, concurrency)))
+    try:
+        asyncio.run(serve(stub, _option(args, "--listen")))
+    except KeyboardInterrupt:
+        pass
+    if "--stats" in args:
+        stub.stats.report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
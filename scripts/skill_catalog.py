@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Build and read a compact catalog of the skills in skills/, for fast agent startup.
+
+An agent choosing between skills only needs each skill's name and description, but walking
+skills/*/SKILL.md reads and parses every full body. The catalog is one JSON file holding,
+per skill: its frontmatter, the byte offset of the body, the byte span of every "## "
+section, the MCP tools it references, and the file's size and SHA-256. SkillCatalog loads
+only that file; a skill body (or a single section) is read from disk when it is actually
+needed, by seeking to its byte offsets. Startup therefore scales with the catalog, not
+with the total size of the skill bodies.
+
+Usage: python scripts/skill_catalog.py build [--skills DIR] [--out FILE]
+       python scripts/skill_catalog.py list [--catalog FILE]
+       python scripts/skill_catalog.py show NAME [SECTION] [--catalog FILE]
+
+build writes the catalog of DIR/*/SKILL.md (default: skills/ to skills-catalog.json at the
+repo root; the release archives ship it next to their own copy of skills/). Paths in it are
+relative to the catalog's directory, so the skills must be under it.
+list prints each skill's name and description from the catalog alone. show prints a skill's
+body, or one of its sections, loaded lazily through the catalog.
+
+Loading through a stale catalog raises StaleCatalog: a section read checks the file's
+size, and a body read checks its SHA-256.
+
+Example:
+    catalog = SkillCatalog.load(Path("skills-catalog.json"))
+    for entry in catalog:
+        print(entry["name"], entry["description"])
+    steps = catalog.read_section("start-task", "Steps")
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+SCHEMAS_DIR = REPO_ROOT / "schemas"
+DEFAULT_CATALOG = REPO_ROOT / "skills-catalog.json"
+FORMAT_VERSION = 1
+
+# Allow importing the shared parser in schemas/ when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
+
+from skill_parser import tokenize
+
+
+class StaleCatalog(Exception):
+    """A skill file no longer matches its catalog entry; rebuild the catalog."""
+
+
+def catalog_entry(path: Path, root: Path) -> dict:
+    """Catalog entry for one SKILL.md; offsets are byte offsets in the file."""
+    raw = path.read_bytes()
+    lines = raw.split(b"\n")
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    text = [line.decode("utf-8") + "\n" for line in lines[:-1]] + ([lines[-1].decode("utf-8")] if lines[-1] else [])
+
+    def byte_offset(line: int, col: int) -> int:
+        if line > len(text):
+            return len(raw)
+        return line_starts[line - 1] + len(text[line - 1][: col - 1].encode("utf-8"))
+
+    fm: dict = {}
+    body = 0
+    refs: dict[str, None] = {}
+    sections: list[list] = []
+    for tok in tokenize(text):
+        if tok.kind == "frontmatter":
+            fm = tok.value
+        elif tok.kind == "body":
+            body = byte_offset(tok.line, tok.col)
+        elif tok.kind == "heading":
+            start = byte_offset(tok.line, tok.col)
+            if sections:
+                sections[-1][2] = start
+            sections.append([tok.value, start, len(raw)])
+        elif tok.kind == "ref":
+            refs.setdefault(tok.value)
+    return {
+        "name": fm.get("name", path.parent.name),
+        "description": fm.get("description", ""),
+        "path": Path(os.path.relpath(path, root)).as_posix(),
+        "size": len(raw),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "frontmatter": fm,
+        "body": body,
+        "sections": sections,
+        "mcpRefs": list(refs),
+    }
+
+
+def build(skills_dir: Path = SKILLS_DIR, out: Path = DEFAULT_CATALOG) -> dict:
+    """Scan every skills_dir/*/SKILL.md once and write the catalog to out.
+
+    Raises ValueError if skills_dir is not under out's directory (the catalog's paths could
+    not be resolved wherever it is shipped).
+    """
+    root = out.resolve().parent
+    if not skills_dir.resolve().is_relative_to(root):
+        raise ValueError(f"{skills_dir} is not under {root}; copy the skills next to the catalog")
+    skills = [catalog_entry(p.resolve(), root) for p in sorted(skills_dir.glob("*/SKILL.md"))]
+    catalog = {"version": FORMAT_VERSION, "skills": skills}
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(catalog, separators=(",", ":")) + "\n", encoding="utf-8")
+    return catalog
+
+
+class SkillCatalog:
+    """Skills listed in a catalog file; bodies and sections are read from disk on demand."""
+
+    def __init__(self, data: dict, root: Path):
+        self.root = root
+        self.skills: list[dict] = data["skills"]
+        self._by_name = {entry["name"]: entry for entry in self.skills}
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_CATALOG) -> "SkillCatalog":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path}: not a version {FORMAT_VERSION} skill catalog")
+        return cls(data, path.resolve().parent)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def get(self, name: str) -> dict:
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"no skill named {name!r} in the catalog") from None
+
+    def _read(self, entry: dict, start: int, end: int | None = None) -> bytes:
+        path = self.root / entry["path"]
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            if f.tell() != entry["size"]:
+                raise StaleCatalog(f"{entry['path']} changed since the catalog was built")
+            f.seek(start)
+            return f.read() if end is None else f.read(end - start)
+
+    def read_body(self, name: str) -> str:
+        """The skill's body (frontmatter skipped), checked against the catalog's SHA-256."""
+        entry = self.get(name)
+        raw = self._read(entry, 0)
+        if hashlib.sha256(raw).hexdigest() != entry["sha256"]:
+            raise StaleCatalog(f"{entry['path']} changed since the catalog was built")
+        return raw[entry["body"] :].decode("utf-8")
+
+    def read_section(self, name: str, section: str) -> str | None:
+        """Content of the skill's "## section" (last one if repeated, stripped), or None."""
+        entry = self.get(name)
+        spans = [span for span in entry["sections"] if span[0] == section]
+        if not spans:
+            return None
+        _, start, end = spans[-1]
+        _, _, content = self._read(entry, start, end).decode("utf-8").partition("\n")
+        return content.strip()
+
+
+def _pop_option(args: list[str], name: str, default: Path) -> Path:
+    if name not in args:
+        return default
+    i = args.index(name)
+    if i + 1 >= len(args):
+        raise SystemExit(f"{name} requires a path")
+    value = args[i + 1]
+    del args[i : i + 2]
+    return Path(value)
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    command = args.pop(0) if args else None
+    if command == "build":
+        out = _pop_option(args, "--out", DEFAULT_CATALOG)
+        skills_dir = _pop_option(args, "--skills", SKILLS_DIR)
+        try:
+            catalog = build(skills_dir, out)
+        except ValueError as e:
+            print(f"Cannot build catalog: {e}", file=sys.stderr)
+            return 1
+        print(f"Wrote {out} ({len(catalog['skills'])} skills, {out.stat().st_size} bytes)")
+        return 0
+    if command in ("list", "show"):
+        path = _pop_option(args, "--catalog", DEFAULT_CATALOG)
+        try:
+            catalog = SkillCatalog.load(path)
+        except (OSError, ValueError) as e:
+            print(f"Cannot load catalog: {e}", file=sys.stderr)
+            return 1
+        if command == "list":
+            for entry in catalog:
+                print(f"{entry['name']}: {entry['description']}")
+            return 0
+        if len(args) in (1, 2):
+            try:
+                text = catalog.read_body(args[0]) if len(args) == 1 else catalog.read_section(*args)
+            except (KeyError, StaleCatalog, OSError) as e:
+                print(e.args[0] if isinstance(e, KeyError) else e, file=sys.stderr)
+                return 1
+            if text is None:
+                print(f"{args[0]} has no '## {args[1]}' section", file=sys.stderr)
+                return 1
+            print(text)
+            return 0
+    print(__doc__.strip(), file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
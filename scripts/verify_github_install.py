@@ -12,80 +12,88 @@ The same layout works for Cursor (Remote Rule / Github), Claude, and Codex:
 See: https://cursor.com/docs/context/skills#installing-skills-from-github
      https://agentskills.io
 
-Usage: python scripts/verify_github_install.py
+Usage: python scripts/verify_github_install.py [--format jsonl|sarif]
+       --format writes findings to stdout as JSON Lines or SARIF (see schemas/diagnostics.py).
 Exit: 0 if OK, 1 if layout/frontmatter invalid.
 """
 
 import re
 import sys
 from pathlib import Path
+from typing import Iterator
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SKILLS_DIR = REPO_ROOT / "skills"
+SCHEMAS_DIR = REPO_ROOT / "schemas"
 
-# Cursor: "Lowercase letters, numbers, and hyphens only"
-NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$")
+# Allow importing the shared parser in schemas/ when run as script
+if str(SCHEMAS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCHEMAS_DIR))
 
+from diagnostics import Diagnostic, open_emitter, parse_format
+from skill_parser import read_frontmatter
 
-def _parse_frontmatter(text: str) -> tuple[str, dict]:
-    """Return (body_after_frontmatter, frontmatter_dict). Frontmatter must be first."""
-    text = text.strip()
-    if not text.startswith("---"):
-        return text, {}
-    parts = text.split("---", 2)
-    if len(parts) < 3:
-        return text, {}
-    fm = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, _, value = line.partition(":")
-            fm[key.strip().lower()] = value.strip()
-    return parts[2].lstrip("\n"), fm
-
+# Cursor: "Lowercase letters, numbers, and hyphens only"
+NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$")
 
-def main() -> int:
-    errors: list[str] = []
 
+def layout_errors() -> Iterator[tuple[str | None, str]]:
+    """Yield (file or None, message) for each layout/frontmatter problem, as found."""
     if not SKILLS_DIR.is_dir():
-        errors.append(f"Missing top-level directory: skills/")
-        for e in errors:
-            print(e, file=sys.stderr)
-        return 1
+        yield None, "Missing top-level directory: skills/"
+        return
 
     # Only consider skill subdirectories (each must contain SKILL.md)
     skill_dirs = sorted(d for d in SKILLS_DIR.iterdir() if d.is_dir())
     if not skill_dirs:
-        errors.append("skills/ has no subdirectories (no skills found)")
+        yield None, "skills/ has no subdirectories (no skills found)"
 
     for skill_dir in skill_dirs:
         name_dir = skill_dir.name
         skill_md = skill_dir / "SKILL.md"
+        where = f"skills/{name_dir}/SKILL.md"
         if not skill_md.is_file():
-            errors.append(f"skills/{name_dir}/: missing SKILL.md")
+            yield f"skills/{name_dir}/", "missing SKILL.md"
             continue
-        raw = skill_md.read_text(encoding="utf-8")
-        _, fm = _parse_frontmatter(raw)
+        # Reads only up to the closing "---"; the body is never loaded
+        fm = read_frontmatter(skill_md)
         name_fm = fm.get("name")
         desc = fm.get("description")
         if not name_fm:
-            errors.append(f"skills/{name_dir}/SKILL.md: frontmatter missing 'name'")
+            yield where, "frontmatter missing 'name'"
         elif not isinstance(name_fm, str):
-            errors.append(f"skills/{name_dir}/SKILL.md: frontmatter 'name' must be a string")
+            yield where, "frontmatter 'name' must be a string"
         elif name_fm != name_dir:
-            errors.append(f"skills/{name_dir}/SKILL.md: frontmatter name '{name_fm}' must match folder name '{name_dir}'")
+            yield where, f"frontmatter name '{name_fm}' must match folder name '{name_dir}'"
         elif not NAME_PATTERN.match(name_fm):
-            errors.append(f"skills/{name_dir}/SKILL.md: name must be lowercase letters, numbers, hyphens only")
+            yield where, "name must be lowercase letters, numbers, hyphens only"
         if desc is None:
-            errors.append(f"skills/{name_dir}/SKILL.md: frontmatter missing 'description'")
+            yield where, "frontmatter missing 'description'"
         elif not isinstance(desc, str) or not desc.strip():
-            errors.append(f"skills/{name_dir}/SKILL.md: frontmatter 'description' must be a non-empty string")
+            yield where, "frontmatter 'description' must be a non-empty string"
 
+
+def main() -> int:
+    fmt, _ = parse_format(sys.argv[1:])
+    if fmt:
+        emitter = open_emitter(fmt, "verify_github_install")
+        for where, message in layout_errors():
+            emitter.emit(Diagnostic(where or "skills/", "install-layout", message))
+        emitter.close()
+        return 1 if emitter.count else 0
+
+    errors = [f"{where}: {message}" if where else message for where, message in layout_errors()]
+    if errors and not SKILLS_DIR.is_dir():
+        for e in errors:
+            print(e, file=sys.stderr)
+        return 1
     if errors:
         print("GitHub install verification failed:", file=sys.stderr)
         for e in errors:
             print(f"  {e}", file=sys.stderr)
         return 1
-    print(f"OK: repo ready for Cursor/Claude/Codex ({len(skill_dirs)} skills).")
+    n = sum(1 for d in SKILLS_DIR.iterdir() if d.is_dir())
+    print(f"OK: repo ready for Cursor/Claude/Codex ({n} skills).")
     return 0
 
 